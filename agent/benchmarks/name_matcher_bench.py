@@ -0,0 +1,136 @@
+"""Accuracy and latency benchmark for the fuzzy broker name index.
+
+Run from the agent directory:
+
+    python -m benchmarks.name_matcher_bench --people 50000 --queries 2000
+"""
+import argparse
+import random
+import statistics
+import string
+import time
+
+from intellj_agent.subagents.name_matcher import NICKNAMES, NameIndex
+
+
+FIRST_NAMES = [
+    "james", "john", "jonathan", "robert", "michael", "william", "david", "richard",
+    "joseph", "thomas", "christopher", "daniel", "matthew", "anthony", "steven",
+    "andrew", "nicholas", "benjamin", "samuel", "patrick", "edward", "alexander",
+    "mary", "patricia", "jennifer", "elizabeth", "susan", "katherine", "samantha",
+    "christine", "alexandra", "laura", "emily", "olivia", "sophia", "rachel",
+    "adam", "brian", "kevin", "jason", "eric", "ryan", "jacob", "gary", "scott",
+]
+LAST_NAMES = [
+    "smith", "johnson", "williams", "brown", "jones", "garcia", "miller", "davis",
+    "rodriguez", "martinez", "hernandez", "lopez", "gonzalez", "wilson", "anderson",
+    "thomas", "taylor", "moore", "jackson", "martin", "lee", "perez", "thompson",
+    "white", "harris", "sanchez", "clark", "ramirez", "lewis", "robinson", "walker",
+    "young", "allen", "king", "wright", "scott", "torres", "nguyen", "hill", "flores",
+    "green", "adams", "nelson", "baker", "hall", "rivera", "campbell", "mitchell",
+    "carter", "roberts", "goldberg", "weinstein", "kowalski", "oconnor", "fitzgerald",
+]
+ORGANIZATIONS = ["CBRE", "JLL", "Cushman & Wakefield", "Newmark", "Colliers",
+                 "Marcus & Millichap", "Eastdil Secured", "Walker & Dunlop", "Avison Young"]
+SUFFIXES = ["Jr.", "Sr.", "III", "CCIM", "SIOR"]
+FORMAL_TO_NICK = {}
+for nick, formals in NICKNAMES.items():
+    for formal in formals:
+        FORMAL_TO_NICK.setdefault(formal, []).append(nick)
+
+
+def synthetic_people(count: int, rng: random.Random):
+    """Unique synthetic broker names with occasional middle initials and suffixes"""
+    seen = set()
+    people = []
+    while len(people) < count:
+        first = rng.choice(FIRST_NAMES)
+        last = rng.choice(LAST_NAMES)
+        # Random surname stems keep the name space large enough for big runs
+        if rng.random() < 0.8:
+            last += "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 4)))
+        parts = [first.title()]
+        if rng.random() < 0.3:
+            parts.append(rng.choice(string.ascii_uppercase) + ".")
+        parts.append(last.title())
+        if rng.random() < 0.1:
+            parts.append(rng.choice(SUFFIXES))
+        name = " ".join(parts)
+        if name in seen:
+            continue
+        seen.add(name)
+        url = "/people/" + "-".join(p.lower().strip(".") for p in parts) + f"-{len(people)}"
+        people.append((url, name, [rng.choice(ORGANIZATIONS)]))
+    return people
+
+
+def typo(token: str, rng: random.Random) -> str:
+    if len(token) < 4:
+        return token
+    i = rng.randrange(1, len(token) - 1)
+    op = rng.choice(["swap", "drop", "replace"])
+    if op == "swap":
+        return token[:i] + token[i + 1] + token[i] + token[i + 2:]
+    if op == "drop":
+        return token[:i] + token[i + 1:]
+    return token[:i] + rng.choice(string.ascii_lowercase) + token[i + 1:]
+
+
+def perturb(name: str, rng: random.Random) -> str:
+    """Simulate LLM-normalized spellings of a stored name"""
+    tokens = [t for t in name.split() if t not in SUFFIXES]
+    first, last = tokens[0], tokens[-1]
+    variant = rng.choice(["nickname", "suffix", "typo", "drop_middle", "case"])
+    if variant == "nickname" and first.lower() in FORMAL_TO_NICK:
+        first = rng.choice(FORMAL_TO_NICK[first.lower()]).title()
+    elif variant == "suffix":
+        return f"{first} {last} {rng.choice(SUFFIXES)}"
+    elif variant == "typo":
+        last = typo(last, rng)
+    elif variant == "case":
+        return name.upper()
+    return f"{first} {last}"
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--people", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    people = synthetic_people(args.people, rng)
+
+    started = time.perf_counter()
+    index = NameIndex(people)
+    build_seconds = time.perf_counter() - started
+
+    top1 = top5 = 0
+    latencies = []
+    for url, name, orgs in rng.sample(people, min(args.queries, len(people))):
+        query = perturb(name, rng)
+        started = time.perf_counter()
+        candidates = index.search(query, organization=orgs[0], limit=5)
+        latencies.append((time.perf_counter() - started) * 1000)
+        urls = [c.url for c in candidates]
+        top1 += bool(urls) and urls[0] == url
+        top5 += url in urls
+
+    total = len(latencies)
+    print(f"people indexed:  {len(index)} (built in {build_seconds:.2f}s)")
+    print(f"queries:         {total}")
+    print(f"top-1 accuracy:  {top1 / total:.3f}")
+    print(f"top-5 accuracy:  {top5 / total:.3f}")
+    print(f"latency p50:     {statistics.median(latencies):.2f} ms")
+    print(f"latency p95:     {percentile(latencies, 95):.2f} ms")
+    print(f"latency p99:     {percentile(latencies, 99):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
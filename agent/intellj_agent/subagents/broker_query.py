@@ -6,6 +6,7 @@ from google.genai import types
 from neo4j import GraphDatabase
 
 from .internet_search import search_agent
+from .name_matcher import get_name_index
 from google.adk.tools import agent_tool
 
 
@@ -14,6 +15,9 @@ NEO4J_URI = os.getenv("NEO4J_URI", "bolt://localhost:7687")
 NEO4J_USER = os.getenv("NEO4J_USERNAME", "neo4j")
 NEO4J_PASS = os.getenv("NEO4J_PASSWORD", "")
 MODEL = os.getenv("MODEL", "gemini-2.5-flash")
+FUZZY_MATCH_THRESHOLD = float(os.getenv("FUZZY_MATCH_THRESHOLD", "0.85"))
+# Fuzzy matches whose runner-up scores within this margin are reported as ambiguous
+FUZZY_MATCH_MARGIN = float(os.getenv("FUZZY_MATCH_MARGIN", "0.03"))
 
 driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASS))
 
@@ -50,12 +54,38 @@ async def get_person_details_from_neo4j(person_details: Dict) -> Dict:
                              organization=person_details.get('organization', ""))
         record = result.single()
 
-        if not record:
+        if record:
+            # convert Node properties to dict
+            return {"broker": dict(record["p"]), "match": {"method": "exact", "score": 1.0}}
+
+    # Fall back to fuzzy name matching before giving up on the database
+    if not person_details.get("name"):
+        return None
+    best, candidates = get_name_index(driver).resolve(
+        person_details["name"],
+        organization=person_details.get("organization"),
+        min_score=FUZZY_MATCH_THRESHOLD,
+        margin=FUZZY_MATCH_MARGIN
+    )
+    if best is None:
+        if not candidates:
             return None
+        return {"broker": {}, "match": {
+            "method": "ambiguous",
+            "candidates": [
+                {"name": c.name, "url": c.url, "score": c.score, "organizations": c.organizations}
+                for c in candidates
+            ]
+        }}
 
-        person_node = record["p"]
-        # convert Node properties to dict
-        return {"broker": dict(person_node)}
+    with driver.session() as session:
+        record = session.run("MATCH (p:Person {url: $url}) RETURN p", url=best.url).single()
+    if not record:
+        return None
+    return {
+        "broker": dict(record["p"]),
+        "match": {"method": "fuzzy", "score": best.score, "matched_name": best.name}
+    }
 
 
 def fetch_broker_deals(broker_url: str):
@@ -105,18 +135,56 @@ def fetch_broker_organizations(broker_url: str) -> Dict:
 
 
 def fetch_broker_locations(broker_url: str) -> Dict:
+    """
+    Returns the addresses of the broker's deal properties, with coordinates where ingest geocoded them.
+    A precision of "city" means the coordinates are the city's centre, not the building's.
+    """
     query = """
     MATCH (p:Person {url: $broker_url})-[:PARTICIPATED_IN]->(d:Deal)-[:INVOLVES]->(prop:Property)
     WHERE prop.address IS NOT NULL
-    RETURN DISTINCT prop.address AS location
+    RETURN DISTINCT prop.address AS location,
+           prop.location.latitude AS latitude, prop.location.longitude AS longitude,
+           prop.location_precision AS precision
     LIMIT 10
     """
     with driver.session() as session:
         result = session.run(query, broker_url=broker_url)
-        locations = [record["location"] for record in result]
+        locations = []
+        for record in result:
+            locations.append({
+                "address": record["location"],
+                "latitude": record["latitude"],
+                "longitude": record["longitude"],
+                "precision": record["precision"]
+            })
     return locations
 
 
+def fetch_broker_partners(broker_url: str) -> Dict:
+    """
+    Returns the broker's most frequent deal partners from the precomputed co-participation counts
+    """
+    query = """
+    MATCH (p:Person {url: $broker_url})-[c:CO_PARTICIPATED]-(partner)
+    RETURN partner.name AS name, partner.url AS url,
+           CASE WHEN partner:Person THEN 'Person' ELSE 'Organization' END AS type,
+           c.deals AS shared_deals
+    ORDER BY shared_deals DESC
+    LIMIT 10
+    """
+    with driver.session() as session:
+        result = session.run(query, broker_url=broker_url)
+        partners = []
+        for record in result:
+            partners.append({
+                "name": record["name"],
+                "url": record["url"],
+                "type": record["type"],
+                "shared_deals": record["shared_deals"]
+            })
+    return partners
+
+
 async def fetch_broker_details(person_details: Dict) -> Dict:
     """
     Fethches details of deals: personal details, organizations details, deals details with their locations
@@ -129,6 +197,11 @@ async def fetch_broker_details(person_details: Dict) -> Dict:
         return {"message": "No broker found in database with provided details."}
 
     print("Broker match result from Neo4j:", broker_match)
+    if broker_match["match"]["method"] == "ambiguous":
+        return {
+            "message": "Several brokers match the provided name equally well; none was picked.",
+            "match": broker_match["match"]
+        }
     broker_url = broker_match.get("broker", {}).get("url")
     if not broker_url:
         return {"message": "No broker found in database with provided details."}
@@ -136,11 +209,14 @@ async def fetch_broker_details(person_details: Dict) -> Dict:
     boker_deals = fetch_broker_deals(broker_url)
     broker_organizations = fetch_broker_organizations(broker_url)
     broker_locations = fetch_broker_locations(broker_url)
+    broker_partners = fetch_broker_partners(broker_url)
     return {
         "person": broker_match.get("broker", {}),
+        "match": broker_match.get("match"),
         "deals": boker_deals,
         "organizations": broker_organizations,
-        "locations": broker_locations
+        "locations": broker_locations,
+        "partners": broker_partners
     }
 
 broker_query_agent = Agent(
@@ -156,11 +232,14 @@ broker_query_agent = Agent(
     2. **ALWAYS** call `fetch_broker_details` first with the broker details[name, email, organization] to fetch basic properties of the Person node.
         example input: {"name": "John Doe", "email": "john.doe@example.com", "organization": "Rent Busy"}
         Both email and name may not be always available, but use all the available information to find the broker. If email is available, it should be used as primary identifier to find the broker. If email is not available, use name and organization together to find the broker. If only name is available, use name to find the broker.
-    3. If broker details are not found in daatbase, use only search_agent to find the required details of broker from internet, do not use other tools.
-    4. Do NOT add, modify or hallucinate data. Only use data returned by the tools.
-    5. Present the information in a clear and concise manner, using bullet points or headings if necessary for readability.
-    6. Do not ask for more information from the user, if the information provided is not sufficient to find the broker, return a message stating that no broker was found with the provided details.
-    7. **Follow this format strictly when broker information is found:**
+    3. If the result's `match.method` is `fuzzy`, the stored name differs from the requested one; mention the matched name in the profile.
+       If `match.method` is `ambiguous`, no broker was picked: list the `candidates` (name, organizations, profile link) and say the name matches several brokers instead of building a profile.
+       If broker details are not found in daatbase, use only search_agent to find the required details of broker from internet, do not use other tools.
+    4. Build "Most Frequent Deal Partners" from the `partners` list (ordered by shared deal count), not from the sample of deals.
+    5. Do NOT add, modify or hallucinate data. Only use data returned by the tools.
+    6. Present the information in a clear and concise manner, using bullet points or headings if necessary for readability.
+    7. Do not ask for more information from the user, if the information provided is not sufficient to find the broker, return a message stating that no broker was found with the provided details.
+    8. **Follow this format strictly when broker information is found:**
     ```
     ## Broker Profile: **John Doe** 
     **Title:** President and CEO at Rent Busy
@@ -0,0 +1,345 @@
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+NAME_INDEX_MAX_AGE = float(os.getenv("NAME_INDEX_MAX_AGE", "900"))
+# How often the ingest graph version is re-read to notice a stale index
+NAME_INDEX_CHECK_SECONDS = float(os.getenv("NAME_INDEX_CHECK_SECONDS", "30"))
+MAX_CANDIDATES = 400
+RERANK_POOL = 50
+
+# Post-nominal and generational suffixes that never identify a broker
+SUFFIXES = {
+    "jr", "sr", "ii", "iii", "iv", "phd", "md", "esq", "cpa", "cfa",
+    "ccim", "sior", "mai", "mba", "jd",
+}
+
+# Common short forms -> formal given names
+NICKNAMES = {
+    "al": {"albert", "alan", "alexander"},
+    "alex": {"alexander", "alexandra"},
+    "andy": {"andrew"},
+    "ben": {"benjamin"},
+    "bill": {"william"},
+    "billy": {"william"},
+    "bob": {"robert"},
+    "bobby": {"robert"},
+    "chris": {"christopher", "christine", "christina"},
+    "dan": {"daniel"},
+    "danny": {"daniel"},
+    "dave": {"david"},
+    "ed": {"edward"},
+    "jim": {"james"},
+    "jimmy": {"james"},
+    "joe": {"joseph"},
+    "jon": {"jonathan", "john"},
+    "johnny": {"john", "jonathan"},
+    "kate": {"katherine", "kathryn"},
+    "kathy": {"katherine", "kathryn"},
+    "liz": {"elizabeth"},
+    "beth": {"elizabeth"},
+    "matt": {"matthew"},
+    "mike": {"michael"},
+    "nick": {"nicholas"},
+    "pat": {"patrick", "patricia"},
+    "rich": {"richard"},
+    "rick": {"richard"},
+    "rob": {"robert"},
+    "sam": {"samuel", "samantha"},
+    "steve": {"steven", "stephen"},
+    "sue": {"susan"},
+    "tom": {"thomas"},
+    "tony": {"anthony"},
+    "will": {"william"},
+}
+
+
+def normalize_tokens(name: str) -> List[str]:
+    """Lowercase, strip accents/punctuation and drop suffixes from a name"""
+    if not name:
+        return []
+    text = unicodedata.normalize("NFKD", name)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).lower()
+    text = re.sub(r"[^a-z\s'-]", " ", text).replace("'", "").replace("-", " ")
+    return [tok for tok in text.split() if tok not in SUFFIXES]
+
+
+def given_name_forms(token: str) -> Set[str]:
+    """All formal spellings a (possibly short) given name can stand for"""
+    return {token} | NICKNAMES.get(token, set())
+
+
+def trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def jaro_winkler(a: str, b: str, prefix_scale: float = 0.1) -> float:
+    """Jaro-Winkler similarity in [0, 1]"""
+    if a == b:
+        return 1.0
+    len_a, len_b = len(a), len(b)
+    if not len_a or not len_b:
+        return 0.0
+
+    window = max(max(len_a, len_b) // 2 - 1, 0)
+    a_matched = [False] * len_a
+    b_matched = [False] * len_b
+    matches = 0
+    for i, ch in enumerate(a):
+        lo, hi = max(0, i - window), min(i + window + 1, len_b)
+        for j in range(lo, hi):
+            if not b_matched[j] and b[j] == ch:
+                a_matched[i] = b_matched[j] = True
+                matches += 1
+                break
+    if not matches:
+        return 0.0
+
+    transpositions = 0
+    j = 0
+    for i in range(len_a):
+        if a_matched[i]:
+            while not b_matched[j]:
+                j += 1
+            if a[i] != b[j]:
+                transpositions += 1
+            j += 1
+    jaro = (matches / len_a + matches / len_b + (matches - transpositions / 2) / matches) / 3
+
+    prefix = 0
+    for ca, cb in zip(a[:4], b[:4]):
+        if ca != cb:
+            break
+        prefix += 1
+    return jaro + prefix * prefix_scale * (1 - jaro)
+
+
+def token_similarity(query_token: str, candidate_token: str) -> float:
+    if query_token == candidate_token:
+        return 1.0
+    # Initials ("J." vs "John")
+    if len(query_token) == 1 or len(candidate_token) == 1:
+        return 0.85 if query_token[0] == candidate_token[0] else 0.0
+    if given_name_forms(query_token) & given_name_forms(candidate_token):
+        return 0.95
+    return jaro_winkler(query_token, candidate_token)
+
+
+def blocking_keys(tokens: Iterable[str]) -> Set[str]:
+    """Prefix/suffix keys used to pick candidates without scanning every name"""
+    keys = set()
+    for token in tokens:
+        if len(token) < 2:
+            continue
+        for form in given_name_forms(token):
+            keys.add("p:" + form[:3])
+        keys.add("s:" + token[-3:])
+    return keys
+
+
+@dataclass
+class NameCandidate:
+    url: str
+    name: str
+    score: float
+    organizations: List[str] = field(default_factory=list)
+
+
+@dataclass
+class _Entry:
+    url: str
+    name: str
+    tokens: List[str]
+    grams: Set[str]
+    organizations: List[str]
+
+
+class NameIndex:
+    """In-memory fuzzy index over Person names using token blocking and Jaro-Winkler/trigram scoring"""
+
+    def __init__(self, people: Iterable[Tuple[str, str, List[str]]]):
+        self._entries: List[_Entry] = []
+        self._blocks: Dict[str, List[int]] = defaultdict(list)
+        for url, name, organizations in people:
+            tokens = normalize_tokens(name)
+            if not url or not tokens:
+                continue
+            entry_id = len(self._entries)
+            self._entries.append(_Entry(
+                url=url,
+                name=name,
+                tokens=tokens,
+                grams=trigrams(" ".join(tokens)),
+                organizations=[org for org in organizations or [] if org]
+            ))
+            for key in blocking_keys(tokens):
+                self._blocks[key].append(entry_id)
+        self.built_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @classmethod
+    def from_neo4j(cls, driver) -> "NameIndex":
+        """Build the index from every Person node and its organizations"""
+        query = """
+        MATCH (p:Person)
+        WHERE p.name IS NOT NULL AND p.url IS NOT NULL
+        OPTIONAL MATCH (p)-[:WORKS_FOR]->(org:Organization)
+        RETURN p.url AS url, p.name AS name, collect(org.name) AS organizations
+        """
+        with driver.session() as session:
+            result = session.run(query)
+            return cls((r["url"], r["name"], r["organizations"]) for r in result)
+
+    def _candidate_ids(self, tokens: List[str]) -> List[int]:
+        hits = Counter()
+        for key in blocking_keys(tokens):
+            hits.update(self._blocks.get(key, ()))
+        if len(hits) <= MAX_CANDIDATES:
+            return list(hits)
+        # Keep the entries sharing the most keys with the query
+        return [entry_id for entry_id, _ in hits.most_common(MAX_CANDIDATES)]
+
+    @staticmethod
+    def _score(tokens: List[str], entry: _Entry) -> float:
+        forward = sum(max(token_similarity(q, c) for c in entry.tokens) for q in tokens) / len(tokens)
+        backward = sum(max(token_similarity(q, c) for q in tokens) for c in entry.tokens) / len(entry.tokens)
+        return 0.6 * forward + 0.4 * backward
+
+    def _ranked(self, name: str, organization: Optional[str], min_score: float) -> List[Tuple[float, _Entry]]:
+        """(rank, entry) best first; rank may exceed 1 when an organization match breaks a tie"""
+        tokens = normalize_tokens(name)
+        if not tokens:
+            return []
+        grams = trigrams(" ".join(tokens))
+        org_grams = trigrams(organization.lower()) if organization else None
+
+        # Cheap trigram overlap picks the pool that gets the per-token Jaro-Winkler pass
+        pool = []
+        for entry_id in self._candidate_ids(tokens):
+            entry = self._entries[entry_id]
+            pool.append((len(grams & entry.grams) / len(grams | entry.grams), entry))
+        pool.sort(key=lambda item: item[0], reverse=True)
+
+        scored = []
+        for gram_score, entry in pool[:RERANK_POOL]:
+            score = 0.75 * self._score(tokens, entry) + 0.25 * gram_score
+            if org_grams and entry.organizations:
+                org_score = max(
+                    len(org_grams & trigrams(org.lower())) / len(org_grams | trigrams(org.lower()))
+                    for org in entry.organizations
+                )
+                if org_score >= 0.5:
+                    score += 0.1 * org_score
+            if score >= min_score:
+                scored.append((score, entry))
+
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return scored
+
+    @staticmethod
+    def _candidate(rank: float, entry: _Entry) -> NameCandidate:
+        return NameCandidate(url=entry.url, name=entry.name, score=round(min(1.0, rank), 4),
+                             organizations=entry.organizations)
+
+    def search(self, name: str, organization: Optional[str] = None,
+               limit: int = 5, min_score: float = 0.0) -> List[NameCandidate]:
+        """Return up to `limit` people ranked by similarity to `name`"""
+        return [self._candidate(rank, entry) for rank, entry in self._ranked(name, organization, min_score)[:limit]]
+
+    def resolve(self, name: str, organization: Optional[str] = None, min_score: float = 0.85,
+                margin: float = 0.03, limit: int = 5) -> Tuple[Optional[NameCandidate], List[NameCandidate]]:
+        """
+        (match, candidates): the single person `name` refers to, or None with
+        the candidates above `min_score` when the best two are within `margin`
+        of each other and picking one would be a guess
+        """
+        ranked = self._ranked(name, organization, min_score)[:limit]
+        candidates = [self._candidate(rank, entry) for rank, entry in ranked]
+        if not candidates:
+            return None, []
+        if len(ranked) > 1 and ranked[0][0] - ranked[1][0] < margin:
+            return None, candidates
+        return candidates[0], candidates
+
+
+_index: Optional[NameIndex] = None
+_index_version: Optional[int] = None
+_checked_at = 0.0
+_index_lock = threading.Lock()
+_build_lock = threading.Lock()
+
+
+def _graph_version(driver) -> Optional[int]:
+    """The version data_tools bumps after every ingest and dedup run; None before the first"""
+    with driver.session() as session:
+        record = session.run("MATCH (m:GraphMeta {key: 'graph'}) RETURN m.version AS version").single()
+        return record["version"] if record else None
+
+
+def refresh_name_index(driver) -> NameIndex:
+    """Rebuild the shared index from Neo4j; concurrent callers wait for one build"""
+    global _index, _index_version, _checked_at
+    with _build_lock:
+        version = _graph_version(driver)
+        index = NameIndex.from_neo4j(driver)
+        with _index_lock:
+            _index, _index_version, _checked_at = index, version, time.monotonic()
+        return index
+
+
+def _refresh_in_background(driver):
+    def build():
+        try:
+            refresh_name_index(driver)
+        except Exception as e:
+            print(f"Name index rebuild failed: {e}")
+    # Skip if a build is already running; it will pick up the same graph
+    if not _build_lock.locked():
+        threading.Thread(target=build, name="name-index", daemon=True).start()
+
+
+def start_name_index(driver):
+    """
+    Build the shared index in the background, so the first lookup does not
+    wait. For a server's startup hook; nothing calls it on import, and
+    without it the first get_name_index call builds the index.
+    """
+    _refresh_in_background(driver)
+
+
+def get_name_index(driver) -> NameIndex:
+    """
+    Shared index. Only the first call waits for a build; afterwards a stale
+    index (older than NAME_INDEX_MAX_AGE, or built before the latest ingest,
+    checked every NAME_INDEX_CHECK_SECONDS) keeps serving while a background
+    rebuild replaces it.
+    """
+    global _checked_at
+    index = _index
+    if index is None:
+        with _build_lock:
+            index = _index
+        return index if index is not None else refresh_name_index(driver)
+
+    now = time.monotonic()
+    if now - index.built_at > NAME_INDEX_MAX_AGE:
+        _refresh_in_background(driver)
+    elif now - _checked_at > NAME_INDEX_CHECK_SECONDS:
+        with _index_lock:
+            _checked_at = now
+        try:
+            stale = _graph_version(driver) != _index_version
+        except Exception:
+            stale = False
+        if stale:
+            _refresh_in_background(driver)
+    return index
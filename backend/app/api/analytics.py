@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional
+from app.services.analytics import AnalyticsService
+from app.limits import analysis_limit
+from app.api.routing import CompactRoute
+
+router = APIRouter(prefix="/api/analytics", tags=["analytics"], route_class=CompactRoute)
+
+
+@router.get("/trend", response_model=dict, dependencies=[Depends(analysis_limit)])
+def get_trend(
+    metric: str = "price_per_square_foot",
+    group: Optional[str] = None,
+    window: int = Query(3, ge=1, le=24)
+):
+    """Get monthly quartiles and a trailing median of a deal metric, optionally per deal_type or property_type"""
+    try:
+        return {"data": AnalyticsService.get_trend(metric=metric, group=group, window=window)}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/distribution", response_model=dict, dependencies=[Depends(analysis_limit)])
+def get_distribution(metric: str = "price_per_square_foot", by: str = "deal_type"):
+    """Get the percentiles of a deal metric for each deal_type or property_type"""
+    try:
+        return {"data": AnalyticsService.get_distribution(metric=metric, by=by)}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,17 @@
+from fastapi import APIRouter, HTTPException
+from app.services.entity_service import DashboardService
+from app.api.routing import CompactRoute
+
+router = APIRouter(prefix="/api/dashboard", tags=["dashboard"], route_class=CompactRoute)
+
+
+@router.get("/summary", response_model=dict)
+def get_dashboard_summary():
+    """Get recent deals and properties, top brokers and organizations, monthly deal volume and label counts"""
+    try:
+        result = DashboardService.get_summary()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    if result is None:
+        raise HTTPException(status_code=404, detail="Dashboard snapshot not found; run the data_tools ingest")
+    return {"data": result}
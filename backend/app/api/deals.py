@@ -1,41 +1,65 @@
-from fastapi import APIRouter, HTTPException, Query
-from app.services.entity_service import DealService
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional
+from app.services.entity_service import DealService, DEAL_FIELDS, DEAL_INCLUDES, parse_fieldset
 from app.models.schemas import DealDetail
+from app.limits import detail_limit
+from app.api.routing import CompactRoute
 
-router = APIRouter(prefix="/api/deals", tags=["deals"])
+router = APIRouter(prefix="/api/deals", tags=["deals"], route_class=CompactRoute)
 
 
 @router.get("", response_model=dict)
-async def get_deals(page: int = Query(1, ge=1), limit: int = Query(12, ge=1, le=100)):
+def get_deals(
+    page: int = Query(1, ge=1),
+    limit: int = Query(12, ge=1, le=100),
+    fields: Optional[str] = Query(None, description="Comma-separated deal fields to return")
+):
     """Get paginated list of deals ordered by most recent"""
     try:
-        result = DealService.get_all_deals(page=page, limit=limit)
+        result = DealService.get_all_deals(page=page, limit=limit, fields=parse_fieldset(fields, DEAL_FIELDS))
         return result
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/recent", response_model=dict)
-async def get_recent_deals(limit: int = Query(20, ge=1, le=100)):
+def get_recent_deals(
+    limit: int = Query(20, ge=1, le=100),
+    fields: Optional[str] = Query(None, description="Comma-separated deal fields to return")
+):
     """Get recent deals"""
     try:
-        result = DealService.get_recent_deals(limit=limit)
+        result = DealService.get_recent_deals(limit=limit, fields=parse_fieldset(fields, DEAL_FIELDS))
         return {"data": result}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/{deal_url:path}", response_model=dict)
-async def get_deal_detail(deal_url: str):
+@router.get("/{deal_url:path}", response_model=dict, dependencies=[Depends(detail_limit)])
+def get_deal_detail(
+    deal_url: str,
+    fields: Optional[str] = Query(None, description="Comma-separated deal fields to return"),
+    include: Optional[str] = Query(None, description="Comma-separated sub-collections: participants, properties, stories")
+):
     """Get detailed information about a deal by URL"""
     try:
         # Ensure leading slash to match database URL format (e.g. /activity/...)
         full_url = deal_url if deal_url.startswith('/') else f"/{deal_url}"
-        deal = DealService.get_deal_detail(full_url)
+        deal = DealService.get_deal_detail(
+            full_url,
+            fields=parse_fieldset(fields, DEAL_FIELDS),
+            include=parse_fieldset(include, DEAL_INCLUDES)
+        )
         if not deal:
             raise HTTPException(status_code=404, detail="Deal not found")
         return {"data": deal}
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
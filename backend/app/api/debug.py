@@ -1,20 +1,17 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 from app.database import db
+from app.metrics import metrics
+from app.services import queries
 
 router = APIRouter(prefix="/api/debug", tags=["debug"])
 
 
 @router.get("/deal-properties")
-async def get_deal_properties():
+def get_deal_properties():
     """Debug endpoint to see what properties are available on Deal nodes"""
     session = db.get_session()
     try:
-        result = session.run("""
-            MATCH (d:Deal)
-            WITH d, keys(d) as props
-            RETURN props, d
-            LIMIT 5
-        """)
+        result = session.run(queries.DEBUG_DEAL_PROPERTIES)
         
         samples = []
         for record in result:
@@ -27,3 +24,9 @@ async def get_deal_properties():
         return {"samples": samples}
     finally:
         session.close()
+
+
+@router.get("/slow-queries")
+async def get_slow_queries(limit: int = Query(50, ge=1, le=500)):
+    """Recent slow Cypher executions and the query fingerprints with the most total time"""
+    return metrics.slow_queries(limit=limit)
@@ -0,0 +1,163 @@
+import csv
+import io
+import json
+from typing import Iterator, List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from app.services.entity_service import ExportService
+from app.limits import export_limit
+
+router = APIRouter(prefix="/api/export", tags=["export"])
+
+# Rows buffered into each streamed chunk (and each Parquet row group)
+CHUNK_ROWS = 1000
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def _cell(value) -> str:
+    """Flatten a property value into a CSV/Parquet string cell"""
+    if value is None:
+        return ""
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, default=str)
+    return str(value)
+
+
+def _ndjson_chunks(rows: Iterator[tuple], include_relationships: bool) -> Iterator[str]:
+    lines = []
+    for node_id, props, relationships in rows:
+        record = {"_id": node_id, **props}
+        if include_relationships:
+            record["relationships"] = relationships
+        lines.append(json.dumps(record, default=str))
+        if len(lines) >= CHUNK_ROWS:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def _csv_chunks(rows: Iterator[tuple], columns: List[str], include_relationships: bool) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    header = ["_id", *columns]
+    if include_relationships:
+        header.append("relationships")
+    writer.writerow(header)
+
+    count = 0
+    for node_id, props, relationships in rows:
+        row = [node_id, *(_cell(props.get(column)) for column in columns)]
+        if include_relationships:
+            row.append(_cell(relationships))
+        writer.writerow(row)
+        count += 1
+        if count % CHUNK_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+class _ChunkSink:
+    """Write-only file object that hands written bytes back to the response between row groups"""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _parquet_chunks(rows: Iterator[tuple], columns: List[str], include_relationships: bool) -> Iterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    names = ["_id", *columns] + (["relationships"] if include_relationships else [])
+    schema = pa.schema([("_id", pa.int64())] + [(name, pa.string()) for name in names[1:]])
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+
+    def write_batch(batch):
+        arrays = [pa.array([row[i] for row in batch], type=field.type) for i, field in enumerate(schema)]
+        writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+
+    batch = []
+    for node_id, props, relationships in rows:
+        row = [node_id, *(_cell(props.get(column)) if column in props else None for column in columns)]
+        if include_relationships:
+            row.append(_cell(relationships))
+        batch.append(row)
+        if len(batch) >= CHUNK_ROWS:
+            write_batch(batch)
+            batch = []
+            yield sink.drain()
+    if batch:
+        write_batch(batch)
+    writer.close()
+    yield sink.drain()
+
+
+@router.get("/{label}", dependencies=[Depends(export_limit)])
+def export_nodes(
+    label: str,
+    format: str = Query("ndjson", pattern="^(ndjson|csv|parquet)$"),
+    relationships: bool = False
+):
+    """Stream every node with the given label as NDJSON, CSV or Parquet"""
+    node_label = ExportService.resolve_label(label)
+    if not node_label:
+        raise HTTPException(status_code=404, detail=f"Unknown label: {label}")
+
+    if format == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise HTTPException(
+                status_code=501,
+                detail="Parquet export requires the optional 'pyarrow' dependency"
+            )
+
+    try:
+        columns = ExportService.get_property_keys(node_label) if format != "ndjson" else []
+        rows = ExportService.stream_nodes(node_label, include_relationships=relationships)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if format == "ndjson":
+        chunks = _ndjson_chunks(rows, relationships)
+    elif format == "csv":
+        chunks = _csv_chunks(rows, columns, relationships)
+    else:
+        chunks = _parquet_chunks(rows, columns, relationships)
+
+    filename = f"{node_label.lower()}.{format}"
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
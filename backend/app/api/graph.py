@@ -0,0 +1,26 @@
+import json
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from app.services.entity_service import GraphService
+from app.limits import analysis_limit
+
+router = APIRouter(prefix="/api/graph", tags=["graph"])
+
+
+@router.get("/neighborhood", dependencies=[Depends(analysis_limit)])
+def get_neighborhood(
+    url: str = Query(..., min_length=1),
+    depth: int = Query(2, ge=1, le=4),
+    limit: int = Query(200, ge=1, le=5000),
+    fanout: int = Query(25, ge=1, le=500)
+):
+    """Stream the nodes and edges within `depth` hops of a node as NDJSON"""
+    try:
+        records = GraphService.get_neighborhood(url, depth=depth, limit=limit, fanout=fanout)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    if records is None:
+        raise HTTPException(status_code=404, detail="Node not found")
+    
+    lines = (json.dumps(record, default=str) + "\n" for record in records)
+    return StreamingResponse(lines, media_type="application/x-ndjson")
@@ -0,0 +1,58 @@
+import secrets
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from typing import Optional
+from app.config import settings
+from app.models.schemas import JobRequest
+from app.services.jobs import TASKS, jobs
+from app.api.routing import CompactRoute
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """Jobs rewrite the graph, so they are hidden until JOBS_ADMIN_TOKEN is set and then require it"""
+    if not settings.JOBS_ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, settings.JOBS_ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid or missing X-Admin-Token")
+
+
+router = APIRouter(prefix="/api/jobs", tags=["jobs"], route_class=CompactRoute,
+                   dependencies=[Depends(require_admin)])
+
+
+@router.get("/tasks", response_model=dict)
+async def get_tasks():
+    """List the maintenance tasks a job can run and their parameters"""
+    return {"data": [
+        {"task": task, "description": description, "params": {name: kind.__name__ for name, kind in params.items()}}
+        for task, (_, description, params) in TASKS.items()
+    ]}
+
+
+@router.post("", response_model=dict, status_code=202)
+async def submit_job(request: JobRequest, response: Response):
+    """Queue a maintenance job; an identical job that is still queued or running is returned instead"""
+    try:
+        job, created = jobs.submit(request.task, request.params)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not created:
+        response.status_code = 200
+    return {"data": job.status()}
+
+
+@router.get("", response_model=dict)
+async def list_jobs(
+    state: Optional[str] = Query(None, description="queued, running, succeeded or failed"),
+    limit: int = Query(50, ge=1, le=500)
+):
+    """List recent jobs, newest first"""
+    return {"data": [job.status() for job in jobs.recent(state=state, limit=limit)]}
+
+
+@router.get("/{job_id}", response_model=dict)
+async def get_job(job_id: str):
+    """Get a job's state, progress and result"""
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return {"data": job.status()}
@@ -1,12 +1,15 @@
-from fastapi import APIRouter, HTTPException, Query
-from app.services.entity_service import OrganizationService
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional
+from app.services.entity_service import OrganizationService, ORGANIZATION_INCLUDES, parse_fieldset
 from app.models.schemas import OrganizationDetail
+from app.limits import detail_limit
+from app.api.routing import CompactRoute
 
-router = APIRouter(prefix="/api/organizations", tags=["organizations"])
+router = APIRouter(prefix="/api/organizations", tags=["organizations"], route_class=CompactRoute)
 
 
 @router.get("", response_model=dict)
-async def get_organizations(page: int = Query(1, ge=1), limit: int = Query(12, ge=1, le=100)):
+def get_organizations(page: int = Query(1, ge=1), limit: int = Query(12, ge=1, le=100)):
     """Get paginated list of organizations"""
     try:
         result = OrganizationService.get_all_organizations(page=page, limit=limit)
@@ -16,7 +19,7 @@ async def get_organizations(page: int = Query(1, ge=1), limit: int = Query(12, g
 
 
 @router.get("/recent", response_model=dict)
-async def get_recent_organizations(limit: int = Query(20, ge=1, le=100)):
+def get_recent_organizations(limit: int = Query(20, ge=1, le=100)):
     """Get recent organizations"""
     try:
         result = OrganizationService.get_recent_organizations(limit=limit)
@@ -25,17 +28,88 @@ async def get_recent_organizations(limit: int = Query(20, ge=1, le=100)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/{organization_url:path}", response_model=dict)
-async def get_organization_detail(organization_url: str):
+@router.get("/{organization_url:path}/members", response_model=dict, dependencies=[Depends(detail_limit)])
+def get_organization_members(
+    organization_url: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100)
+):
+    """Get a page of an organization's members"""
+    try:
+        full_url = f"/organizations/{organization_url}"
+        result = OrganizationService.get_organization_members(full_url, cursor=cursor, limit=limit)
+        if result is None:
+            raise HTTPException(status_code=404, detail="Organization not found")
+        return result
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{organization_url:path}/deals", response_model=dict, dependencies=[Depends(detail_limit)])
+def get_organization_deals(
+    organization_url: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100)
+):
+    """Get a page of an organization's deals, newest first"""
+    try:
+        full_url = f"/organizations/{organization_url}"
+        result = OrganizationService.get_organization_deals(full_url, cursor=cursor, limit=limit)
+        if result is None:
+            raise HTTPException(status_code=404, detail="Organization not found")
+        return result
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{organization_url:path}/stories", response_model=dict, dependencies=[Depends(detail_limit)])
+def get_organization_stories(
+    organization_url: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100)
+):
+    """Get a page of the stories mentioning an organization's members, newest first"""
+    try:
+        full_url = f"/organizations/{organization_url}"
+        result = OrganizationService.get_organization_stories(full_url, cursor=cursor, limit=limit)
+        if result is None:
+            raise HTTPException(status_code=404, detail="Organization not found")
+        return result
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{organization_url:path}", response_model=dict, dependencies=[Depends(detail_limit)])
+def get_organization_detail(
+    organization_url: str,
+    include: Optional[str] = Query(None, description="Comma-separated sub-collections: members, deals, stories")
+):
     """Get detailed information about an organization by URL"""
     try:
         # Prepend /organizations to match database URL format
         full_url = f"/organizations/{organization_url}"
-        organization = OrganizationService.get_organization_detail(full_url)
+        organization = OrganizationService.get_organization_detail(
+            full_url,
+            include=parse_fieldset(include, ORGANIZATION_INCLUDES)
+        )
         if not organization:
             raise HTTPException(status_code=404, detail="Organization not found")
         return {"data": organization}
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
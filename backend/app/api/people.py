@@ -1,12 +1,16 @@
-from fastapi import APIRouter, HTTPException, Query
-from app.services.entity_service import PersonService
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional
+from app.services.entity_service import PersonService, PERSON_INCLUDES, parse_fieldset
 from app.models.schemas import PersonDetail, PaginatedResponse
+from app.limits import analysis_limit, detail_limit
+from app.api.routing import CompactRoute
 
-router = APIRouter(prefix="/api/people", tags=["people"])
+router = APIRouter(prefix="/api/people", tags=["people"], route_class=CompactRoute)
 
 
 @router.get("", response_model=PaginatedResponse)
-async def get_people(page: int = Query(1, ge=1), limit: int = Query(12, ge=1, le=100)):
+def get_people(page: int = Query(1, ge=1), limit: int = Query(12, ge=1, le=100)):
     """Get paginated list of people"""
     try:
         result = PersonService.get_all_people(page=page, limit=limit)
@@ -16,7 +20,7 @@ async def get_people(page: int = Query(1, ge=1), limit: int = Query(12, ge=1, le
 
 
 @router.get("/recent", response_model=dict)
-async def get_recent_people(limit: int = Query(20, ge=1, le=100)):
+def get_recent_people(limit: int = Query(20, ge=1, le=100)):
     """Get people with most recent deals"""
     try:
         result = PersonService.get_people_with_recent_deals(limit=limit)
@@ -25,17 +29,85 @@ async def get_recent_people(limit: int = Query(20, ge=1, le=100)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/{person_url:path}", response_model=dict)
-async def get_person_detail(person_url: str):
+@router.get("/leaderboard", response_model=dict, dependencies=[Depends(analysis_limit)])
+def get_leaderboard(
+    by: str = Query("activity", pattern="^(activity|deals|volume)$"),
+    type: Optional[str] = None,
+    since: Optional[date] = None,
+    region: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100)
+):
+    """Get brokers ranked by recency-weighted activity, deal count or dollar volume"""
+    try:
+        return PersonService.get_leaderboard(
+            by=by, deal_type=type, since=since, region=region, cursor=cursor, limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{person_url:path}/partners", response_model=dict, dependencies=[Depends(detail_limit)])
+def get_person_partners(
+    person_url: str,
+    limit: int = Query(10, ge=1, le=100),
+    type: Optional[str] = Query(None, pattern="^(Person|Organization)$")
+):
+    """Get the most frequent deal partners of a person"""
+    try:
+        full_url = f"/people/{person_url}"
+        partners = PersonService.get_person_partners(full_url, limit=limit, partner_type=type)
+        if partners is None:
+            raise HTTPException(status_code=404, detail="Person not found")
+        return {"data": partners}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{person_url:path}/deals", response_model=dict, dependencies=[Depends(detail_limit)])
+def get_person_deals(
+    person_url: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100)
+):
+    """Get a page of a person's deals, newest first"""
+    try:
+        full_url = f"/people/{person_url}"
+        result = PersonService.get_person_deals(full_url, cursor=cursor, limit=limit)
+        if result is None:
+            raise HTTPException(status_code=404, detail="Person not found")
+        return result
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{person_url:path}", response_model=dict, dependencies=[Depends(detail_limit)])
+def get_person_detail(
+    person_url: str,
+    include: Optional[str] = Query(None, description="Comma-separated sub-collections: deals, organizations, stories")
+):
     """Get detailed information about a person by URL"""
     try:
         # Prepend /people to match database URL format
         full_url = f"/people/{person_url}"
-        person = PersonService.get_person_detail(full_url)
+        person = PersonService.get_person_detail(
+            full_url,
+            include=parse_fieldset(include, PERSON_INCLUDES)
+        )
         if not person:
             raise HTTPException(status_code=404, detail="Person not found")
         return {"data": person}
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
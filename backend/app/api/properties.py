@@ -1,12 +1,15 @@
-from fastapi import APIRouter, HTTPException, Query
-from app.services.entity_service import PropertyService
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional
+from app.services.entity_service import PropertyService, PROPERTY_INCLUDES, parse_fieldset
 from app.models.schemas import PropertyDetail
+from app.limits import analysis_limit, detail_limit
+from app.api.routing import CompactRoute
 
-router = APIRouter(prefix="/api/properties", tags=["properties"])
+router = APIRouter(prefix="/api/properties", tags=["properties"], route_class=CompactRoute)
 
 
 @router.get("", response_model=dict)
-async def get_properties(page: int = Query(1, ge=1), limit: int = Query(12, ge=1, le=100)):
+def get_properties(page: int = Query(1, ge=1), limit: int = Query(12, ge=1, le=100)):
     """Get paginated list of properties ordered by most recent"""
     try:
         result = PropertyService.get_all_properties(page=page, limit=limit)
@@ -16,7 +19,7 @@ async def get_properties(page: int = Query(1, ge=1), limit: int = Query(12, ge=1
 
 
 @router.get("/recent", response_model=dict)
-async def get_recent_properties(limit: int = Query(20, ge=1, le=100)):
+def get_recent_properties(limit: int = Query(20, ge=1, le=100)):
     """Get recent properties (with most recent deals)"""
     try:
         result = PropertyService.get_recent_properties(limit=limit)
@@ -25,19 +28,104 @@ async def get_recent_properties(limit: int = Query(20, ge=1, le=100)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/{property_url:path}", response_model=dict)
-async def get_property_detail(property_url: str):
+@router.get("/near", response_model=dict, dependencies=[Depends(analysis_limit)])
+def get_properties_near(
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    radius: float = Query(1000, gt=0, le=100000),
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100)
+):
+    """Get the properties within `radius` meters of a point, nearest first"""
+    try:
+        return PropertyService.get_properties_near(lat, lon, radius, cursor=cursor, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/within", response_model=dict, dependencies=[Depends(analysis_limit)])
+def get_properties_within(
+    south: float = Query(..., ge=-90, le=90),
+    west: float = Query(..., ge=-180, le=180),
+    north: float = Query(..., ge=-90, le=90),
+    east: float = Query(..., ge=-180, le=180),
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100)
+):
+    """Get the properties inside a bounding box"""
+    try:
+        return PropertyService.get_properties_in_bbox(south, west, north, east, cursor=cursor, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{property_url:path}/participants", response_model=dict, dependencies=[Depends(detail_limit)])
+def get_property_participants(
+    property_url: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100)
+):
+    """Get a page of the people and organizations involved in deals with a property"""
+    try:
+        full_url = property_url if property_url.startswith('/buildings/') else f"/buildings/{property_url.lstrip('/')}"
+        result = PropertyService.get_property_participants(full_url, cursor=cursor, limit=limit)
+        if result is None:
+            raise HTTPException(status_code=404, detail="Property not found")
+        return result
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{property_url:path}/deals", response_model=dict, dependencies=[Depends(detail_limit)])
+def get_property_deals(
+    property_url: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100)
+):
+    """Get a page of the deals involving a property, newest first"""
+    try:
+        full_url = property_url if property_url.startswith('/buildings/') else f"/buildings/{property_url.lstrip('/')}"
+        result = PropertyService.get_property_deals(full_url, cursor=cursor, limit=limit)
+        if result is None:
+            raise HTTPException(status_code=404, detail="Property not found")
+        return result
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{property_url:path}", response_model=dict, dependencies=[Depends(detail_limit)])
+def get_property_detail(
+    property_url: str,
+    include: Optional[str] = Query(None, description="Comma-separated sub-collections: deals, stories, participants")
+):
     """Get detailed information about a property by URL"""
     try:
         # Prepend /buildings/ to match database URL format
         full_url = f"/buildings/{property_url}" if not property_url.startswith('/') else property_url
         if not full_url.startswith('/buildings/'):
             full_url = f"/buildings/{property_url}"
-        property_obj = PropertyService.get_property_detail(full_url)
+        property_obj = PropertyService.get_property_detail(
+            full_url,
+            include=parse_fieldset(include, PROPERTY_INCLUDES)
+        )
         if not property_obj:
             raise HTTPException(status_code=404, detail="Property not found")
         return {"data": property_obj}
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
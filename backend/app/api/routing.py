@@ -0,0 +1,11 @@
+from fastapi.routing import APIRoute
+from app.config import settings
+
+
+class CompactRoute(APIRoute):
+    """Route that leaves null fields out of responses when COMPACT_JSON is on"""
+    
+    def __init__(self, *args, **kwargs):
+        # Decorators always pass the flag, so an explicit False cannot be told apart from the default
+        kwargs["response_model_exclude_none"] = kwargs.get("response_model_exclude_none") or settings.COMPACT_JSON
+        super().__init__(*args, **kwargs)
@@ -1,14 +1,40 @@
-from fastapi import APIRouter, HTTPException, Query
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional
 from app.services.entity_service import StoryService
+from app.limits import analysis_limit
+from app.api.routing import CompactRoute
 
-router = APIRouter(prefix="/api/stories", tags=["stories"])
+router = APIRouter(prefix="/api/stories", tags=["stories"], route_class=CompactRoute)
 
 
 @router.get("", response_model=dict)
-async def get_stories(page: int = Query(1, ge=1), limit: int = Query(12, ge=1, le=100)):
+def get_stories(page: int = Query(1, ge=1), limit: int = Query(12, ge=1, le=100)):
     """Get paginated list of stories"""
     try:
         result = StoryService.get_all_stories(page=page, limit=limit)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/timeline", response_model=dict, dependencies=[Depends(analysis_limit)])
+def get_story_timeline(
+    person: Optional[str] = None,
+    organization: Optional[str] = None,
+    property_url: Optional[str] = Query(None, alias="property"),
+    from_date: Optional[date] = Query(None, alias="from"),
+    to_date: Optional[date] = Query(None, alias="to"),
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100)
+):
+    """Get a page of dated stories, newest first, filtered by person, organization or property URL and date range"""
+    try:
+        return StoryService.get_story_timeline(
+            person=person, organization=organization, property=property_url,
+            from_date=from_date, to_date=to_date, cursor=cursor, limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -13,6 +13,61 @@ class Settings(BaseSettings):
     NEO4J_URI: str = "bolt://localhost:7687"
     NEO4J_USERNAME: str = "neo4j"
     NEO4J_PASSWORD: str = "password"
+    NEO4J_ROUTING_URI: Optional[str] = None  # e.g. neo4j://cluster:7687, overrides NEO4J_URI
+    NEO4J_BOOKMARKS_FILE: Optional[str] = ".neo4j_bookmarks"  # written by data_tools after ingest
+    
+    # Neo4j connection pool
+    NEO4J_MAX_CONNECTION_POOL_SIZE: int = 100
+    NEO4J_CONNECTION_ACQUISITION_TIMEOUT: float = 60.0  # seconds to wait for a free connection
+    NEO4J_MAX_CONNECTION_LIFETIME: float = 3600.0  # seconds before a connection is recycled
+    NEO4J_LIVENESS_CHECK_TIMEOUT: Optional[float] = None  # idle seconds before a connection is pinged on checkout
+    NEO4J_CONNECTION_TIMEOUT: float = 30.0
+    
+    # Neo4j transaction timeouts in seconds (None leaves the server default)
+    NEO4J_READ_TIMEOUT: Optional[float] = 15.0  # request queries
+    NEO4J_STREAM_TIMEOUT: Optional[float] = None  # streamed exports and analytics columns
+    NEO4J_WRITE_TIMEOUT: Optional[float] = None  # background maintenance jobs
+    
+    # Per-route-group concurrency limits (0 disables one) and queueing budget; excess requests get a 503
+    DETAIL_CONCURRENCY: int = 8
+    ANALYSIS_CONCURRENCY: int = 4
+    EXPORT_CONCURRENCY: int = 2
+    ROUTE_QUEUE_TIMEOUT_MS: float = 1000.0  # longest a request waits for a slot
+    ROUTE_QUEUE_MAX: int = 32  # requests waiting per group before new ones are shed at once
+    
+    # Response encoding
+    COMPACT_JSON: bool = True  # orjson responses without null fields
+    COMPRESSION_MIN_SIZE: int = 1024  # bytes; smaller responses are sent uncompressed
+    GZIP_LEVEL: int = 6
+    BROTLI_QUALITY: int = 4  # used when the optional brotli-asgi package is installed
+    
+    # Startup warmup and lookup tables
+    WARMUP_ENABLED: bool = True
+    LOOKUP_MAX_ROWS: int = 200000  # labels with more nodes only get a cached count
+    LOOKUP_TTL_SECONDS: float = 300.0  # age after which cached counts are re-queried
+    
+    # Analytics
+    ANALYTICS_SOURCE: str = "neo4j"  # or "snapshot": serve /api/analytics from SNAPSHOT_DIR
+    SNAPSHOT_DIR: str = "snapshot"  # columnar snapshot written by data_tools
+    
+    # Response cache, invalidated from the change log data_tools writes after each ingest
+    RESPONSE_CACHE_SIZE: int = 5000  # cached service results; 0 disables the cache
+    CHANGE_LOG_PATH: Optional[str] = "changelog.sqlite"  # nothing is cached while it is missing
+    CHANGE_FEED_POLL_SECONDS: float = 2.0  # how stale a cached result can be after an ingest
+    
+    # Background maintenance jobs (/api/jobs)
+    JOBS_ADMIN_TOKEN: Optional[str] = None  # /api/jobs is disabled until set; callers send it as X-Admin-Token
+    JOB_WORKERS: int = 2
+    JOB_HISTORY: int = 100  # finished jobs kept for inspection
+    CONSTRAINTS_FILE: str = "../data_tools/constraints.txt"
+    DATA_TOOLS_DIR: str = "../data_tools"  # where the dedup job runs dedup.py
+    WRITER_LOCK_STALE_SECONDS: int = 3600  # a graph writer lock not refreshed for this long is taken over
+    
+    # Instrumentation
+    QUERY_PROFILE_SAMPLE_RATE: float = 0.0  # fraction of queries run with PROFILE
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+    SLOW_QUERY_LOG_SIZE: int = 100
+    QUERY_PLAN_CACHE_SIZE: int = 1000  # match server.db.query_cache_size for the hit-rate estimate
     
     # CORS
     CORS_ORIGINS: list = ["http://localhost:3000", "http://localhost:3001"]
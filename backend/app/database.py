@@ -1,8 +1,242 @@
-from neo4j import GraphDatabase, Session
+import os
+import random
+import threading
+import time
+from contextvars import ContextVar
+from neo4j import Bookmarks, GraphDatabase, Query, READ_ACCESS, WRITE_ACCESS, Session, unit_of_work
 from app.config import settings
+from app.metrics import metrics, sum_db_hits
 from typing import Optional
 
 
+class InstrumentedResult:
+    """Result wrapper that records run/fetch time, rows and sampled db hits once consumed"""
+    
+    def __init__(self, result, query: str, run_seconds: float, profiled: bool, fetch_seconds: float = 0.0):
+        self._result = result
+        self._query = query
+        self._run_seconds = run_seconds
+        self._fetch_seconds = fetch_seconds
+        self._rows = 0
+        self._profiled = profiled
+        self._recorded = False
+    
+    def __iter__(self):
+        iterator = iter(self._result)
+        while True:
+            started = time.perf_counter()
+            try:
+                record = next(iterator)
+            except StopIteration:
+                self._fetch_seconds += time.perf_counter() - started
+                self.record()
+                return
+            self._fetch_seconds += time.perf_counter() - started
+            self._rows += 1
+            yield record
+    
+    def single(self, *args, **kwargs):
+        started = time.perf_counter()
+        record = self._result.single(*args, **kwargs)
+        self._fetch_seconds += time.perf_counter() - started
+        self._rows += record is not None
+        self.record()
+        return record
+    
+    def data(self, *args, **kwargs):
+        started = time.perf_counter()
+        data = self._result.data(*args, **kwargs)
+        self._fetch_seconds += time.perf_counter() - started
+        self._rows += len(data)
+        self.record()
+        return data
+    
+    def record(self):
+        """Report this execution to the metrics registry (only the first call counts)"""
+        if self._recorded:
+            return
+        self._recorded = True
+        db_hits = None
+        if self._profiled:
+            try:
+                db_hits = sum_db_hits(self._result.consume().profile)
+            except Exception:
+                db_hits = None
+        metrics.observe_query(self._query, self._run_seconds, self._fetch_seconds, self._rows, db_hits)
+    
+    def __getattr__(self, name):
+        return getattr(self._result, name)
+
+
+class BufferedResult:
+    """Records and summary of a query that ran to completion inside a managed transaction"""
+    
+    def __init__(self, records: list, summary):
+        self._records = records
+        self._summary = summary
+    
+    def __iter__(self):
+        return iter(self._records)
+    
+    def single(self, strict: bool = False):
+        if strict and len(self._records) != 1:
+            raise ValueError(f"Expected exactly one record, found {len(self._records)}")
+        return self._records[0] if self._records else None
+    
+    def data(self, *keys):
+        return [record.data(*keys) for record in self._records]
+    
+    def peek(self):
+        return self._records[0] if self._records else None
+    
+    def consume(self):
+        return self._summary
+
+
+def load_bookmarks() -> Optional[Bookmarks]:
+    """Bookmarks left by the last ingest run, so reads never see a replica that lags behind it"""
+    path = settings.NEO4J_BOOKMARKS_FILE
+    if not path:
+        return None
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    if _bookmarks_cache.get("mtime") != mtime:
+        with open(path) as f:
+            values = [line.strip() for line in f if line.strip()]
+        _bookmarks_cache.update(mtime=mtime, bookmarks=Bookmarks.from_raw_values(values))
+    return _bookmarks_cache["bookmarks"]
+
+
+_bookmarks_cache = {}
+
+
+class InstrumentedSession:
+    """Session wrapper that times every query and samples PROFILE plans"""
+    
+    def __init__(self, session: Session, on_close=None):
+        self._session = session
+        self._results = []
+        self._on_close = on_close
+    
+    def run(self, query: str, parameters=None, **kwargs) -> InstrumentedResult:
+        """Run a query in a managed read transaction (retried on transient errors) and buffer its records"""
+        profiled = random.random() < settings.QUERY_PROFILE_SAMPLE_RATE
+        text = f"PROFILE {query}" if profiled else query
+        timings = {}
+        
+        @unit_of_work(timeout=settings.NEO4J_READ_TIMEOUT)
+        def work(tx):
+            started = time.perf_counter()
+            result = tx.run(text, parameters, **kwargs)
+            timings["run"] = time.perf_counter() - started
+            records = list(result)
+            summary = result.consume()
+            timings["fetch"] = time.perf_counter() - started - timings["run"]
+            return BufferedResult(records, summary)
+        
+        buffered = self._session.execute_read(work)
+        wrapped = InstrumentedResult(buffered, query, timings["run"], profiled, timings["fetch"])
+        self._results.append(wrapped)
+        return wrapped
+    
+    def write(self, query: str, parameters=None, **kwargs) -> InstrumentedResult:
+        """Run a query in a managed write transaction (retried on transient errors) and buffer its records"""
+        timings = {}
+        
+        @unit_of_work(timeout=settings.NEO4J_WRITE_TIMEOUT)
+        def work(tx):
+            started = time.perf_counter()
+            result = tx.run(query, parameters, **kwargs)
+            timings["run"] = time.perf_counter() - started
+            records = list(result)
+            summary = result.consume()
+            timings["fetch"] = time.perf_counter() - started - timings["run"]
+            return BufferedResult(records, summary)
+        
+        buffered = self._session.execute_write(work)
+        wrapped = InstrumentedResult(buffered, query, timings["run"], False, timings["fetch"])
+        self._results.append(wrapped)
+        return wrapped
+    
+    def stream(self, query: str, parameters=None, **kwargs) -> InstrumentedResult:
+        """Run a query as an auto-commit transaction whose records are pulled lazily"""
+        profiled = random.random() < settings.QUERY_PROFILE_SAMPLE_RATE
+        text = f"PROFILE {query}" if profiled else query
+        started = time.perf_counter()
+        result = self._session.run(Query(text, timeout=settings.NEO4J_STREAM_TIMEOUT), parameters, **kwargs)
+        wrapped = InstrumentedResult(result, query, time.perf_counter() - started, profiled)
+        self._results.append(wrapped)
+        return wrapped
+    
+    def close(self):
+        # Results abandoned before being fully read are still reported
+        for result in self._results:
+            result.record()
+        self._results = []
+        self._session.close()
+        if self._on_close is not None:
+            self._on_close()
+            self._on_close = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def __getattr__(self, name):
+        return getattr(self._session, name)
+
+
+class BorrowedSession:
+    """View of the request's shared session; closing it leaves the shared session open"""
+    
+    def __init__(self, scope: 'SessionScope'):
+        self._scope = scope
+    
+    def run(self, query: str, parameters=None, **kwargs) -> InstrumentedResult:
+        return self._scope.session.run(query, parameters, **kwargs)
+    
+    def stream(self, query: str, parameters=None, **kwargs) -> InstrumentedResult:
+        return self._scope.session.stream(query, parameters, **kwargs)
+    
+    def close(self):
+        pass
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def __getattr__(self, name):
+        return getattr(self._scope.session, name)
+
+
+class SessionScope:
+    """One lazily opened session shared by every service call made while handling a request"""
+    
+    def __init__(self, connection: 'Neo4jConnection'):
+        self._connection = connection
+        self._session: Optional[InstrumentedSession] = None
+    
+    @property
+    def session(self) -> InstrumentedSession:
+        if self._session is None:
+            self._session = self._connection.new_session()
+        return self._session
+    
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+_request_scope: ContextVar[Optional[SessionScope]] = ContextVar("request_scope", default=None)
+
+
 class Neo4jConnection:
     """Neo4j database connection handler"""
     
@@ -19,15 +253,75 @@ class Neo4jConnection:
         if self._initialized:
             return
         
+        pool_config = {
+            "max_connection_pool_size": settings.NEO4J_MAX_CONNECTION_POOL_SIZE,
+            "connection_acquisition_timeout": settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+            "max_connection_lifetime": settings.NEO4J_MAX_CONNECTION_LIFETIME,
+            "connection_timeout": settings.NEO4J_CONNECTION_TIMEOUT,
+        }
+        if settings.NEO4J_LIVENESS_CHECK_TIMEOUT is not None:
+            pool_config["liveness_check_timeout"] = settings.NEO4J_LIVENESS_CHECK_TIMEOUT
+        
+        # A neo4j:// routing URI sends read transactions to cluster followers
         self._driver = GraphDatabase.driver(
-            settings.NEO4J_URI,
-            auth=(settings.NEO4J_USERNAME, settings.NEO4J_PASSWORD)
+            settings.NEO4J_ROUTING_URI or settings.NEO4J_URI,
+            auth=(settings.NEO4J_USERNAME, settings.NEO4J_PASSWORD),
+            **pool_config
         )
+        # Sessions are opened and closed from request threads and job workers at once
+        self._sessions_lock = threading.Lock()
+        self._open_sessions = 0
         self._initialized = True
     
-    def get_session(self) -> Session:
-        """Get a new database session"""
-        return self._driver.session()
+    def new_session(self) -> InstrumentedSession:
+        """Get a new read-only instrumented database session owned by the caller"""
+        session = self._driver.session(default_access_mode=READ_ACCESS, bookmarks=load_bookmarks())
+        with self._sessions_lock:
+            self._open_sessions += 1
+        return InstrumentedSession(session, on_close=self._session_closed)
+    
+    def new_write_session(self) -> InstrumentedSession:
+        """Get a new instrumented session for background maintenance writes, routed to the leader"""
+        session = self._driver.session(default_access_mode=WRITE_ACCESS, bookmarks=load_bookmarks())
+        with self._sessions_lock:
+            self._open_sessions += 1
+        return InstrumentedSession(session, on_close=self._session_closed)
+    
+    def get_session(self):
+        """Get the current request's shared session, or a new session outside of a request"""
+        scope = _request_scope.get()
+        if scope is not None:
+            return BorrowedSession(scope)
+        return self.new_session()
+    
+    def _session_closed(self):
+        with self._sessions_lock:
+            self._open_sessions -= 1
+    
+    def pool_stats(self) -> dict:
+        """Connection pool utilization, read from the driver's pool internals where available"""
+        stats = {
+            "max_size": settings.NEO4J_MAX_CONNECTION_POOL_SIZE,
+            "open_sessions": self._open_sessions,
+            "in_use": None,
+            "idle": None,
+        }
+        pool = getattr(self._driver, "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if connections is None:
+            return stats
+        try:
+            in_use = idle = 0
+            for address in list(connections):
+                total = len(connections[address])
+                busy = pool.in_use_connection_count(address)
+                in_use += busy
+                idle += total - busy
+            stats["in_use"] = in_use
+            stats["idle"] = idle
+        except Exception:
+            pass
+        return stats
     
     def close(self):
         """Close the database connection"""
@@ -37,3 +331,14 @@ class Neo4jConnection:
 
 # Singleton instance
 db = Neo4jConnection()
+
+
+async def request_session():
+    """FastAPI dependency that shares one session across all service calls of a request"""
+    scope = SessionScope(db)
+    token = _request_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _request_scope.reset(token)
+        scope.close()
@@ -0,0 +1,113 @@
+import asyncio
+import math
+import time
+from typing import Dict, List, Optional
+
+from fastapi import HTTPException
+
+from app.config import settings
+
+
+class ConcurrencyLimit:
+    """
+    FastAPI dependency that lets at most `limit` requests of a route group
+    run at once. Others wait up to `queue_timeout` seconds for a slot, or not
+    at all once `max_queue` are already waiting, and are then shed with a 503
+    whose Retry-After estimates when a slot frees up. A limit of 0 disables it.
+    """
+
+    def __init__(self, name: str, limit: int, queue_timeout: float, max_queue: int):
+        self.name = name
+        self.limit = limit
+        self.queue_timeout = queue_timeout
+        self.max_queue = max_queue
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.shed = 0
+        # Moving average of how long a request holds its slot
+        self.hold_seconds = 0.0
+
+    def _shed(self, reason: str):
+        self.shed += 1
+        retry_after = max(1, math.ceil(self.hold_seconds * (self.waiting + 1) / max(self.limit, 1)))
+        raise HTTPException(
+            status_code=503,
+            detail=f"Too many concurrent {self.name} requests ({reason}); retry later",
+            headers={"Retry-After": str(retry_after)}
+        )
+
+    @staticmethod
+    def _abandon(acquire: asyncio.Future, slots: asyncio.Semaphore):
+        """Give up on a queued acquire; a slot it got, or still gets before the cancel lands, goes straight back"""
+        def release(task: asyncio.Future):
+            if not task.cancelled() and task.exception() is None:
+                slots.release()
+        acquire.add_done_callback(release)
+        acquire.cancel()
+
+    def _slots(self) -> asyncio.Semaphore:
+        # asyncio primitives belong to one event loop; a new loop (tests, reloads) gets fresh slots
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.limit)
+        return self._semaphore
+
+    async def __call__(self):
+        if self.limit <= 0:
+            yield
+            return
+        slots = self._slots()
+        if slots.locked():
+            if self.waiting >= self.max_queue:
+                self._shed("queue full")
+            self.waiting += 1
+            # Not wait_for: its timeout can fire after acquire() took a slot, which then leaks
+            acquire = asyncio.ensure_future(slots.acquire())
+            try:
+                done, _ = await asyncio.wait({acquire}, timeout=self.queue_timeout)
+            except BaseException:
+                self._abandon(acquire, slots)
+                raise
+            finally:
+                self.waiting -= 1
+            if not done:
+                self._abandon(acquire, slots)
+                self._shed(f"waited {self.queue_timeout * 1000:.0f} ms")
+        else:
+            await slots.acquire()
+
+        self.active += 1
+        self.admitted += 1
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.hold_seconds += (time.perf_counter() - started - self.hold_seconds) * 0.1
+            self.active -= 1
+            slots.release()
+
+    def stats(self) -> Dict[str, float]:
+        return {"limit": self.limit, "active": self.active, "waiting": self.waiting,
+                "admitted": self.admitted, "shed": self.shed, "hold_ms": round(self.hold_seconds * 1000, 1)}
+
+
+def _limit(name: str, limit: int) -> ConcurrencyLimit:
+    return ConcurrencyLimit(name, limit, settings.ROUTE_QUEUE_TIMEOUT_MS / 1000, settings.ROUTE_QUEUE_MAX)
+
+
+# Entity detail pages and their sub-collection pages: the queries that fan out furthest
+detail_limit = _limit("detail", settings.DETAIL_CONCURRENCY)
+# Graph walks, geo searches, timelines, leaderboards and analytics
+analysis_limit = _limit("analysis", settings.ANALYSIS_CONCURRENCY)
+# Full-label streaming exports
+export_limit = _limit("export", settings.EXPORT_CONCURRENCY)
+
+LIMITS: List[ConcurrencyLimit] = [detail_limit, analysis_limit, export_limit]
+
+
+def limit_stats() -> Dict[str, Dict[str, float]]:
+    return {limit.name: limit.stats() for limit in LIMITS}
@@ -1,14 +1,58 @@
-from fastapi import FastAPI
+import time
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, PlainTextResponse
 from app.config import settings
-from app.api import people, deals, organizations, properties, stories, debug
+from app.database import db, request_session
+from app.limits import limit_stats
+from app.metrics import metrics, request_timings
+from app.services.cache import change_feed
+from app.services.jobs import jobs
+from app.warmup import warm_up, warmup_report
+from app.api import (
+    people, deals, organizations, properties, stories, dashboard, analytics, graph, export, jobs as jobs_api, debug
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm Neo4j and the lookup tables before accepting traffic; close the driver on shutdown"""
+    if settings.WARMUP_ENABLED:
+        await run_in_threadpool(warm_up)
+    yield
+    jobs.shutdown()
+    db.close()
+
 
 app = FastAPI(
     title=settings.API_TITLE,
     version=settings.API_VERSION,
-    description="Backend API for Real Estate Dashboard"
+    description="Backend API for Real Estate Dashboard",
+    # Every service call within a request shares one Neo4j session
+    dependencies=[Depends(request_session)],
+    default_response_class=ORJSONResponse if settings.COMPACT_JSON else JSONResponse,
+    lifespan=lifespan
 )
 
+# Response compression, brotli when available with gzip for clients that lack it
+try:
+    from brotli_asgi import BrotliMiddleware
+    app.add_middleware(
+        BrotliMiddleware,
+        quality=settings.BROTLI_QUALITY,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        gzip_fallback=True
+    )
+except ImportError:
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        compresslevel=settings.GZIP_LEVEL
+    )
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -18,12 +62,39 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def record_request_timing(request: Request, call_next):
+    """Record per-route latency and the share of it spent in Neo4j"""
+    timings = {"db": 0.0}
+    token = request_timings.set(timings)
+    started = time.perf_counter()
+    try:
+        response = await call_next(request)
+    finally:
+        request_timings.reset(token)
+    elapsed = time.perf_counter() - started
+    
+    # Use the route template so path parameters don't explode label cardinality
+    route = request.scope.get("route")
+    route_path = getattr(route, "path", "unmatched")
+    metrics.observe_request(request.method, route_path, response.status_code, elapsed, timings["db"])
+    response.headers["Server-Timing"] = (
+        f"db;dur={timings['db'] * 1000:.1f}, app;dur={(elapsed - timings['db']) * 1000:.1f}"
+    )
+    return response
+
 # Include routers
 app.include_router(people.router)
 app.include_router(deals.router)
 app.include_router(organizations.router)
 app.include_router(properties.router)
 app.include_router(stories.router)
+app.include_router(dashboard.router)
+app.include_router(analytics.router)
+app.include_router(graph.router)
+app.include_router(export.router)
+app.include_router(jobs_api.router)
 app.include_router(debug.router)
 
 
@@ -36,7 +107,13 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "ok"}
+    return {"status": "ok", "warmup": warmup_report, "cache": change_feed.stats(), "limits": limit_stats()}
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def get_metrics():
+    """Prometheus metrics"""
+    return PlainTextResponse(metrics.render_prometheus(db.pool_stats(), warmup_report.get("seconds")), media_type="text/plain; version=0.0.4")
 
 
 if __name__ == "__main__":
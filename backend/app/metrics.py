@@ -0,0 +1,301 @@
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.config import settings
+
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+MAX_TEXTS_PER_FINGERPRINT = 1000
+
+# Per-request accumulator of time spent in Neo4j, set by the HTTP middleware
+request_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar("request_timings", default=None)
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Collapse whitespace and replace literals so that equivalent queries share a fingerprint"""
+    text = _STRING_LITERAL.sub("?", query)
+    text = _NUMBER_LITERAL.sub("?", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def fingerprint(query: str) -> Tuple[str, str]:
+    """Return (fingerprint, normalized text) for a Cypher query"""
+    normalized = normalize_query(query)
+    return hashlib.sha1(normalized.encode()).hexdigest()[:12], normalized
+
+
+def sum_db_hits(profile: Optional[Dict[str, Any]]) -> int:
+    """Total db hits over a PROFILE plan tree"""
+    if not profile:
+        return 0
+    hits = profile.get("dbHits", 0) or 0
+    for child in profile.get("children", []) or []:
+        hits += sum_db_hits(child)
+    return hits
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def cumulative(self) -> List[int]:
+        total = 0
+        out = []
+        for count in self.counts:
+            total += count
+            out.append(total)
+        return out
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bucket bound containing the q-quantile"""
+        if not self.count:
+            return None
+        target = q * self.count
+        for bound, cumulative in zip(self.buckets, self.cumulative()):
+            if cumulative >= target:
+                return bound
+        return float("inf")
+
+
+class QueryStats:
+    def __init__(self, text: str):
+        self.text = text
+        self.duration = Histogram()
+        self.fetch_seconds = 0.0
+        self.rows = 0
+        self.profiled = 0
+        self.db_hits = 0
+        # Distinct literal texts seen for this fingerprint; more than one means Neo4j plans it repeatedly
+        self.texts = set()
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+
+
+class MetricsRegistry:
+    """In-process request and Cypher query metrics"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests: Dict[Tuple[str, str, str], Histogram] = {}
+        self._request_db: Dict[str, Histogram] = {}
+        self._queries: Dict[str, QueryStats] = {}
+        self._slow = deque(maxlen=settings.SLOW_QUERY_LOG_SIZE)
+        # LRU of exact query texts sized like the server's plan cache, used to estimate its hit rate
+        self._plan_cache: OrderedDict = OrderedDict()
+        self._plan_cache_hits = 0
+        self._plan_cache_misses = 0
+        # (service function, "executed" or "coalesced") -> calls
+        self._service_calls: Dict[Tuple[str, str], int] = {}
+
+    def observe_request(self, method: str, route: str, status: int, seconds: float, db_seconds: float):
+        with self._lock:
+            key = (method, route, str(status))
+            if key not in self._requests:
+                self._requests[key] = Histogram()
+            self._requests[key].observe(seconds)
+            if route not in self._request_db:
+                self._request_db[route] = Histogram()
+            self._request_db[route].observe(db_seconds)
+
+    def observe_service_call(self, function: str, result: str):
+        with self._lock:
+            key = (function, result)
+            self._service_calls[key] = self._service_calls.get(key, 0) + 1
+
+    def service_calls(self) -> Dict[str, Dict[str, int]]:
+        """Executed and coalesced calls per service function"""
+        with self._lock:
+            calls: Dict[str, Dict[str, int]] = {}
+            for (function, result), count in self._service_calls.items():
+                calls.setdefault(function, {"executed": 0, "coalesced": 0})[result] = count
+            return calls
+
+    def observe_query(self, query: str, run_seconds: float, fetch_seconds: float,
+                      rows: int, db_hits: Optional[int] = None):
+        query_fp, normalized = fingerprint(query)
+        seconds = run_seconds + fetch_seconds
+        timings = request_timings.get()
+        if timings is not None:
+            timings["db"] = timings.get("db", 0.0) + seconds
+
+        text_key = hashlib.sha1(query.encode()).digest()
+
+        with self._lock:
+            stats = self._queries.get(query_fp)
+            if stats is None:
+                stats = self._queries[query_fp] = QueryStats(normalized)
+            if len(stats.texts) < MAX_TEXTS_PER_FINGERPRINT:
+                stats.texts.add(text_key)
+            if text_key in self._plan_cache:
+                self._plan_cache.move_to_end(text_key)
+                self._plan_cache_hits += 1
+            else:
+                self._plan_cache[text_key] = True
+                self._plan_cache_misses += 1
+                if len(self._plan_cache) > settings.QUERY_PLAN_CACHE_SIZE:
+                    self._plan_cache.popitem(last=False)
+            stats.duration.observe(seconds)
+            stats.fetch_seconds += fetch_seconds
+            stats.rows += rows
+            if db_hits is not None:
+                stats.profiled += 1
+                stats.db_hits += db_hits
+
+            if seconds * 1000 >= settings.SLOW_QUERY_THRESHOLD_MS:
+                self._slow.append({
+                    "fingerprint": query_fp,
+                    "query": normalized,
+                    "seconds": round(seconds, 6),
+                    "run_seconds": round(run_seconds, 6),
+                    "fetch_seconds": round(fetch_seconds, 6),
+                    "rows": rows,
+                    "db_hits": db_hits,
+                    "at": time.time(),
+                })
+
+    def slow_queries(self, limit: int = 50) -> Dict[str, Any]:
+        """Recent slow executions and the query fingerprints with the most total time"""
+        with self._lock:
+            recent = list(self._slow)[-limit:][::-1]
+            by_total = sorted(self._queries.items(), key=lambda item: item[1].duration.sum, reverse=True)
+            top = [
+                {
+                    "fingerprint": query_fp,
+                    "query": stats.text,
+                    "count": stats.duration.count,
+                    "total_seconds": round(stats.duration.sum, 6),
+                    "mean_seconds": round(stats.duration.sum / stats.duration.count, 6),
+                    "p95_seconds": stats.duration.quantile(0.95),
+                    "fetch_seconds": round(stats.fetch_seconds, 6),
+                    "rows": stats.rows,
+                    "profiled": stats.profiled,
+                    "mean_db_hits": round(stats.db_hits / stats.profiled, 1) if stats.profiled else None,
+                    "texts": len(stats.texts),
+                }
+                for query_fp, stats in by_total[:limit]
+            ]
+            plan_cache = self._plan_cache_stats()
+        return {"recent": recent, "top": top, "plan_cache": plan_cache}
+
+    def _plan_cache_stats(self) -> Dict[str, Any]:
+        """Estimated server plan cache hit rate; call with the lock held"""
+        lookups = self._plan_cache_hits + self._plan_cache_misses
+        return {
+            "hits": self._plan_cache_hits,
+            "misses": self._plan_cache_misses,
+            "hit_ratio": round(self._plan_cache_hits / lookups, 4) if lookups else None,
+            "distinct_texts": len(self._plan_cache),
+        }
+
+    def render_prometheus(self, pool: Optional[Dict[str, Any]] = None,
+                          warmup_seconds: Optional[float] = None) -> str:
+        """Render all metrics (plus optional pool and warmup gauges) in the Prometheus text exposition format"""
+        lines = []
+
+        def histogram(name: str, help_text: str, series):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for labels, hist in series:
+                for bound, cumulative in zip(hist.buckets, hist.cumulative()):
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {hist.count}')
+                lines.append(f"{name}_sum{{{labels}}} {hist.sum}")
+                lines.append(f"{name}_count{{{labels}}} {hist.count}")
+
+        def counter(name: str, help_text: str, series):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for labels, value in series:
+                lines.append(f"{name}{{{labels}}} {value}")
+
+        def gauge(name: str, help_text: str, value):
+            if value is None:
+                return
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {value}")
+
+        if pool:
+            gauge("neo4j_pool_max_size", "Configured maximum connections per server.", pool.get("max_size"))
+            gauge("neo4j_pool_in_use", "Connections currently checked out of the pool.", pool.get("in_use"))
+            gauge("neo4j_pool_idle", "Open connections waiting in the pool.", pool.get("idle"))
+            gauge("neo4j_open_sessions", "Driver sessions currently open.", pool.get("open_sessions"))
+
+        gauge("app_warmup_seconds", "Duration of the startup warmup.", warmup_seconds)
+
+        with self._lock:
+            histogram(
+                "http_request_duration_seconds", "HTTP request latency by route.",
+                [(_labels(method=m, route=r, status=s), h) for (m, r, s), h in self._requests.items()]
+            )
+            histogram(
+                "http_request_db_seconds", "Time spent in Neo4j per HTTP request.",
+                [(_labels(route=r), h) for r, h in self._request_db.items()]
+            )
+            histogram(
+                "cypher_query_duration_seconds", "Cypher run plus record fetch time by query fingerprint.",
+                [(_labels(fingerprint=fp), q.duration) for fp, q in self._queries.items()]
+            )
+            counter(
+                "cypher_query_fetch_seconds_total", "Time spent iterating records by query fingerprint.",
+                [(_labels(fingerprint=fp), q.fetch_seconds) for fp, q in self._queries.items()]
+            )
+            counter(
+                "cypher_query_rows_total", "Records returned by query fingerprint.",
+                [(_labels(fingerprint=fp), q.rows) for fp, q in self._queries.items()]
+            )
+            counter(
+                "cypher_query_profiled_total", "Sampled PROFILE executions by query fingerprint.",
+                [(_labels(fingerprint=fp), q.profiled) for fp, q in self._queries.items()]
+            )
+            counter(
+                "cypher_query_db_hits_total", "Database hits over sampled PROFILE executions.",
+                [(_labels(fingerprint=fp), q.db_hits) for fp, q in self._queries.items()]
+            )
+            counter(
+                "cypher_plan_cache_estimated_total",
+                "Executions whose exact text was (hit) or was not (miss) recently planned, per a client-side LRU.",
+                [(_labels(result="hit"), self._plan_cache_hits), (_labels(result="miss"), self._plan_cache_misses)]
+            )
+            counter(
+                "service_calls_total",
+                "Service calls that ran (executed) or waited for an identical in-flight call (coalesced).",
+                [(_labels(function=f, result=r), count) for (f, r), count in self._service_calls.items()]
+            )
+            lines.append("# HELP cypher_query_texts Distinct query texts seen per fingerprint.")
+            lines.append("# TYPE cypher_query_texts gauge")
+            for fp, q in self._queries.items():
+                lines.append(f"cypher_query_texts{{{_labels(fingerprint=fp)}}} {len(q.texts)}")
+        return "\n".join(lines) + "\n"
+
+
+# Singleton instance
+metrics = MetricsRegistry()
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional, List
+from datetime import datetime
+from typing import Any, Dict, Optional, List
 
 
 # Story Models
@@ -7,6 +8,7 @@ class StoryBase(BaseModel):
     title: str
     source: str
     url: str
+    published_on: Optional[str] = None
 
 
 class Story(StoryBase):
@@ -33,6 +35,8 @@ class PersonDetail(Person):
     bio: Optional[str] = None
     image: Optional[str] = None
     deals: List['Deal'] = []
+    deal_count: int = 0
+    deals_next_cursor: Optional[str] = None
     organizations: List['Organization'] = []
     stories: List[Story] = []
 
@@ -73,6 +77,26 @@ class Participant(BaseModel):
     url: Optional[str] = None
 
 
+class Partner(BaseModel):
+    model_config = ConfigDict(populate_by_name=True, serialization_by_alias=False)
+    id: int = Field(..., alias="_id")
+    name: Optional[str] = None
+    type: str  # "Person" or "Organization"
+    url: Optional[str] = None
+    shared_deals: int
+
+
+class LeaderboardEntry(BaseModel):
+    model_config = ConfigDict(populate_by_name=True, serialization_by_alias=False)
+    id: int = Field(..., alias="_id")
+    name: Optional[str] = None
+    title: Optional[str] = None
+    url: Optional[str] = None
+    deals: int
+    volume: float
+    activity: float  # deals weighted by recency, one deal today = 1.0
+
+
 class DealDetail(Deal):
     participants: List[Participant] = []
     properties: List['Property'] = []
@@ -96,18 +120,28 @@ class OrganizationDetail(Organization):
     members: List[Person] = []
     deals: List[Deal] = []
     stories: List[Story] = []
+    member_count: int = 0
+    deal_count: int = 0
+    story_count: int = 0
+    story_count_capped: bool = False
+    members_next_cursor: Optional[str] = None
+    deals_next_cursor: Optional[str] = None
+    stories_next_cursor: Optional[str] = None
 
 
 # Property Models
 class PropertyBase(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
     address: str
     url: str
     name: Optional[str] = None
     type: Optional[str] = None
-    square_feet: Optional[str] = Field(None, alias="square feet")
-    year_built: Optional[str] = Field(None, alias="year built")
-    credifi_score: Optional[str] = Field(None, alias="credifi score")
+    square_feet: Optional[str] = None
+    year_built: Optional[str] = None
+    credifi_score: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    # "address" for a geocoded street address, "city" for a city centroid stand-in
+    location_precision: Optional[str] = None
 
 
 class Property(PropertyBase):
@@ -115,10 +149,40 @@ class Property(PropertyBase):
     id: int = Field(..., alias="_id")
 
 
+class NearbyProperty(Property):
+    distance_m: float
+
+
 class PropertyDetail(Property):
     deals: List[Deal] = []
     stories: List[Story] = []
     participants: List['Participant'] = []
+    deal_count: int = 0
+    participant_count: int = 0
+    deals_next_cursor: Optional[str] = None
+    participants_next_cursor: Optional[str] = None
+
+
+# Job Models
+class JobRequest(BaseModel):
+    task: str
+    params: Dict[str, Any] = {}
+
+
+class JobStatus(BaseModel):
+    id: str
+    task: str
+    params: Dict[str, Any] = {}
+    state: str  # queued, running, succeeded or failed
+    done: int = 0
+    total: Optional[int] = None
+    message: Optional[str] = None
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    log: List[str] = []
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
 
 
 # Pagination Models
@@ -0,0 +1,329 @@
+"""
+Market analytics over every deal's numeric columns.
+
+data_tools stores typed copies of the deal strings at ingest (price_value,
+price_per_square_foot_value, square_feet_value and closed_on). They are pulled
+into NumPy arrays in one streamed query, and every statistic is a vectorized
+group-by over those arrays. With ANALYTICS_SOURCE=snapshot the same arrays are
+memory-mapped from the columnar snapshot data_tools writes, and Neo4j is not
+queried at all. Arrays and results are cached until the graph (or snapshot)
+version that data_tools bumps after each ingest changes.
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.config import settings
+from app.database import db
+from app.services import queries
+from app.services.singleflight import coalesced
+from app.services.snapshot import MISSING_DAY, Snapshot, load_snapshot
+
+
+METRICS = ["price_per_square_foot", "price", "square_feet"]
+GROUPS = ["deal_type", "property_type"]
+PERCENTILES = [10, 25, 50, 75, 90]
+
+
+def _rows(sorted_ids: np.ndarray, ids: np.ndarray) -> np.ndarray:
+    """Row of each id in a sorted id column, -1 where it is absent"""
+    if not len(sorted_ids):
+        return np.full(len(ids), -1, dtype=np.int64)
+    rows = np.searchsorted(sorted_ids, ids).clip(max=len(sorted_ids) - 1)
+    return np.where(sorted_ids[rows] == ids, rows, -1)
+
+
+class DealColumns:
+    """Numeric deal columns, one entry per dated deal, with integer codes for the categorical ones"""
+
+    def __init__(self, month: np.ndarray, price: np.ndarray, ppsf: np.ndarray, sqft: np.ndarray,
+                 categories: Dict[str, Tuple[np.ndarray, np.ndarray]]):
+        # Months as year * 12 + month - 1; missing numbers are NaN
+        self.month = month
+        with np.errstate(divide="ignore", invalid="ignore"):
+            derived = np.where(sqft > 0, price / sqft, np.nan)
+        self.metrics = {
+            "price": price,
+            "square_feet": sqft,
+            "price_per_square_foot": np.where(np.isnan(ppsf), derived, ppsf),
+        }
+        self.labels = {name: labels for name, (labels, _) in categories.items()}
+        self.codes = {name: codes for name, (_, codes) in categories.items()}
+
+    @classmethod
+    def from_records(cls, records) -> "DealColumns":
+        """Columns from the rows of DEAL_ANALYTICS_COLUMNS"""
+        month, price, ppsf, sqft, deal_types, property_types = [], [], [], [], [], []
+        for record in records:
+            month.append(record['month_index'])
+            price.append(record['price_value'])
+            ppsf.append(record['price_per_square_foot_value'])
+            sqft.append(record['square_feet_value'])
+            deal_types.append(record['deal_type'] or "unknown")
+            property_types.append(record['property_type'] or "unknown")
+        categories = {
+            name: np.unique(np.asarray(values, dtype=object), return_inverse=True)
+            for name, values in (("deal_type", deal_types), ("property_type", property_types))
+        }
+        return cls(
+            np.asarray(month, dtype=np.int64), np.asarray(price, dtype=np.float64),
+            np.asarray(ppsf, dtype=np.float64), np.asarray(sqft, dtype=np.float64), categories
+        )
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Snapshot) -> "DealColumns":
+        """
+        The same columns from a memory-mapped snapshot, joining each deal to its
+        first property's type. Dropping undated deals is a boolean-mask index,
+        which copies the selected rows out of the mapping into process memory
+        (three float64 and three int64 arrays per snapshot version); when every
+        deal is dated the mapped columns are used as they are.
+        """
+        days = snapshot.dates("Deal", "closed_on")
+        dated = days != MISSING_DAY
+
+        def keep(column: np.ndarray) -> np.ndarray:
+            return column if dated.all() else np.asarray(column)[dated]
+
+        month = keep(days).astype("datetime64[D]").astype("datetime64[M]").astype(np.int64) + 1970 * 12
+
+        def categorical(codes: np.ndarray, dictionary: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+            # Missing (-1) becomes "unknown", appended after the dictionary
+            labels = np.asarray([*dictionary, "unknown"], dtype=object)
+            return labels, np.where(codes < 0, len(dictionary), codes).astype(np.int64)
+
+        deal_dictionary, deal_codes = snapshot.categories("Deal", "type")
+
+        # Deal and property ids are sorted, so searchsorted maps an id to its row
+        deal_ids = snapshot.ints("Deal", "id")
+        property_ids = snapshot.ints("Property", "id")
+        property_dictionary, property_codes = snapshot.categories("Property", "type")
+        src, dst = snapshot.ints("INVOLVES", "src"), snapshot.ints("INVOLVES", "dst")
+        first_src, first_edge = np.unique(src, return_index=True)
+        deal_rows = _rows(deal_ids, first_src)
+        property_rows = _rows(property_ids, dst[first_edge])
+        linked = (deal_rows >= 0) & (property_rows >= 0)
+        deal_property_codes = np.full(len(deal_ids), -1, dtype=np.int64)
+        deal_property_codes[deal_rows[linked]] = property_codes[property_rows[linked]]
+
+        return cls(
+            month,
+            keep(snapshot.numbers("Deal", "price_value")),
+            keep(snapshot.numbers("Deal", "price_per_square_foot_value")),
+            keep(snapshot.numbers("Deal", "square_feet_value")),
+            {
+                "deal_type": categorical(keep(deal_codes), deal_dictionary),
+                "property_type": categorical(keep(deal_property_codes), property_dictionary),
+            },
+        )
+
+    def __len__(self) -> int:
+        return len(self.month)
+
+
+def grouped_stats(codes: np.ndarray, values: np.ndarray, groups: int,
+                  percentiles: List[int] = PERCENTILES) -> Dict[str, np.ndarray]:
+    """
+    Count, mean and linearly interpolated percentiles of `values` for each
+    group code in [0, groups), NaNs dropped. One lexsort orders every group
+    at once, so each percentile is an index computation over all groups.
+    """
+    keep = ~np.isnan(values)
+    codes, values = codes[keep], values[keep]
+    order = np.lexsort((values, codes))
+    codes, values = codes[order], values[order]
+
+    counts = np.bincount(codes, minlength=groups)[:groups]
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    sums = np.bincount(codes, weights=values, minlength=groups)[:groups]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stats = {"deals": counts, "mean": sums / counts}
+
+    present = counts > 0
+    last = max(len(values) - 1, 0)
+    padded = values if len(values) else np.array([np.nan])
+    for q in percentiles:
+        position = starts + (counts - 1).clip(min=0) * (q / 100)
+        low = np.floor(position).astype(np.int64).clip(0, last)
+        high = np.ceil(position).astype(np.int64).clip(0, last)
+        estimate = padded[low] + (padded[high] - padded[low]) * (position - low)
+        stats[f"p{q}"] = np.where(present, estimate, np.nan)
+    return stats
+
+
+def _number(value) -> Optional[float]:
+    value = float(value)
+    return None if np.isnan(value) else round(value, 2)
+
+
+def _month(index: int) -> str:
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+def _check(metric: str, group: Optional[str]):
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric: {metric}")
+    if group is not None and group not in GROUPS:
+        raise ValueError(f"Unknown group: {group}")
+
+
+class AnalyticsService:
+    """Service for market statistics, cached per graph version"""
+
+    _lock = threading.Lock()
+    _version: Any = None
+    _checked_at = 0.0
+    _columns: Optional[DealColumns] = None
+    _results: Dict[tuple, Any] = {}
+
+    @staticmethod
+    def _graph_version(session) -> Any:
+        """GraphMeta.version, or a LOOKUP_TTL_SECONDS time bucket for graphs ingested before it existed"""
+        record = session.run(queries.GRAPH_VERSION, key="graph").single()
+        if record and record['version'] is not None:
+            return record['version']
+        return ("ttl", int(time.time() // settings.LOOKUP_TTL_SECONDS))
+
+    @staticmethod
+    def _current_version() -> Any:
+        """Version of the analytics source; the graph's is re-read at most every CHANGE_FEED_POLL_SECONDS"""
+        if settings.ANALYTICS_SOURCE == "snapshot":
+            snapshot = load_snapshot()
+            if snapshot is None:
+                raise RuntimeError(f"No analytics snapshot in {settings.SNAPSHOT_DIR}; run the data_tools ingest")
+            return ("snapshot", snapshot.version)
+        now = time.monotonic()
+        version = AnalyticsService._version
+        if version is not None and now - AnalyticsService._checked_at < settings.CHANGE_FEED_POLL_SECONDS:
+            return version
+        session = db.get_session()
+        try:
+            version = AnalyticsService._graph_version(session)
+        finally:
+            session.close()
+        AnalyticsService._checked_at = now
+        return version
+
+    @staticmethod
+    @coalesced
+    def _load(source: str, version: Any) -> DealColumns:
+        """The deal columns of `version`, loaded once for every request waiting on them"""
+        if source == "snapshot":
+            snapshot = load_snapshot()
+            if snapshot is None:
+                raise RuntimeError(f"No analytics snapshot in {settings.SNAPSHOT_DIR}; run the data_tools ingest")
+            return DealColumns.from_snapshot(snapshot)
+        session = db.get_session()
+        try:
+            return DealColumns.from_records(session.stream(queries.DEAL_ANALYTICS_COLUMNS))
+        finally:
+            session.close()
+
+    @staticmethod
+    def reset():
+        """Forget the loaded columns and results, so the next call reloads them"""
+        with AnalyticsService._lock:
+            AnalyticsService._version = None
+            AnalyticsService._checked_at = 0.0
+            AnalyticsService._columns = None
+            AnalyticsService._results = {}
+
+    @staticmethod
+    def _cached(key: tuple, compute: Callable[[DealColumns], Any]) -> Any:
+        """
+        Result of compute(columns) for `key`. The columns come from Neo4j, or
+        from the memory-mapped snapshot when ANALYTICS_SOURCE is "snapshot",
+        and are reloaded when the graph or snapshot version moves. The lock
+        only guards swapping them in; loads and computations run outside it.
+        """
+        version = AnalyticsService._current_version()
+        with AnalyticsService._lock:
+            current = version == AnalyticsService._version and AnalyticsService._columns is not None
+            columns, results = AnalyticsService._columns, AnalyticsService._results
+
+        if not current:
+            columns = AnalyticsService._load(settings.ANALYTICS_SOURCE, version)
+            with AnalyticsService._lock:
+                if AnalyticsService._columns is not columns:
+                    AnalyticsService._version = version
+                    AnalyticsService._columns = columns
+                    AnalyticsService._results = {}
+                results = AnalyticsService._results
+
+        if key in results:
+            return results[key]
+        value = compute(columns)
+        with AnalyticsService._lock:
+            return results.setdefault(key, value)
+
+    @staticmethod
+    def get_trend(metric: str = "price_per_square_foot", group: Optional[str] = None,
+                  window: int = 3) -> List[Dict[str, Any]]:
+        """
+        Monthly deals, quartiles and trailing `window`-month median of a
+        metric, as one series per value of `group` (or a single series).
+        """
+        _check(metric, group)
+
+        def compute(columns: DealColumns) -> List[Dict[str, Any]]:
+            if not len(columns):
+                return []
+            first = int(columns.month.min())
+            span = int(columns.month.max()) - first + 1
+            month = columns.month - first
+            labels = columns.labels[group] if group else np.array(["all"], dtype=object)
+            group_codes = columns.codes[group] if group else np.zeros(len(columns), dtype=np.int64)
+            values = columns.metrics[metric]
+
+            monthly = grouped_stats(group_codes * span + month, values, len(labels) * span, [25, 50, 75])
+
+            # Each deal also counts towards the window - 1 following months
+            offsets = np.tile(np.arange(window), len(columns))
+            rolled_month = np.repeat(month, window) + offsets
+            inside = rolled_month < span
+            rolling = grouped_stats(
+                (np.repeat(group_codes, window) * span + rolled_month)[inside],
+                np.repeat(values, window)[inside], len(labels) * span, [50]
+            )
+
+            series = []
+            for g, label in enumerate(labels):
+                points = []
+                for m in range(span):
+                    i = g * span + m
+                    if not monthly["deals"][i]:
+                        continue
+                    points.append({
+                        "month": _month(first + m),
+                        "deals": int(monthly["deals"][i]),
+                        "p25": _number(monthly["p25"][i]),
+                        "median": _number(monthly["p50"][i]),
+                        "p75": _number(monthly["p75"][i]),
+                        "rolling_median": _number(rolling["p50"][i]),
+                    })
+                if points:
+                    series.append({"group": label, "points": points})
+            return series
+
+        return AnalyticsService._cached(("trend", metric, group, window), compute)
+
+    @staticmethod
+    def get_distribution(metric: str = "price_per_square_foot", by: str = "deal_type") -> List[Dict[str, Any]]:
+        """Deals, mean and percentiles of a metric for each deal or property type, largest groups first"""
+        _check(metric, by)
+
+        def compute(columns: DealColumns) -> List[Dict[str, Any]]:
+            labels = columns.labels[by]
+            stats = grouped_stats(columns.codes[by], columns.metrics[metric], len(labels))
+            rows = []
+            for g in np.argsort(-stats["deals"], kind="stable"):
+                if not stats["deals"][g]:
+                    continue
+                row = {"group": labels[g], "deals": int(stats["deals"][g]), "mean": _number(stats["mean"][g])}
+                row.update({f"p{q}": _number(stats[f"p{q}"][g]) for q in PERCENTILES})
+                rows.append(row)
+            return rows
+
+        return AnalyticsService._cached(("distribution", metric, by), compute)
@@ -0,0 +1,266 @@
+"""
+Response cache invalidated from the ingest change log.
+
+data_tools appends every URL an ingest wrote to a SQLite change log
+(CHANGE_LOG_PATH) under the new graph version. ChangeFeed polls it at most
+every CHANGE_FEED_POLL_SECONDS with one indexed query, and each new version
+drops only the cached results tagged with a changed URL or the list of a
+changed label, plus every aggregate. data_tools also logs the parents of
+what it wrote (a changed person's organizations, every participant of a
+changed deal), so results filed under a parent's URL, like organization
+story pages and partner lists, expire with their members. The lookup tables
+forget the changed URLs too. Without a readable change log nothing is
+cached, since nothing would ever expire. Backend jobs that rewrite the graph
+append their own versions with record_changes, so every worker sees them.
+"""
+import functools
+import inspect
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
+
+from pydantic import BaseModel
+
+from app.config import settings
+from app.services.lookup import lookups
+from app.services.singleflight import call_key
+
+
+AGGREGATE = "aggregate"
+
+
+def url_tag(url: str) -> str:
+    return f"url:{url}"
+
+
+def list_tag(label: str) -> str:
+    return f"list:{label}"
+
+
+def _urls(value: Any) -> Iterable[str]:
+    """Every `url` field in a service result, at any depth"""
+    if isinstance(value, BaseModel):
+        value = dict(value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key == "url" and isinstance(item, str):
+                yield item
+            elif isinstance(item, (dict, list, BaseModel)):
+                yield from _urls(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _urls(item)
+
+
+class TaggedCache:
+    """LRU of service results, each filed under the tags that invalidate it"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._tagged: Dict[str, Set[tuple]] = {}
+        self.hits = self.misses = self.invalidated = 0
+
+    def get(self, key: tuple) -> tuple:
+        """(True, value) on a hit, (False, None) otherwise"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[0]
+
+    def set(self, key: tuple, value: Any, tags: Set[str]):
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = (value, tags)
+            for tag in tags:
+                self._tagged.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+
+    def _drop(self, key: tuple) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        for tag in entry[1]:
+            keys = self._tagged.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tagged[tag]
+        return True
+
+    def invalidate(self, tags: Iterable[str]) -> int:
+        """Drop every entry filed under any of `tags`; returns how many were dropped"""
+        with self._lock:
+            dropped = 0
+            for tag in tags:
+                for key in list(self._tagged.get(tag, ())):
+                    dropped += self._drop(key)
+            self.invalidated += dropped
+            return dropped
+
+    def clear(self):
+        with self._lock:
+            self.invalidated += len(self._entries)
+            self._entries.clear()
+            self._tagged.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "tags": len(self._tagged),
+                "hits": self.hits, "misses": self.misses, "invalidated": self.invalidated}
+
+
+class ChangeFeed:
+    """Follows the data_tools change log and invalidates `cache` as new graph versions appear"""
+
+    def __init__(self, cache: TaggedCache, path: Optional[str], interval: float):
+        self.cache = cache
+        self.path = path
+        self.interval = interval
+        self.version: Optional[int] = None
+        self._lock = threading.Lock()
+        self._polled_at = 0.0
+
+    def _read(self, conn: sqlite3.Connection):
+        """
+        (oldest, newest) retained versions and the changes after the last one
+        seen; None for the changes when they cannot be applied one by one
+        """
+        oldest, newest = conn.execute("SELECT min(version), max(version) FROM versions").fetchone()
+        if newest is None or newest == self.version or self.version is None or newest < self.version:
+            return oldest, newest, None
+        logged = conn.execute(
+            "SELECT count(*) FROM versions WHERE version > ? AND version <= ?", (self.version, newest)
+        ).fetchone()[0]
+        if logged != newest - self.version:
+            # A version was written to the graph but never logged
+            return oldest, newest, None
+        rows = conn.execute(
+            "SELECT label, url FROM changes WHERE version > ? AND version <= ?", (self.version, newest)
+        ).fetchall()
+        return oldest, newest, rows
+
+    def poll(self, force: bool = False) -> Optional[int]:
+        """
+        The newest graph version in the change log, or None while it cannot be
+        read. Reads it at most once per interval; changes since the last poll
+        are invalidated before this returns.
+        """
+        now = time.monotonic()
+        if not force and now - self._polled_at < self.interval:
+            return self.version
+        with self._lock:
+            if not force and now - self._polled_at < self.interval:
+                return self.version
+            self._polled_at = now
+            if not self.path or not os.path.exists(self.path):
+                self._reset(None)
+                return None
+            try:
+                conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, timeout=1.0)
+                try:
+                    oldest, newest, rows = self._read(conn)
+                finally:
+                    conn.close()
+            except sqlite3.Error:
+                self._reset(None)
+                return None
+
+            if rows is not None and oldest is not None and self.version + 1 >= oldest:
+                tags = {AGGREGATE}
+                for label, url in rows:
+                    tags.add(url_tag(url))
+                    tags.add(list_tag(label))
+                self.cache.invalidate(tags)
+                # Merged-away URLs must stop resolving to their old node ids
+                lookups.forget(rows)
+                self.version = newest
+            elif newest != self.version:
+                # First read, a log that was recreated, pruned past our version or missing a version
+                self._reset(newest)
+            return self.version
+
+    def _reset(self, version: Optional[int]):
+        if version != self.version:
+            self.cache.clear()
+            if self.version is not None:
+                # Changes were missed, so no lookup entry can be trusted until the next reload
+                lookups.clear()
+        self.version = version
+
+    def stats(self) -> Dict[str, Any]:
+        return {"path": self.path, "version": self.version, **self.cache.stats()}
+
+
+response_cache = TaggedCache(settings.RESPONSE_CACHE_SIZE)
+change_feed = ChangeFeed(response_cache, settings.CHANGE_LOG_PATH, settings.CHANGE_FEED_POLL_SECONDS)
+
+
+def record_changes(version: int, changes: Iterable[Tuple[str, str]]) -> bool:
+    """
+    Log (label, url) changes under graph `version` in the change log, as
+    data_tools/changelog.py does after an ingest, and apply them here at
+    once. False when there is no change log to write to.
+    """
+    path = change_feed.path
+    if not path or not os.path.exists(path):
+        return False
+    rows = [(version, label, url) for label, url in changes]
+    conn = sqlite3.connect(path, timeout=5.0)
+    try:
+        with conn:
+            conn.executemany("INSERT OR IGNORE INTO changes VALUES (?, ?, ?)", rows)
+            # The versions row goes in last: readers only look at versions listed there
+            conn.execute("INSERT OR REPLACE INTO versions VALUES (?, ?, ?)",
+                         (version, datetime.now().isoformat(), len(rows)))
+    finally:
+        conn.close()
+    change_feed.poll(force=True)
+    return True
+
+
+def cached(*tags: str, by_url: bool = False, url_params: Tuple[str, ...] = ()) -> Callable:
+    """
+    Cache a service method's results until the change feed invalidates them.
+    Each result is tagged with `tags`, every URL it contains and, with
+    `by_url`, the URL it was looked up by, so even a None (not found) result
+    is dropped once that URL is ingested. `url_params` names arguments that
+    hold the URL of a parent entity the result is filtered by.
+    """
+    def decorator(fn: Callable) -> Callable:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not settings.RESPONSE_CACHE_SIZE:
+                return fn(*args, **kwargs)
+            version = change_feed.poll()
+            if version is None:
+                return fn(*args, **kwargs)
+            key = call_key(fn, args, kwargs)
+            hit, value = response_cache.get(key)
+            if hit:
+                return value
+            value = fn(*args, **kwargs)
+            entry_tags = set(tags)
+            entry_tags.update(url_tag(url) for url in _urls(value))
+            if by_url and args:
+                entry_tags.add(url_tag(args[0]))
+            if url_params:
+                arguments = signature.bind(*args, **kwargs).arguments
+                entry_tags.update(url_tag(arguments[name]) for name in url_params if arguments.get(name))
+            # A version that landed while we were reading may not be in `value`
+            if change_feed.version == version:
+                response_cache.set(key, value, entry_tags)
+            return value
+        return wrapper
+    return decorator
@@ -1,12 +1,118 @@
+from app.config import settings
 from app.database import db
+from app.services import queries
+from app.services.cache import AGGREGATE, cached, list_tag
+from app.services.singleflight import coalesced
+from app.services.lookup import lookups
 from app.models.schemas import (
     Person, PersonDetail, Deal, DealDetail,
     Organization, OrganizationDetail, Property, PropertyDetail,
-    Participant, Story
+    Participant, Partner, Story, LeaderboardEntry, NearbyProperty
 )
-from typing import Optional, Dict, Any
+from neo4j.spatial import WGS84Point
+from typing import Optional, Dict, Any, Iterator, List
+import base64
+import json
+import math
 import re
-from datetime import datetime
+from datetime import date, datetime
+
+
+# Default page size for sub-collections embedded in detail responses
+PAGE_SIZE = 20
+
+# Counts that would have to deduplicate an unbounded fan-out (stories across
+# every member of an organization) stop at this many; the response says so
+COUNT_LIMIT = 1000
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """Encode keyset pagination values as an opaque cursor"""
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str], size: int) -> Optional[List[Any]]:
+    """Decode a cursor produced by encode_cursor, raising ValueError if it is malformed"""
+    if not cursor:
+        return None
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def _page(items: list, keys: List[List[Any]], limit: int) -> Dict[str, Any]:
+    """Trim a limit+1 fetch to one page and derive the next cursor from the last kept row"""
+    has_more = len(items) > limit
+    return {
+        "data": items[:limit],
+        "next_cursor": encode_cursor(keys[limit - 1]) if has_more else None,
+        "limit": limit
+    }
+
+
+# Deal fields selectable with `fields=`; each is read from the node property of the same name
+DEAL_FIELDS = [
+    "property", "url", "date", "title", "type", "price", "price_per_square_foot", "floors",
+    "term_years", "square_feet", "acquirer_stake", "amount", "financing_types", "interest_rate",
+    "structure", "fixed_vs_floating",
+]
+
+# Leaderboard activity scores are sums of exp(λ·(day − epoch)) per deal, as
+# data_tools stores them; these must match its ACTIVITY_* constants
+ACTIVITY_HALF_LIFE_DAYS = 365
+ACTIVITY_EPOCH = date(2000, 1, 1)
+LEADERBOARD_METRICS = ["activity", "deals", "volume"]
+
+# Sub-collections selectable with `include=` on each detail endpoint
+PERSON_INCLUDES = ["deals", "organizations", "stories"]
+DEAL_INCLUDES = ["participants", "properties", "stories"]
+ORGANIZATION_INCLUDES = ["members", "deals", "stories"]
+PROPERTY_INCLUDES = ["deals", "stories", "participants"]
+
+EMPTY_PAGE = {"data": [], "next_cursor": None}
+
+
+def parse_fieldset(value: Optional[str], allowed) -> Optional[List[str]]:
+    """Split a comma-separated fields/include parameter, raising ValueError on unknown names"""
+    if value is None:
+        return None
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown field: {', '.join(unknown)}")
+    return list(dict.fromkeys(names))
+
+
+def _sparse_deal(record, fields: List[str]) -> Dict[str, Any]:
+    """Deal dict holding only the requested fields, from a query returning id, url and values"""
+    deal = {"_id": record['id'], **dict(zip(fields, record['values']))}
+    parsed = parse_deal_url(record['url'])
+    for field in ('property', 'date', 'type'):
+        if field in deal and not deal[field]:
+            deal[field] = parsed[field]
+    return deal
+
+
+def _without_collections(model, include: Optional[List[str]], collections: List[str]):
+    """Serialize a detail model without the sub-collections (and their cursors) left out of `include`"""
+    if include is None:
+        return model
+    excluded = set(collections) - set(include)
+    excluded |= {f"{name}_next_cursor" for name in excluded}
+    return model.model_dump(by_alias=True, exclude=excluded, exclude_none=settings.COMPACT_JSON)
+
+
+def _coordinates(node) -> Dict[str, Optional[float]]:
+    """latitude/longitude of a node's WGS-84 location point, if it has one, and how precise it is"""
+    location = node.get('location')
+    if location is None:
+        return {}
+    return {"latitude": location.latitude, "longitude": location.longitude,
+            "location_precision": node.get('location_precision')}
 
 
 def parse_deal_url(url: str) -> Dict[str, str]:
@@ -64,24 +170,22 @@ class PersonService:
     """Service for Person operations"""
     
     @staticmethod
+    @cached(list_tag("Person"))
     def get_all_people(page: int = 1, limit: int = 12) -> Dict[str, Any]:
         """Get paginated list of people"""
         session = db.get_session()
         try:
             skip = (page - 1) * limit
             
-            # Get total count
-            count_result = session.run("MATCH (p:Person) RETURN count(p) as total")
-            total = count_result.single()['total']
+            # Get total count, from the lookup tables while fresh
+            total = lookups.count("Person")
+            if total is None:
+                count_result = session.run(queries.COUNT_BY_LABEL["Person"])
+                total = count_result.single()['total']
+                lookups.set_count("Person", total)
             
             # Get paginated data
-            query = f"""
-            MATCH (p:Person)
-            RETURN p as node
-            SKIP {skip}
-            LIMIT {limit}
-            """
-            result = session.run(query)
+            result = session.run(queries.LIST_PEOPLE, skip=skip, limit=limit)
             
             people = []
             for record in result:
@@ -105,15 +209,62 @@ class PersonService:
             session.close()
     
     @staticmethod
-    def get_person_detail(person_url: str) -> Optional[PersonDetail]:
-        """Get detailed information about a person by URL"""
+    def _deals_page(session, person_url: str, cursor: Optional[str] = None,
+                    limit: int = PAGE_SIZE) -> Dict[str, Any]:
+        """One page of a person's deals, newest first"""
+        after = decode_cursor(cursor, 2) or [None, None]
+        deals_result = session.run(
+            queries.PERSON_DEALS_PAGE,
+            url=person_url, after_date=after[0], after_id=after[1], limit=limit + 1
+        )
+        
+        deals = []
+        keys = []
+        for record in deals_result:
+            url = record.get('url', '')
+            parsed = parse_deal_url(url)
+            
+            deal = Deal(
+                _id=record['deal_id'],
+                property=record.get('property') or parsed['property'],
+                url=url,
+                date=record.get('date') or parsed['date'],
+                type=record.get('type') or parsed['type'],
+                role=record.get('role'),
+                property_address=record.get('property_address')
+            )
+            deals.append(deal)
+            keys.append([record['sort_date'], record['deal_id']])
+        
+        return _page(deals, keys, limit)
+    
+    @staticmethod
+    @cached(by_url=True)
+    @coalesced
+    def get_person_deals(person_url: str, cursor: Optional[str] = None,
+                         limit: int = PAGE_SIZE) -> Optional[Dict[str, Any]]:
+        """Get a page of a person's deals by URL"""
         session = db.get_session()
         try:
-            # Get person by URL
-            person_result = session.run(
-                "MATCH (p:Person) WHERE p.url = $url RETURN p as node",
-                url=person_url
-            )
+            exists = lookups.node_id("Person", person_url) is not None or session.run(
+                queries.PERSON_EXISTS, url=person_url
+            ).single()
+            if not exists:
+                return None
+            return PersonService._deals_page(session, person_url, cursor, limit)
+        finally:
+            session.close()
+    
+    @staticmethod
+    @cached(by_url=True)
+    @coalesced
+    def get_person_detail(person_url: str, include: Optional[List[str]] = None):
+        """Get detailed information about a person by URL, querying only the sub-collections in `include`"""
+        includes = PERSON_INCLUDES if include is None else include
+        session = db.get_session()
+        try:
+            # Get person by URL along with the size of its deal collection
+            person_result = session.run(queries.PERSON_DETAIL, url=person_url)
             person_node = person_result.single()
             
             if not person_node:
@@ -121,71 +272,41 @@ class PersonService:
             
             node = person_node['node']
             
-            # Get deals (Person -[:PARTICIPATED_IN]-> Deal) with only necessary fields
-            deals_result = session.run("""
-                MATCH (p:Person)
-                WHERE p.url = $url
-                MATCH (p)-[r:PARTICIPATED_IN]->(d:Deal)
-                OPTIONAL MATCH (d)-[:INVOLVES]->(pr:Property)
-                RETURN d.url as url, d.property as property, d.date as date, 
-                       d.type as type, r.role as role, pr.address as property_address,
-                       id(d) as deal_id
-            """, url=person_url)
-            
-            deals = []
-            for record in deals_result:
-                url = record.get('url', '')
-                parsed = parse_deal_url(url)
-                
-                deal = Deal(
-                    _id=record['deal_id'],
-                    property=record.get('property') or parsed['property'],
-                    url=url,
-                    date=record.get('date') or parsed['date'],
-                    type=record.get('type') or parsed['type'],
-                    role=record.get('role'),
-                    property_address=record.get('property_address')
-                )
-                deals.append(deal)
+            # Get the first page of deals (Person -[:PARTICIPATED_IN]-> Deal)
+            deals_page = EMPTY_PAGE
+            if 'deals' in includes:
+                deals_page = PersonService._deals_page(session, person_url)
             
             # Get organizations (Person -[:WORKS_FOR]-> Organization)
-            orgs_result = session.run("""
-                MATCH (p:Person)-[r:WORKS_FOR]->(o:Organization)
-                WHERE p.url = $url
-                RETURN o as node, r.role as role
-            """, url=person_url)
-            
             organizations = []
-            for record in orgs_result:
-                org_node = record['node']
-                org = Organization(
-                    _id=org_node.id,
-                    name=org_node.get('name'),
-                    type=org_node.get('type'),
-                    url=org_node.get('url'),
-                    role=record['role']
-                )
-                organizations.append(org)
+            if 'organizations' in includes:
+                orgs_result = session.run(queries.PERSON_ORGANIZATIONS, url=person_url)
+                for record in orgs_result:
+                    org_node = record['node']
+                    org = Organization(
+                        _id=org_node.id,
+                        name=org_node.get('name'),
+                        type=org_node.get('type'),
+                        url=org_node.get('url'),
+                        role=record['role']
+                    )
+                    organizations.append(org)
             
             # Get stories (Person -[:MENTIONED_IN]-> Story)
-            stories_result = session.run("""
-                MATCH (p:Person)-[:MENTIONED_IN]->(s:Story)
-                WHERE p.url = $url
-                RETURN s as node
-            """, url=person_url)
-            
             stories = []
-            for record in stories_result:
-                story_node = record['node']
-                story = Story(
-                    _id=story_node.id,
-                    title=story_node.get('title'),
-                    source=story_node.get('source'),
-                    url=story_node.get('url')
-                )
-                stories.append(story)
-            
-            return PersonDetail(
+            if 'stories' in includes:
+                stories_result = session.run(queries.PERSON_STORIES, url=person_url)
+                for record in stories_result:
+                    story_node = record['node']
+                    story = Story(
+                        _id=story_node.id,
+                        title=story_node.get('title'),
+                        source=story_node.get('source'),
+                        url=story_node.get('url')
+                    )
+                    stories.append(story)
+            
+            person = PersonDetail(
                 _id=node.id,
                 name=node.get('name', ''),
                 title=node.get('title'),
@@ -193,27 +314,99 @@ class PersonService:
                 phone=node.get('phone'),
                 bio=node.get('bio'),
                 image=node.get('image'),
-                deals=deals,
+                deals=deals_page['data'],
+                deal_count=person_node['deal_count'],
+                deals_next_cursor=deals_page['next_cursor'],
                 organizations=organizations,
                 stories=stories
             )
+            return _without_collections(person, include, PERSON_INCLUDES)
         finally:
             session.close()
 
     @staticmethod
+    @cached(list_tag("CO_PARTICIPATED"), by_url=True)
+    @coalesced
+    def get_person_partners(person_url: str, limit: int = 10,
+                            partner_type: Optional[str] = None) -> Optional[list]:
+        """Get the most frequent deal partners of a person from the precomputed CO_PARTICIPATED counts"""
+        session = db.get_session()
+        try:
+            result = session.run(queries.PERSON_PARTNERS, url=person_url, type=partner_type, limit=limit)
+            records = list(result)
+            
+            if not records:
+                return None
+            
+            partners = []
+            for record in records:
+                partner_node = record['node']
+                if partner_node is None:
+                    continue
+                partner = Partner(
+                    _id=partner_node.id,
+                    name=partner_node.get('name'),
+                    type='Person' if 'Person' in record['nodeType'] else 'Organization',
+                    url=partner_node.get('url'),
+                    shared_deals=record['shared_deals']
+                )
+                partners.append(partner)
+            
+            return partners
+        finally:
+            session.close()
+
+    @staticmethod
+    @cached(AGGREGATE)
+    @coalesced
+    def get_leaderboard(by: str = "activity", deal_type: Optional[str] = None, since: Optional[date] = None,
+                        region: Optional[str] = None, cursor: Optional[str] = None,
+                        limit: int = PAGE_SIZE) -> Dict[str, Any]:
+        """
+        A page of brokers ranked by recency-weighted activity, deal count or
+        dollar volume, read from the precomputed BrokerScore cells
+        """
+        if by not in LEADERBOARD_METRICS:
+            raise ValueError(f"Unknown ranking: {by}")
+        after = decode_cursor(cursor, 2) or [None, None]
+        params = dict(type=deal_type or "*", region=region or "*",
+                      after_score=after[0], after_url=after[1], limit=limit + 1)
+        session = db.get_session()
+        try:
+            if since is None:
+                result = session.run(queries.LEADERBOARD_BY_METRIC[by], **params)
+            else:
+                result = session.run(queries.LEADERBOARD_SINCE_BY_METRIC[by],
+                                     since_month=since.strftime("%Y-%m"), **params)
+            
+            # Decay the stored activity sums to today
+            decay = math.exp(-math.log(2) / ACTIVITY_HALF_LIFE_DAYS * (date.today() - ACTIVITY_EPOCH).days)
+            entries = []
+            keys = []
+            for record in result:
+                node = record['node']
+                entries.append(LeaderboardEntry(
+                    _id=node.id,
+                    name=node.get('name'),
+                    title=node.get('title'),
+                    url=node.get('url'),
+                    deals=record['deals'],
+                    volume=record['volume'],
+                    activity=round(record['activity'] * decay, 4)
+                ))
+                keys.append([record['score'], node.get('url')])
+            
+            return _page(entries, keys, limit)
+        finally:
+            session.close()
+
+    @staticmethod
+    @cached(list_tag("Person"), list_tag("Deal"))
     def get_people_with_recent_deals(limit: int = 20) -> list:
         """Get people with most recent deals"""
         session = db.get_session()
         try:
-            query = f"""
-            MATCH (p:Person)-[:PARTICIPATED_IN]->(d:Deal)
-            WITH p, d
-            ORDER BY d.date DESC
-            WITH p, collect(d)[0] as latest_deal
-            RETURN p as node
-            LIMIT {limit}
-            """
-            result = session.run(query)
+            result = session.run(queries.RECENT_PEOPLE, limit=limit)
             
             people = []
             for record in result:
@@ -236,32 +429,36 @@ class DealService:
     """Service for Deal operations"""
     
     @staticmethod
-    def get_all_deals(page: int = 1, limit: int = 12) -> Dict[str, Any]:
-        """Get paginated list of deals ordered by most recent"""
+    @cached(list_tag("Deal"))
+    def get_all_deals(page: int = 1, limit: int = 12, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Get paginated list of deals ordered by most recent, optionally with only the given fields"""
         session = db.get_session()
         try:
             skip = (page - 1) * limit
             
-            # Get total count
-            count_result = session.run("MATCH (d:Deal) RETURN count(d) as total")
-            total = count_result.single()['total']
+            # Get total count, from the lookup tables while fresh
+            total = lookups.count("Deal")
+            if total is None:
+                count_result = session.run(queries.COUNT_BY_LABEL["Deal"])
+                total = count_result.single()['total']
+                lookups.set_count("Deal", total)
+            
+            if fields is not None:
+                # Fetch only the requested properties
+                result = session.run(
+                    queries.LIST_DEALS_FIELDS,
+                    skip=skip, limit=limit, keys=fields
+                )
+                return {
+                    "data": [_sparse_deal(record, fields) for record in result],
+                    "total": total,
+                    "page": page,
+                    "limit": limit
+                }
             
             # Get paginated data ordered by date
             # Convert MM/DD/YYYY to YYYY-MM-DD for proper sorting
-            query = f"""
-            MATCH (d:Deal)
-            WITH d,
-                 CASE 
-                     WHEN d.date IS NOT NULL AND d.date <> '' 
-                     THEN substring(d.date, 6, 4) + '-' + substring(d.date, 0, 2) + '-' + substring(d.date, 3, 2)
-                     ELSE '0000-00-00'
-                 END as sort_date
-            RETURN d as node
-            ORDER BY sort_date DESC
-            SKIP {skip}
-            LIMIT {limit}
-            """
-            result = session.run(query)
+            result = session.run(queries.LIST_DEALS, skip=skip, limit=limit)
             
             deals = []
             for record in result:
@@ -276,7 +473,7 @@ class DealService:
                     date=node.get('date') or parsed['date'],
                     type=node.get('type') or parsed['type'],
                     price=node.get('price'),
-                    square_feet=node.get('square feet')
+                    square_feet=node.get('square_feet')
                 )
                 deals.append(deal)
             
@@ -290,24 +487,20 @@ class DealService:
             session.close()
 
     @staticmethod
-    def get_recent_deals(limit: int = 20) -> list:
-        """Get recent deals"""
+    @cached(list_tag("Deal"))
+    def get_recent_deals(limit: int = 20, fields: Optional[List[str]] = None) -> list:
+        """Get recent deals, optionally with only the given fields"""
         session = db.get_session()
         try:
+            if fields is not None:
+                result = session.run(
+                    queries.RECENT_DEALS_FIELDS,
+                    limit=limit, keys=fields
+                )
+                return [_sparse_deal(record, fields) for record in result]
+            
             # Convert MM/DD/YYYY to YYYY-MM-DD for proper sorting
-            query = f"""
-            MATCH (d:Deal)
-            WITH d,
-                 CASE 
-                     WHEN d.date IS NOT NULL AND d.date <> '' 
-                     THEN substring(d.date, 6, 4) + '-' + substring(d.date, 0, 2) + '-' + substring(d.date, 3, 2)
-                     ELSE '0000-00-00'
-                 END as sort_date
-            RETURN d as node
-            ORDER BY sort_date DESC
-            LIMIT {limit}
-            """
-            result = session.run(query)
+            result = session.run(queries.RECENT_DEALS, limit=limit)
             
             deals = []
             for record in result:
@@ -322,7 +515,7 @@ class DealService:
                     date=node.get('date') or parsed['date'],
                     type=node.get('type') or parsed['type'],
                     price=node.get('price'),
-                    square_feet=node.get('square feet')
+                    square_feet=node.get('square_feet')
                 )
                 deals.append(deal)
             
@@ -331,110 +524,112 @@ class DealService:
             session.close()
     
     @staticmethod
-    def get_deal_detail(deal_url: str) -> Optional[DealDetail]:
-        """Get detailed information about a deal by URL"""
+    @cached(by_url=True)
+    @coalesced
+    def get_deal_detail(deal_url: str, fields: Optional[List[str]] = None,
+                        include: Optional[List[str]] = None):
+        """
+        Get detailed information about a deal by URL. `fields` limits the deal
+        properties read from the node and `include` the sub-collections queried;
+        either one makes the result a plain dict holding only what was asked for.
+        """
+        includes = DEAL_INCLUDES if include is None else include
         session = db.get_session()
         try:
             # Get deal by URL
-            deal_result = session.run(
-                "MATCH (d:Deal) WHERE d.url = $url RETURN d as node",
-                url=deal_url
-            )
-            deal_node = deal_result.single()
+            if fields is None:
+                deal_node = session.run(queries.DEAL_BY_URL, url=deal_url).single()
+            else:
+                deal_node = session.run(
+                    queries.DEAL_FIELDS_BY_URL,
+                    url=deal_url, keys=fields
+                ).single()
             
             if not deal_node:
                 return None
             
-            node = deal_node['node']
-            
             # Get participants (Person/Organization -[:PARTICIPATED_IN]-> Deal)
             # Use COLLECT to handle multiple relationships and pick the one with a role
-            participants_result = session.run("""
-                MATCH (participant)-[r:PARTICIPATED_IN]->(d:Deal)
-                WHERE d.url = $url
-                WITH participant, labels(participant) as nodeType, COLLECT(r.role) as roles
-                RETURN participant as node, nodeType, 
-                       CASE 
-                           WHEN ANY(role IN roles WHERE role IS NOT NULL) 
-                           THEN [role IN roles WHERE role IS NOT NULL][0]
-                           ELSE NULL
-                       END as role
-            """, url=deal_url)
-            
             participants = []
-            for record in participants_result:
-                participant_node = record['node']
-                node_type = 'Person' if 'Person' in record['nodeType'] else 'Organization'
-                participant = Participant(
-                    _id=participant_node.id,
-                    name=participant_node.get('name', ''),
-                    type=node_type,
-                    role=record['role'],
-                    url=participant_node.get('url')
-                )
-                participants.append(participant)
+            if 'participants' in includes:
+                participants_result = session.run(queries.DEAL_PARTICIPANTS, url=deal_url)
+                for record in participants_result:
+                    participant_node = record['node']
+                    node_type = 'Person' if 'Person' in record['nodeType'] else 'Organization'
+                    participant = Participant(
+                        _id=participant_node.id,
+                        name=participant_node.get('name', ''),
+                        type=node_type,
+                        role=record['role'],
+                        url=participant_node.get('url')
+                    )
+                    participants.append(participant)
             
             # Get properties (Deal -[:INVOLVES]-> Property)
-            props_result = session.run("""
-                MATCH (d:Deal)-[:INVOLVES]->(pr:Property)
-                WHERE d.url = $url
-                RETURN pr as node
-            """, url=deal_url)
-            
             properties = []
-            for record in props_result:
-                prop_node = record['node']
-                prop = Property(
-                    _id=prop_node.id,
-                    address=prop_node.get('address', ''),
-                    url=prop_node.get('url', ''),
-                    name=prop_node.get('name'),
-                    type=prop_node.get('type'),
-                    square_feet=prop_node.get('square feet'),
-                    year_built=prop_node.get('year built'),
-                    credifi_score=prop_node.get('credifi score')
-                )
-                properties.append(prop)
+            if 'properties' in includes:
+                props_result = session.run(queries.DEAL_PROPERTIES, url=deal_url)
+                for record in props_result:
+                    prop_node = record['node']
+                    prop = Property(
+                        _id=prop_node.id,
+                        address=prop_node.get('address', ''),
+                        url=prop_node.get('url', ''),
+                        name=prop_node.get('name'),
+                        type=prop_node.get('type'),
+                        square_feet=prop_node.get('square_feet'),
+                        year_built=prop_node.get('year_built'),
+                        credifi_score=prop_node.get('credifi_score')
+                    )
+                    properties.append(prop)
             
             # Get stories (Story -[:MENTIONED_IN]-> Deal or Deal -[:MENTIONED_IN]-> Story)
-            stories_result = session.run("""
-                MATCH (s:Story)-[:MENTIONED_IN]->(d:Deal)
-                WHERE d.url = $url
-                RETURN s as node
-            """, url=deal_url)
-            
             stories = []
-            for record in stories_result:
-                story_node = record['node']
-                story = Story(
-                    _id=story_node.id,
-                    title=story_node.get('title', ''),
-                    source=story_node.get('source', ''),
-                    url=story_node.get('url', '')
-                )
-                stories.append(story)
+            if 'stories' in includes:
+                stories_result = session.run(queries.DEAL_STORIES, url=deal_url)
+                for record in stories_result:
+                    story_node = record['node']
+                    story = Story(
+                        _id=story_node.id,
+                        title=story_node.get('title', ''),
+                        source=story_node.get('source', ''),
+                        url=story_node.get('url', '')
+                    )
+                    stories.append(story)
+            
+            if fields is not None:
+                deal = _sparse_deal(deal_node, fields)
+                collections = {'participants': participants, 'properties': properties, 'stories': stories}
+                for name in includes:
+                    deal[name] = [
+                        item.model_dump(by_alias=True, exclude_none=settings.COMPACT_JSON)
+                        for item in collections[name]
+                    ]
+                return deal
             
-            return DealDetail(
+            node = deal_node['node']
+            deal = DealDetail(
                 _id=node.id,
                 property=node.get('property', ''),
                 url=node.get('url', ''),
                 date=node.get('date', ''),
-                price_per_square_foot=node.get('price per square foot'),
+                price_per_square_foot=node.get('price_per_square_foot'),
                 floors=node.get('floors'),
-                term_years=node.get('term years'),
-                square_feet=node.get('square feet'),
+                term_years=node.get('term_years'),
+                square_feet=node.get('square_feet'),
                 type=node.get('type'),
-                acquirer_stake=node.get('acquirer stake'),
+                acquirer_stake=node.get('acquirer_stake'),
                 price=node.get('price'),
                 amount=node.get('amount'),
-                financing_types=node.get('financing types'),
-                interest_rate=node.get('interest rate'),
+                financing_types=node.get('financing_types'),
+                interest_rate=node.get('interest_rate'),
                 structure=node.get('structure'),
-                fixed_vs_floating=node.get('fixed vs floating'),
+                fixed_vs_floating=node.get('fixed_vs_floating'),
                 participants=participants,
                 properties=properties,
                 stories=stories
             )
+            return _without_collections(deal, include, DEAL_INCLUDES)
         finally:
             session.close()
 
@@ -443,24 +638,22 @@ class OrganizationService:
     """Service for Organization operations"""
     
     @staticmethod
+    @cached(list_tag("Organization"))
     def get_all_organizations(page: int = 1, limit: int = 12) -> Dict[str, Any]:
         """Get paginated list of organizations"""
         session = db.get_session()
         try:
             skip = (page - 1) * limit
             
-            # Get total count
-            count_result = session.run("MATCH (o:Organization) RETURN count(o) as total")
-            total = count_result.single()['total']
+            # Get total count, from the lookup tables while fresh
+            total = lookups.count("Organization")
+            if total is None:
+                count_result = session.run(queries.COUNT_BY_LABEL["Organization"])
+                total = count_result.single()['total']
+                lookups.set_count("Organization", total)
             
             # Get paginated data
-            query = f"""
-            MATCH (o:Organization)
-            RETURN o as node
-            SKIP {skip}
-            LIMIT {limit}
-            """
-            result = session.run(query)
+            result = session.run(queries.LIST_ORGANIZATIONS, skip=skip, limit=limit)
             
             organizations = []
             for record in result:
@@ -483,17 +676,13 @@ class OrganizationService:
             session.close()
     
     @staticmethod
+    @cached(list_tag("Organization"), list_tag("Deal"))
     def get_recent_organizations(limit: int = 20) -> list:
         """Get recent organizations"""
         session = db.get_session()
         try:
             # Get organizations with recent deals
-            query = f"""
-            MATCH (o:Organization)-[r:PARTICIPATED_IN]->(d:Deal)
-            RETURN DISTINCT o as node
-            LIMIT {limit}
-            """
-            result = session.run(query)
+            result = session.run(queries.RECENT_ORGANIZATIONS, limit=limit)
             
             organizations = []
             for record in result:
@@ -511,104 +700,165 @@ class OrganizationService:
             session.close()
     
     @staticmethod
-    def get_organization_detail(org_url: str) -> Optional[OrganizationDetail]:
-        """Get detailed information about an organization by URL"""
+    def _members_page(session, org_url: str, cursor: Optional[str] = None,
+                      limit: int = PAGE_SIZE) -> Dict[str, Any]:
+        """One page of an organization's members"""
+        after = decode_cursor(cursor, 1) or [None]
+        members_result = session.run(
+            queries.ORGANIZATION_MEMBERS_PAGE,
+            url=org_url, after_id=after[0], limit=limit + 1
+        )
+        
+        members = []
+        keys = []
+        for record in members_result:
+            person_node = record['node']
+            person = Person(
+                _id=person_node.id,
+                name=person_node.get('name', ''),
+                title=person_node.get('title', ''),
+                role=record['role'],
+                url=person_node.get('url')
+            )
+            members.append(person)
+            keys.append([record['person_id']])
+        
+        return _page(members, keys, limit)
+    
+    @staticmethod
+    def _deals_page(session, org_url: str, cursor: Optional[str] = None,
+                    limit: int = PAGE_SIZE) -> Dict[str, Any]:
+        """One page of an organization's deals, newest first, with list-view fields only"""
+        after = decode_cursor(cursor, 2) or [None, None]
+        deals_result = session.run(
+            queries.ORGANIZATION_DEALS_PAGE,
+            url=org_url, after_date=after[0], after_id=after[1], limit=limit + 1
+        )
+        
+        deals = []
+        keys = []
+        for record in deals_result:
+            url = record.get('url') or ''
+            parsed = parse_deal_url(url)
+            
+            deal = Deal(
+                _id=record['deal_id'],
+                property=record.get('property') or parsed['property'],
+                url=url,
+                date=record.get('date') or parsed['date'],
+                type=record.get('type') or parsed['type'],
+                price=record.get('price'),
+                square_feet=record.get('square_feet'),
+                role=record.get('role')
+            )
+            deals.append(deal)
+            keys.append([record['sort_date'], record['deal_id']])
+        
+        return _page(deals, keys, limit)
+    
+    @staticmethod
+    def _stories_page(session, org_url: str, cursor: Optional[str] = None,
+                      limit: int = PAGE_SIZE) -> Dict[str, Any]:
+        """One page of the stories mentioning an organization's members, newest first"""
+        after = decode_cursor(cursor, 2) or [None, None]
+        stories_result = session.run(
+            queries.ORGANIZATION_STORIES_PAGE,
+            url=org_url, after_date=after[0], after_id=after[1], limit=limit + 1
+        )
+        
+        stories = []
+        keys = []
+        for record in stories_result:
+            story = Story(
+                _id=record['story_id'],
+                title=record.get('title') or '',
+                source=record.get('source') or '',
+                url=record.get('url') or ''
+            )
+            stories.append(story)
+            keys.append([record['sort_date'], record['story_id']])
+        
+        return _page(stories, keys, limit)
+    
+    @staticmethod
+    def _get_page(page_fn, org_url: str, cursor: Optional[str], limit: int) -> Optional[Dict[str, Any]]:
+        session = db.get_session()
+        try:
+            exists = lookups.node_id("Organization", org_url) is not None or session.run(
+                queries.ORGANIZATION_EXISTS, url=org_url
+            ).single()
+            if not exists:
+                return None
+            return page_fn(session, org_url, cursor, limit)
+        finally:
+            session.close()
+    
+    @staticmethod
+    @cached(by_url=True)
+    @coalesced
+    def get_organization_members(org_url: str, cursor: Optional[str] = None,
+                                 limit: int = PAGE_SIZE) -> Optional[Dict[str, Any]]:
+        """Get a page of an organization's members by URL"""
+        return OrganizationService._get_page(OrganizationService._members_page, org_url, cursor, limit)
+    
+    @staticmethod
+    @cached(by_url=True)
+    @coalesced
+    def get_organization_deals(org_url: str, cursor: Optional[str] = None,
+                               limit: int = PAGE_SIZE) -> Optional[Dict[str, Any]]:
+        """Get a page of an organization's deals by URL"""
+        return OrganizationService._get_page(OrganizationService._deals_page, org_url, cursor, limit)
+    
+    @staticmethod
+    @cached(by_url=True)
+    @coalesced
+    def get_organization_stories(org_url: str, cursor: Optional[str] = None,
+                                 limit: int = PAGE_SIZE) -> Optional[Dict[str, Any]]:
+        """Get a page of the stories mentioning an organization's members by URL"""
+        return OrganizationService._get_page(OrganizationService._stories_page, org_url, cursor, limit)
+    
+    @staticmethod
+    @cached(by_url=True)
+    @coalesced
+    def get_organization_detail(org_url: str, include: Optional[List[str]] = None):
+        """Get an organization by URL with sub-collection counts and the first pages of those in `include`"""
+        includes = ORGANIZATION_INCLUDES if include is None else include
         session = db.get_session()
         try:
-            # Get organization by URL
-            org_result = session.run(
-                "MATCH (o:Organization) WHERE o.url = $url RETURN o as node",
-                url=org_url
-            )
+            # Get organization by URL along with the size of each sub-collection
+            org_result = session.run(queries.ORGANIZATION_DETAIL, url=org_url, count_limit=COUNT_LIMIT)
             org_node = org_result.single()
             
             if not org_node:
                 return None
             
             node = org_node['node']
-            
-            # Get members (Person -[:WORKS_FOR]-> Organization)
-            members_result = session.run("""
-                MATCH (p:Person)-[r:WORKS_FOR]->(o:Organization)
-                WHERE o.url = $url
-                RETURN p as node, r.role as role
-            """, url=org_url)
-            
-            members = []
-            for record in members_result:
-                person_node = record['node']
-                person = Person(
-                    _id=person_node.id,
-                    name=person_node.get('name', ''),
-                    title=person_node.get('title', ''),
-                    role=record['role'],
-                    url=person_node.get('url')
-                )
-                members.append(person)
-            
-            # Get deals (Organization -[:PARTICIPATED_IN]-> Deal)
-            deals_result = session.run("""
-                MATCH (o:Organization)-[r:PARTICIPATED_IN]->(d:Deal)
-                WHERE o.url = $url
-                RETURN d as node, r.role as role
-            """, url=org_url)
-            
-            deals = []
-            for record in deals_result:
-                deal_node = record['node']
-                url = deal_node.get('url', '')
-                parsed = parse_deal_url(url)
-                
-                deal = Deal(
-                    _id=deal_node.id,
-                    property=deal_node.get('property') or parsed['property'],
-                    url=url,
-                    date=deal_node.get('date') or parsed['date'],
-                    price_per_square_foot=deal_node.get('price per square foot'),
-                    floors=deal_node.get('floors'),
-                    term_years=deal_node.get('term years'),
-                    square_feet=deal_node.get('square feet'),
-                    type=deal_node.get('type') or parsed['type'],
-                    acquirer_stake=deal_node.get('acquirer stake'),
-                    price=deal_node.get('price'),
-                    amount=deal_node.get('amount'),
-                    financing_types=deal_node.get('financing types'),
-                    interest_rate=deal_node.get('interest rate'),
-                    structure=deal_node.get('structure'),
-                    fixed_vs_floating=deal_node.get('fixed vs floating'),
-                    role=record.get('role')
-                )
-                deals.append(deal)
-            
-            # Get stories from all members (Organization <-[:WORKS_FOR]- Person -[:MENTIONED_IN]-> Story)
-            stories_result = session.run("""
-                MATCH (o:Organization)<-[:WORKS_FOR]-(p:Person)-[:MENTIONED_IN]->(s:Story)
-                WHERE o.url = $url
-                RETURN DISTINCT s as node
-                ORDER BY s.date DESC
-            """, url=org_url)
-            
-            stories = []
-            for record in stories_result:
-                story_node = record['node']
-                story = Story(
-                    _id=story_node.id,
-                    title=story_node.get('title', ''),
-                    source=story_node.get('source', ''),
-                    url=story_node.get('url', '')
-                )
-                stories.append(story)
-            
-            return OrganizationDetail(
+            members_page = deals_page = stories_page = EMPTY_PAGE
+            if 'members' in includes:
+                members_page = OrganizationService._members_page(session, org_url)
+            if 'deals' in includes:
+                deals_page = OrganizationService._deals_page(session, org_url)
+            if 'stories' in includes:
+                stories_page = OrganizationService._stories_page(session, org_url)
+            
+            organization = OrganizationDetail(
                 _id=node.id,
                 name=node.get('name'),
                 type=node.get('type'),
                 url=node.get('url'),
                 role=node.get('role'),
-                members=members,
-                deals=deals,
-                stories=stories
+                members=members_page['data'],
+                deals=deals_page['data'],
+                stories=stories_page['data'],
+                member_count=org_node['member_count'],
+                deal_count=org_node['deal_count'],
+                story_count=org_node['story_count'],
+                story_count_capped=org_node['story_count'] >= COUNT_LIMIT,
+                members_next_cursor=members_page['next_cursor'],
+                deals_next_cursor=deals_page['next_cursor'],
+                stories_next_cursor=stories_page['next_cursor']
             )
+            return _without_collections(organization, include, ORGANIZATION_INCLUDES)
         finally:
             session.close()
 
@@ -617,26 +867,22 @@ class PropertyService:
     """Service for Property operations"""
     
     @staticmethod
+    @cached(list_tag("Property"))
     def get_all_properties(page: int = 1, limit: int = 12) -> Dict[str, Any]:
         """Get paginated list of properties ordered by most recent deals"""
         session = db.get_session()
         try:
             skip = (page - 1) * limit
             
-            # Get total count
-            count_result = session.run("MATCH (pr:Property) RETURN count(pr) as total")
-            total = count_result.single()['total']
+            # Get total count, from the lookup tables while fresh
+            total = lookups.count("Property")
+            if total is None:
+                count_result = session.run(queries.COUNT_BY_LABEL["Property"])
+                total = count_result.single()['total']
+                lookups.set_count("Property", total)
             
             # Get paginated data ordered by most recent deal
-            query = f"""
-            MATCH (pr:Property)<-[:INVOLVES]-(d:Deal)
-            WITH pr, max(d.date) as latest_date
-            RETURN pr as node
-            ORDER BY latest_date DESC
-            SKIP {skip}
-            LIMIT {limit}
-            """
-            result = session.run(query)
+            result = session.run(queries.LIST_PROPERTIES, skip=skip, limit=limit)
             
             properties = []
             for record in result:
@@ -647,7 +893,7 @@ class PropertyService:
                     url=node.get('url', ''),
                     name=node.get('name'),
                     type=node.get('type'),
-                    square_feet=node.get('square feet')
+                    square_feet=node.get('square_feet')
                 )
                 properties.append(prop)
             
@@ -661,18 +907,12 @@ class PropertyService:
             session.close()
 
     @staticmethod
+    @cached(list_tag("Property"), list_tag("Deal"))
     def get_recent_properties(limit: int = 20) -> list:
         """Get recent properties (with most recent deals)"""
         session = db.get_session()
         try:
-            query = f"""
-            MATCH (pr:Property)<-[:INVOLVES]-(d:Deal)
-            WITH pr, max(d.date) as latest_date
-            RETURN pr as node
-            ORDER BY latest_date DESC
-            LIMIT {limit}
-            """
-            result = session.run(query)
+            result = session.run(queries.RECENT_PROPERTIES, limit=limit)
             
             properties = []
             for record in result:
@@ -683,7 +923,7 @@ class PropertyService:
                     url=node.get('url', ''),
                     name=node.get('name'),
                     type=node.get('type'),
-                    square_feet=node.get('square feet')
+                    square_feet=node.get('square_feet')
                 )
                 properties.append(prop)
             
@@ -692,15 +932,174 @@ class PropertyService:
             session.close()
     
     @staticmethod
-    def get_property_detail(property_url: str) -> Optional[PropertyDetail]:
-        """Get detailed information about a property by URL"""
+    def _geo_property(node, model=Property, **extra):
+        return model(
+            _id=node.id,
+            address=node.get('address', ''),
+            url=node.get('url', ''),
+            name=node.get('name'),
+            type=node.get('type'),
+            square_feet=node.get('square_feet'),
+            **_coordinates(node),
+            **extra
+        )
+    
+    @staticmethod
+    @cached(list_tag("Property"))
+    def get_properties_near(latitude: float, longitude: float, radius: float,
+                            cursor: Optional[str] = None, limit: int = PAGE_SIZE) -> Dict[str, Any]:
+        """A page of the properties within `radius` meters of a point, nearest first"""
+        after = decode_cursor(cursor, 2) or [None, None]
         session = db.get_session()
         try:
-            # Get property by URL
-            prop_result = session.run(
-                "MATCH (pr:Property) WHERE pr.url = $url RETURN pr as node",
-                url=property_url
+            result = session.run(
+                queries.PROPERTIES_NEAR,
+                center=WGS84Point((longitude, latitude)), radius=radius,
+                after_distance=after[0], after_id=after[1], limit=limit + 1
             )
+            properties = []
+            keys = []
+            for record in result:
+                distance = record['distance']
+                properties.append(PropertyService._geo_property(
+                    record['node'], NearbyProperty, distance_m=round(distance, 1)
+                ))
+                keys.append([distance, record['property_id']])
+            return _page(properties, keys, limit)
+        finally:
+            session.close()
+    
+    @staticmethod
+    @cached(list_tag("Property"))
+    def get_properties_in_bbox(south: float, west: float, north: float, east: float,
+                               cursor: Optional[str] = None, limit: int = PAGE_SIZE) -> Dict[str, Any]:
+        """A page of the properties inside a bounding box (west > east crosses the antimeridian)"""
+        if south > north:
+            raise ValueError("south must not be greater than north")
+        after = decode_cursor(cursor, 1) or [None]
+        session = db.get_session()
+        try:
+            result = session.run(
+                queries.PROPERTIES_IN_BBOX,
+                lower_left=WGS84Point((west, south)), upper_right=WGS84Point((east, north)),
+                after_id=after[0], limit=limit + 1
+            )
+            properties = []
+            keys = []
+            for record in result:
+                properties.append(PropertyService._geo_property(record['node']))
+                keys.append([record['property_id']])
+            return _page(properties, keys, limit)
+        finally:
+            session.close()
+    
+    @staticmethod
+    def _participants_page(session, property_url: str, cursor: Optional[str] = None,
+                           limit: int = PAGE_SIZE) -> Dict[str, Any]:
+        """One page of the people and organizations involved in deals with a property"""
+        after = decode_cursor(cursor, 1) or [None]
+        participants_result = session.run(
+            queries.PROPERTY_PARTICIPANTS_PAGE,
+            url=property_url, after_id=after[0], limit=limit + 1
+        )
+        
+        participants = []
+        keys = []
+        for record in participants_result:
+            participant_node = record['node']
+            node_type = record['nodeType']
+            participant_type = node_type[0] if node_type else 'Unknown'
+            
+            participant = Participant(
+                _id=participant_node.id,
+                name=participant_node.get('name'),
+                type=participant_type,
+                role=record.get('role'),
+                url=participant_node.get('url')
+            )
+            participants.append(participant)
+            keys.append([record['participant_id']])
+        
+        return _page(participants, keys, limit)
+    
+    @staticmethod
+    def _deals_page(session, property_url: str, cursor: Optional[str] = None,
+                    limit: int = PAGE_SIZE) -> Dict[str, Any]:
+        """One page of the deals involving a property, newest first"""
+        after = decode_cursor(cursor, 2) or [None, None]
+        deals_result = session.run(
+            queries.PROPERTY_DEALS_PAGE,
+            url=property_url, after_date=after[0], after_id=after[1], limit=limit + 1
+        )
+        
+        deals = []
+        keys = []
+        for record in deals_result:
+            url = record.get('url') or ''
+            parsed = parse_deal_url(url)
+            
+            deal = Deal(
+                _id=record['deal_id'],
+                property=record.get('property') or parsed['property'],
+                url=url,
+                date=record.get('date') or parsed['date'],
+                price_per_square_foot=record.get('price_per_square_foot'),
+                floors=record.get('floors'),
+                term_years=record.get('term_years'),
+                square_feet=record.get('square_feet'),
+                type=record.get('type') or parsed['type'],
+                acquirer_stake=record.get('acquirer_stake'),
+                price=record.get('price'),
+                amount=record.get('amount'),
+                financing_types=record.get('financing_types'),
+                interest_rate=record.get('interest_rate'),
+                structure=record.get('structure'),
+                fixed_vs_floating=record.get('fixed_vs_floating')
+            )
+            deals.append(deal)
+            keys.append([record['sort_date'], record['deal_id']])
+        
+        return _page(deals, keys, limit)
+    
+    @staticmethod
+    def _get_page(page_fn, property_url: str, cursor: Optional[str], limit: int) -> Optional[Dict[str, Any]]:
+        session = db.get_session()
+        try:
+            exists = lookups.node_id("Property", property_url) is not None or session.run(
+                queries.PROPERTY_EXISTS, url=property_url
+            ).single()
+            if not exists:
+                return None
+            return page_fn(session, property_url, cursor, limit)
+        finally:
+            session.close()
+    
+    @staticmethod
+    @cached(by_url=True)
+    @coalesced
+    def get_property_participants(property_url: str, cursor: Optional[str] = None,
+                                  limit: int = PAGE_SIZE) -> Optional[Dict[str, Any]]:
+        """Get a page of the participants in deals with a property by URL"""
+        return PropertyService._get_page(PropertyService._participants_page, property_url, cursor, limit)
+    
+    @staticmethod
+    @cached(by_url=True)
+    @coalesced
+    def get_property_deals(property_url: str, cursor: Optional[str] = None,
+                           limit: int = PAGE_SIZE) -> Optional[Dict[str, Any]]:
+        """Get a page of the deals involving a property by URL"""
+        return PropertyService._get_page(PropertyService._deals_page, property_url, cursor, limit)
+    
+    @staticmethod
+    @cached(by_url=True)
+    @coalesced
+    def get_property_detail(property_url: str, include: Optional[List[str]] = None):
+        """Get detailed information about a property by URL, querying only the sub-collections in `include`"""
+        includes = PROPERTY_INCLUDES if include is None else include
+        session = db.get_session()
+        try:
+            # Get property by URL along with the number of deals and distinct participants
+            prop_result = session.run(queries.PROPERTY_DETAIL, url=property_url)
             prop_node = prop_result.single()
             
             if not prop_node:
@@ -708,98 +1107,49 @@ class PropertyService:
             
             node = prop_node['node']
             
-            # Get deals (Deal -[:INVOLVES]-> Property)
-            deals_result = session.run("""
-                MATCH (d:Deal)-[:INVOLVES]->(pr:Property)
-                WHERE pr.url = $url
-                RETURN d as node
-            """, url=property_url)
-            
-            deals = []
-            for record in deals_result:
-                deal_node = record['node']
-                url = deal_node.get('url', '')
-                parsed = parse_deal_url(url)
-                
-                deal = Deal(
-                    _id=deal_node.id,
-                    property=deal_node.get('property') or parsed['property'],
-                    url=url,
-                    date=deal_node.get('date') or parsed['date'],
-                    price_per_square_foot=deal_node.get('price per square foot'),
-                    floors=deal_node.get('floors'),
-                    term_years=deal_node.get('term years'),
-                    square_feet=deal_node.get('square feet'),
-                    type=deal_node.get('type') or parsed['type'],
-                    acquirer_stake=deal_node.get('acquirer stake'),
-                    price=deal_node.get('price'),
-                    amount=deal_node.get('amount'),
-                    financing_types=deal_node.get('financing types'),
-                    interest_rate=deal_node.get('interest rate'),
-                    structure=deal_node.get('structure'),
-                    fixed_vs_floating=deal_node.get('fixed vs floating')
-                )
-                deals.append(deal)
+            # Get the first page of deals (Deal -[:INVOLVES]-> Property), newest first
+            deals_page = EMPTY_PAGE
+            if 'deals' in includes:
+                deals_page = PropertyService._deals_page(session, property_url)
             
             # Get stories (Story -[:MENTIONED_IN]-> Property or Property -[:MENTIONED_IN]-> Story)
-            stories_result = session.run("""
-                MATCH (s:Story)-[:MENTIONED_IN]->(pr:Property)
-                WHERE pr.url = $url
-                RETURN s as node
-            """, url=property_url)
-            
             stories = []
-            for record in stories_result:
-                story_node = record['node']
-                story = Story(
-                    _id=story_node.id,
-                    title=story_node.get('title', ''),
-                    source=story_node.get('source', ''),
-                    url=story_node.get('url', '')
-                )
-                stories.append(story)
-            
-            # Get participants (people and organizations) involved in deals with this property
-            participants_result = session.run("""
-                MATCH (participant)-[r:PARTICIPATED_IN]->(d:Deal)-[:INVOLVES]->(pr:Property)
-                WHERE pr.url = $url
-                WITH participant, labels(participant) as nodeType, COLLECT(DISTINCT r.role) as roles
-                RETURN DISTINCT participant as node, nodeType,
-                       CASE 
-                           WHEN ANY(role IN roles WHERE role IS NOT NULL) 
-                           THEN [role IN roles WHERE role IS NOT NULL][0]
-                           ELSE NULL
-                       END as role
-            """, url=property_url)
-            
-            participants = []
-            for record in participants_result:
-                participant_node = record['node']
-                node_type = record['nodeType']
-                participant_type = node_type[0] if node_type else 'Unknown'
-                
-                participant = Participant(
-                    _id=participant_node.id,
-                    name=participant_node.get('name'),
-                    type=participant_type,
-                    role=record.get('role'),
-                    url=participant_node.get('url')
-                )
-                participants.append(participant)
-            
-            return PropertyDetail(
+            if 'stories' in includes:
+                stories_result = session.run(queries.PROPERTY_STORIES, url=property_url)
+                for record in stories_result:
+                    story_node = record['node']
+                    story = Story(
+                        _id=story_node.id,
+                        title=story_node.get('title', ''),
+                        source=story_node.get('source', ''),
+                        url=story_node.get('url', '')
+                    )
+                    stories.append(story)
+            
+            # Get the first page of participants (people and organizations) involved in deals with this property
+            participants_page = EMPTY_PAGE
+            if 'participants' in includes:
+                participants_page = PropertyService._participants_page(session, property_url)
+            
+            property_detail = PropertyDetail(
                 _id=node.id,
                 address=node.get('address', ''),
                 url=node.get('url', ''),
                 name=node.get('name'),
-                type=node.get('Type'),
-                square_feet=node.get('Square Feet'),
-                year_built=node.get('Year Built'),
-                credifi_score=node.get('CrediFi Score'),
-                deals=deals,
+                type=node.get('type'),
+                square_feet=node.get('square_feet'),
+                year_built=node.get('year_built'),
+                credifi_score=node.get('credifi_score'),
+                **_coordinates(node),
+                deals=deals_page['data'],
                 stories=stories,
-                participants=participants
+                participants=participants_page['data'],
+                deal_count=prop_node['deal_count'],
+                participant_count=prop_node['participant_count'],
+                deals_next_cursor=deals_page['next_cursor'],
+                participants_next_cursor=participants_page['next_cursor']
             )
+            return _without_collections(property_detail, include, PROPERTY_INCLUDES)
         finally:
             session.close()
 
@@ -808,24 +1158,22 @@ class StoryService:
     """Service for Story operations"""
     
     @staticmethod
+    @cached(list_tag("Story"))
     def get_all_stories(page: int = 1, limit: int = 12) -> Dict[str, Any]:
         """Get paginated list of stories"""
         session = db.get_session()
         try:
             skip = (page - 1) * limit
             
-            # Get total count
-            count_result = session.run("MATCH (s:Story) RETURN count(s) as total")
-            total = count_result.single()['total']
+            # Get total count, from the lookup tables while fresh
+            total = lookups.count("Story")
+            if total is None:
+                count_result = session.run(queries.COUNT_BY_LABEL["Story"])
+                total = count_result.single()['total']
+                lookups.set_count("Story", total)
             
             # Get paginated data
-            query = f"""
-            MATCH (s:Story)
-            RETURN s as node
-            SKIP {skip}
-            LIMIT {limit}
-            """
-            result = session.run(query)
+            result = session.run(queries.LIST_STORIES, skip=skip, limit=limit)
             
             stories = []
             for record in result:
@@ -846,3 +1194,225 @@ class StoryService:
             }
         finally:
             session.close()
+    
+    @staticmethod
+    @cached(list_tag("Story"), url_params=("person", "organization", "property"))
+    def get_story_timeline(person: Optional[str] = None, organization: Optional[str] = None,
+                           property: Optional[str] = None, from_date: Optional[date] = None,
+                           to_date: Optional[date] = None, cursor: Optional[str] = None,
+                           limit: int = PAGE_SIZE) -> Dict[str, Any]:
+        """
+        A page of dated stories, newest first, optionally around one person,
+        organization or property (by URL) and within [from_date, to_date].
+        """
+        anchors = {name: url for name, url in
+                   (("person", person), ("organization", organization), ("property", property)) if url}
+        if len(anchors) > 1:
+            raise ValueError("Filter by at most one of person, organization or property")
+        
+        after = decode_cursor(cursor, 2)
+        if after:
+            try:
+                until, after_id = date.fromisoformat(after[0]), int(after[1])
+            except (TypeError, ValueError):
+                raise ValueError("Invalid cursor")
+        else:
+            until, after_id = to_date or date.max, 2 ** 63 - 1
+        from_date = from_date or date.min
+        if from_date > until:
+            return {**EMPTY_PAGE, "limit": limit}
+        
+        params = dict(from_date=from_date, until=until, after_id=after_id, limit=limit + 1)
+        session = db.get_session()
+        try:
+            if anchors:
+                (anchor, url), = anchors.items()
+                result = session.run(queries.STORY_TIMELINE_BY_ANCHOR[anchor], anchor=url, **params)
+            else:
+                result = session.run(queries.STORY_TIMELINE, **params)
+            
+            stories = []
+            keys = []
+            for record in result:
+                node = record['node']
+                published_on = str(record['published_on'])
+                stories.append(Story(
+                    _id=node.id,
+                    title=node.get('title', ''),
+                    source=node.get('source', ''),
+                    url=node.get('url', ''),
+                    published_on=published_on
+                ))
+                keys.append([published_on, record['story_id']])
+            
+            return _page(stories, keys, limit)
+        finally:
+            session.close()
+
+
+class DashboardService:
+    """Service for the home page summary, read from the snapshot data_tools writes after each ingest"""
+    
+    # (refreshed_at, parsed payload) of the last snapshot read, so an unchanged snapshot is not re-parsed
+    _cached: Optional[tuple] = None
+    
+    @staticmethod
+    @cached(AGGREGATE)
+    @coalesced
+    def get_summary() -> Optional[Dict[str, Any]]:
+        """Get the dashboard summary, or None if no snapshot has been built yet"""
+        session = db.get_session()
+        try:
+            record = session.run(queries.DASHBOARD_SNAPSHOT, key="summary").single()
+        finally:
+            session.close()
+        if not record or not record['payload']:
+            return None
+        
+        cached = DashboardService._cached
+        if cached is None or cached[0] != record['refreshed_at']:
+            summary = {**json.loads(record['payload']), "refreshed_at": record['refreshed_at']}
+            cached = DashboardService._cached = (record['refreshed_at'], summary)
+        return cached[1]
+
+
+class GraphService:
+    """Service for multi-hop graph traversal"""
+    
+    @staticmethod
+    def _node_record(node) -> Dict[str, Any]:
+        return {
+            "type": "node",
+            "id": node.id,
+            "labels": list(node.labels),
+            "properties": dict(node)
+        }
+    
+    @staticmethod
+    def _edge_record(rel) -> Dict[str, Any]:
+        return {
+            "type": "edge",
+            "id": rel.id,
+            "label": rel.type,
+            "source": rel.start_node.id,
+            "target": rel.end_node.id,
+            "properties": dict(rel)
+        }
+    
+    @staticmethod
+    def get_neighborhood(url: str, depth: int = 2, limit: int = 200,
+                         fanout: int = 25) -> Optional[Iterator[Dict[str, Any]]]:
+        """
+        Breadth-first walk from the node with the given URL. Returns None if the
+        node does not exist, otherwise an iterator of node/edge records produced
+        hop by hop while Neo4j streams them. Each node expands at most `fanout`
+        relationships and the walk stops after `limit` nodes.
+        """
+        # The walk outlives the request handler, so it gets its own session
+        session = db.new_session()
+        try:
+            # One index-backed lookup per label instead of an unlabeled scan
+            root_result = session.run(queries.NODE_BY_URL, url=url)
+            root = root_result.single()
+        except Exception:
+            session.close()
+            raise
+        
+        if not root:
+            session.close()
+            return None
+        
+        return GraphService._walk(session, root['node'], depth, limit, fanout)
+    
+    @staticmethod
+    def _walk(session, root, depth: int, limit: int, fanout: int) -> Iterator[Dict[str, Any]]:
+        try:
+            seen_nodes = {root.id}
+            seen_edges = set()
+            frontier = [root.id]
+            truncated = False
+            yield GraphService._node_record(root)
+            
+            for _ in range(depth):
+                if not frontier or truncated:
+                    break
+                result = session.stream(queries.NEIGHBORHOOD_HOP, frontier=frontier, fanout=fanout)
+                
+                next_frontier = []
+                for record in result:
+                    node = record['node']
+                    if node.id not in seen_nodes:
+                        if len(seen_nodes) >= limit:
+                            truncated = True
+                            break
+                        seen_nodes.add(node.id)
+                        next_frontier.append(node.id)
+                        yield GraphService._node_record(node)
+                    
+                    rel = record['rel']
+                    if rel.id not in seen_edges:
+                        seen_edges.add(rel.id)
+                        yield GraphService._edge_record(rel)
+                frontier = next_frontier
+            
+            yield {
+                "type": "summary",
+                "nodes": len(seen_nodes),
+                "edges": len(seen_edges),
+                "truncated": truncated
+            }
+        finally:
+            session.close()
+
+
+# Labels that can be exported, keyed by the lowercase name or collection name used in URLs
+EXPORT_LABELS = {
+    "person": "Person", "people": "Person",
+    "deal": "Deal", "deals": "Deal",
+    "organization": "Organization", "organizations": "Organization",
+    "property": "Property", "properties": "Property",
+    "story": "Story", "stories": "Story",
+}
+
+
+class ExportService:
+    """Service for bulk export of whole node collections"""
+    
+    @staticmethod
+    def resolve_label(label: str) -> Optional[str]:
+        return EXPORT_LABELS.get(label.lower())
+    
+    @staticmethod
+    def get_property_keys(label: str) -> List[str]:
+        """
+        Get the union of property keys stored on nodes with the given label.
+        This scans the whole label, so it runs under the stream timeout like
+        the export it prepares rather than the read timeout.
+        """
+        session = db.new_session()
+        try:
+            result = session.stream(queries.PROPERTY_KEYS_BY_LABEL[label])
+            return [record['key'] for record in result]
+        finally:
+            session.close()
+    
+    @staticmethod
+    def stream_nodes(label: str, include_relationships: bool = False) -> Iterator[tuple]:
+        """
+        Yield (id, properties, relationships) for every node with the given label
+        straight from the result cursor. The driver fetches records in batches,
+        so memory stays constant regardless of the collection size.
+        """
+        if include_relationships:
+            query = queries.EXPORT_NODES_WITH_RELATIONSHIPS_BY_LABEL[label]
+        else:
+            query = queries.EXPORT_NODES_BY_LABEL[label]
+        
+        # Streamed after the handler returns, so it cannot borrow the request session
+        session = db.new_session()
+        try:
+            result = session.stream(query)
+            for record in result:
+                yield record['node_id'], record['props'], record['relationships']
+        finally:
+            session.close()
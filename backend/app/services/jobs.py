@@ -0,0 +1,309 @@
+"""
+Background jobs for graph maintenance.
+
+Constraints, the denormalized co-participation counts, dedup and the
+analytics and lookup caches are rebuilt by jobs on a small worker pool
+(JOB_WORKERS), never on the request path. A job is identified by its task
+and parameters: submitting one that is already queued or running returns
+that job instead of starting a second copy, and every task is written to be
+re-run from the start. Tasks report progress as done/total steps plus a
+message, which /api/jobs exposes.
+"""
+import json
+import logging
+import re
+import sqlite3
+import subprocess
+import sys
+import threading
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.database import db
+from app.models.schemas import JobStatus
+from app.services import queries
+from app.services.analytics import GROUPS, METRICS, AnalyticsService
+from app.services.cache import record_changes, response_cache
+from app.services.lookup import lookups
+from app.warmup import warm_up
+
+logger = logging.getLogger(__name__)
+
+QUEUED, RUNNING, SUCCEEDED, FAILED = "queued", "running", "succeeded", "failed"
+LOG_LINES = 50
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class Job:
+    """One submitted task, updated by its worker"""
+
+    def __init__(self, task: str, params: Dict[str, Any]):
+        self.id = uuid.uuid4().hex[:12]
+        self.task = task
+        self.params = params
+        self.key = (task, json.dumps(params, sort_keys=True, default=str))
+        self.state = QUEUED
+        self.done = 0
+        self.total: Optional[int] = None
+        self.message: Optional[str] = None
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.log: deque = deque(maxlen=LOG_LINES)
+        self.created_at = _now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+
+    def progress(self, done: int, total: Optional[int] = None, message: Optional[str] = None):
+        self.done = done
+        if total is not None:
+            self.total = total
+        if message is not None:
+            self.message = message
+
+    def note(self, line: str):
+        self.log.append(line)
+
+    def status(self) -> JobStatus:
+        return JobStatus(
+            id=self.id, task=self.task, params=self.params, state=self.state,
+            done=self.done, total=self.total, message=self.message,
+            result=self.result, error=self.error, log=list(self.log),
+            created_at=self.created_at, started_at=self.started_at, finished_at=self.finished_at
+        )
+
+
+# ------------------------------
+# Tasks: fn(job, **params) -> result
+# ------------------------------
+def apply_constraints(job: Job) -> Dict[str, int]:
+    """Run every statement of the data_tools constraints file; they all use IF NOT EXISTS"""
+    with open(settings.CONSTRAINTS_FILE) as f:
+        text = re.sub(r"^\s*//.*$", "", f.read(), flags=re.MULTILINE)
+    statements = [s.strip() for s in text.split(";") if s.strip()]
+    session = db.new_write_session()
+    try:
+        for i, statement in enumerate(statements):
+            job.progress(i, len(statements), statement.split("\n")[0])
+            session.write(statement)
+        job.progress(len(statements), len(statements), "done")
+    finally:
+        session.close()
+    return {"statements": len(statements)}
+
+
+def rebuild_co_participation(job: Job, batch_size: int = 500) -> Dict[str, int]:
+    """
+    Recount every CO_PARTICIPATED relationship from the PARTICIPATED_IN edges.
+    Partner lists keep serving the old counts until the new ones are swapped
+    in, and only then are pairs that no longer share a deal deleted. Holds the
+    graph writer lock throughout, so no ingest or dedup run adds counts the
+    swap would overwrite; fails at once if one of them holds it.
+    """
+    rebuild = uuid.uuid4().hex
+    session = db.new_write_session()
+    try:
+        with _writer_lock(session, f"co_participation:{job.id}") as heartbeat:
+            return _rebuild_co_participation(job, session, rebuild, batch_size, heartbeat)
+    finally:
+        session.close()
+
+
+def _rebuild_co_participation(job: Job, session, rebuild: str, batch_size: int,
+                              heartbeat: Callable[[], None]) -> Dict[str, int]:
+    deal_urls = [record['url'] for record in session.run(queries.DEAL_URLS)]
+    pairs = 0
+    for start in range(0, len(deal_urls), batch_size):
+        batch = deal_urls[start:start + batch_size]
+        pairs += session.write(
+            queries.CO_PARTICIPATION_COUNT_BATCH, deal_urls=batch, rebuild=rebuild
+        ).single()['pairs']
+        heartbeat()
+        job.progress(start + len(batch), len(deal_urls), f"{pairs} pairs counted")
+
+    swapped = 0
+    for start in range(0, len(deal_urls), batch_size):
+        batch = deal_urls[start:start + batch_size]
+        swapped += session.write(
+            queries.CO_PARTICIPATION_SWAP_BATCH, deal_urls=batch, rebuild=rebuild
+        ).single()['swapped']
+        heartbeat()
+        job.progress(start + len(batch), len(deal_urls), f"swapped {swapped} counts")
+
+    deleted = session.stream(
+        queries.CO_PARTICIPATION_DELETE_STALE, rebuild=rebuild, batch_size=batch_size
+    ).single()['deleted']
+    job.progress(len(deal_urls), len(deal_urls), f"deleted {deleted} stale relationships")
+
+    # Partner lists are served from these counts: a new graph version in the
+    # change log drops them in every worker, not just this one
+    version = session.write(queries.BUMP_GRAPH_VERSION).single()['version']
+    try:
+        logged = record_changes(version, [("CO_PARTICIPATED", "*")])
+    except sqlite3.Error as e:
+        logger.warning("Could not log co-participation rebuild as version %s: %s", version, e)
+        logged = False
+    if not logged:
+        response_cache.clear()
+    return {"deals": len(deal_urls), "pairs": pairs, "swapped": swapped, "deleted": deleted}
+
+
+@contextmanager
+def _writer_lock(session, holder: str):
+    """Hold the graph writer lock data_tools ingests take; yields a heartbeat to call between batches"""
+    session.write(queries.WRITER_LOCK_EXPIRE, stale=settings.WRITER_LOCK_STALE_SECONDS)
+    current = session.write(queries.WRITER_LOCK_ACQUIRE, holder=holder).single()['holder']
+    if current != holder:
+        raise RuntimeError(f"{current} is writing to the graph; retry once it finishes")
+    try:
+        yield lambda: session.write(queries.WRITER_LOCK_REFRESH, holder=holder)
+    finally:
+        session.write(queries.WRITER_LOCK_RELEASE, holder=holder)
+
+
+def run_dedup(job: Job, dry_run: bool = False) -> Dict[str, Any]:
+    """Run data_tools/dedup.py, which merges duplicates, recounts their deals and logs the changes"""
+    command = [sys.executable, "dedup.py"] + (["--dry-run"] if dry_run else [])
+    job.progress(0, 1, " ".join(command[1:]))
+    process = subprocess.Popen(command, cwd=settings.DATA_TOOLS_DIR, stdout=subprocess.PIPE,
+                               stderr=subprocess.STDOUT, text=True)
+    for line in process.stdout:
+        job.note(line.rstrip())
+        job.message = line.strip() or job.message
+    if process.wait() != 0:
+        raise RuntimeError(f"dedup.py exited with status {process.returncode}")
+    job.progress(1, 1)
+    return {"output": list(job.log)[-5:]}
+
+
+def refresh_analytics(job: Job) -> Dict[str, int]:
+    """Reload the analytics columns and precompute the default trend and distribution of every metric"""
+    AnalyticsService.reset()
+    calls: List[Tuple[str, Callable[[], Any]]] = []
+    for metric in METRICS:
+        calls.append((f"trend {metric}", lambda metric=metric: AnalyticsService.get_trend(metric=metric)))
+        for group in GROUPS:
+            calls.append((f"distribution {metric} by {group}",
+                          lambda metric=metric, group=group: AnalyticsService.get_distribution(metric=metric, by=group)))
+    for i, (name, call) in enumerate(calls):
+        job.progress(i, len(calls), name)
+        call()
+    job.progress(len(calls), len(calls), "done")
+    return {"results": len(calls)}
+
+
+def reload_lookups(job: Job) -> Dict[str, int]:
+    """Reload the url -> id, organization name and count lookup tables"""
+    session = db.new_session()
+    try:
+        lookups.load(session)
+    finally:
+        session.close()
+    job.progress(1, 1)
+    return lookups.stats()
+
+
+def run_warmup(job: Job) -> Dict[str, Any]:
+    """Reload the lookup tables and re-run the hot queries, as on startup"""
+    report = warm_up()
+    job.progress(1, 1)
+    return {"seconds": report.get("seconds"), "errors": report.get("errors")}
+
+
+# task -> (function, description, {param: type})
+TASKS: Dict[str, Tuple[Callable[..., Any], str, Dict[str, type]]] = {
+    "constraints": (apply_constraints, "Create missing constraints and indexes", {}),
+    "co_participation": (rebuild_co_participation, "Recount CO_PARTICIPATED deal counts", {"batch_size": int}),
+    "dedup": (run_dedup, "Merge duplicate people and organizations", {"dry_run": bool}),
+    "analytics": (refresh_analytics, "Reload and precompute market analytics", {}),
+    "lookups": (reload_lookups, "Reload the lookup tables", {}),
+    "warmup": (run_warmup, "Re-run the startup warmup", {}),
+}
+
+
+def _params(task: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    allowed = TASKS[task][2]
+    checked = {}
+    for name, value in (params or {}).items():
+        if name not in allowed:
+            raise ValueError(f"Unknown parameter for {task}: {name}")
+        if allowed[name] is bool and isinstance(value, str):
+            value = value.lower() in ("1", "true", "yes")
+        try:
+            checked[name] = allowed[name](value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid {name} for {task}: {value!r}")
+    return checked
+
+
+class JobManager:
+    """Queue of maintenance jobs run by a worker pool, with the last JOB_HISTORY jobs kept for inspection"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._active: Dict[tuple, Job] = {}
+
+    def submit(self, task: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Job, bool]:
+        """Queue a job; returns (job, created), where an identical queued or running job is reused"""
+        if task not in TASKS:
+            raise ValueError(f"Unknown task: {task}")
+        job = Job(task, _params(task, params))
+        with self._lock:
+            existing = self._active.get(job.key)
+            if existing is not None:
+                return existing, False
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=settings.JOB_WORKERS, thread_name_prefix="job")
+            self._active[job.key] = job
+            self._jobs[job.id] = job
+            while len(self._jobs) > settings.JOB_HISTORY:
+                oldest = next(iter(self._jobs.values()))
+                if oldest.state in (QUEUED, RUNNING):
+                    break
+                del self._jobs[oldest.id]
+            self._executor.submit(self._run, job)
+        return job, True
+
+    def _run(self, job: Job):
+        fn = TASKS[job.task][0]
+        job.state = RUNNING
+        job.started_at = _now()
+        try:
+            job.result = fn(job, **job.params)
+            job.state = SUCCEEDED
+        except Exception as e:
+            logger.exception("Job %s (%s) failed", job.id, job.task)
+            job.error = str(e)
+            job.state = FAILED
+        finally:
+            job.finished_at = _now()
+            with self._lock:
+                self._active.pop(job.key, None)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def recent(self, state: Optional[str] = None, limit: int = 50) -> List[Job]:
+        """Most recent jobs first"""
+        jobs = [job for job in reversed(self._jobs.values()) if state is None or job.state == state]
+        return jobs[:limit]
+
+    def shutdown(self):
+        """Stop taking work; running jobs finish, queued ones are dropped"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Singleton instance
+jobs = JobManager()
@@ -0,0 +1,88 @@
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from app.config import settings
+from app.services import queries
+
+
+class LookupTables:
+    """Small, hot maps read from the graph at startup: url -> id, org name -> url and label counts"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._url_ids: Dict[str, Dict[str, int]] = {}
+        self._org_urls: Dict[str, str] = {}
+        self._counts: Dict[str, tuple] = {}
+        self.loaded_at: Optional[float] = None
+
+    def load(self, session):
+        """Fill every table from the graph; labels larger than LOOKUP_MAX_ROWS only get a count"""
+        url_ids = {}
+        counts = {}
+        for label in queries.LABELS:
+            total = session.run(queries.COUNT_BY_LABEL[label]).single()['total']
+            counts[label] = (total, time.time())
+            if total > settings.LOOKUP_MAX_ROWS:
+                continue
+            result = session.run(queries.URL_IDS_BY_LABEL[label])
+            url_ids[label] = {record['url']: record['id'] for record in result}
+
+        result = session.run(queries.ORGANIZATION_NAMES, limit=settings.LOOKUP_MAX_ROWS)
+        org_urls = {record['name'].lower(): record['url'] for record in result}
+
+        with self._lock:
+            self._url_ids = url_ids
+            self._org_urls = org_urls
+            self._counts = counts
+            self.loaded_at = time.time()
+
+    def node_id(self, label: str, url: str) -> Optional[int]:
+        """Node id for a URL; None means unknown here, not absent from the graph"""
+        return self._url_ids.get(label, {}).get(url)
+
+    def org_url(self, name: str) -> Optional[str]:
+        return self._org_urls.get(name.lower())
+
+    def count(self, label: str) -> Optional[int]:
+        """Cached node count for a label, or None once it is older than LOOKUP_TTL_SECONDS"""
+        entry = self._counts.get(label)
+        if entry is None or time.time() - entry[1] > settings.LOOKUP_TTL_SECONDS:
+            return None
+        return entry[0]
+
+    def set_count(self, label: str, total: int):
+        with self._lock:
+            self._counts[label] = (total, time.time())
+
+    def forget(self, changes: Iterable[Tuple[str, str]]):
+        """
+        Drop what a batch of (label, url) changes may have made stale: those
+        URLs' ids and organization names, and the counts of their labels.
+        Callers fall back to the graph until the next load.
+        """
+        changes = list(changes)
+        org_urls = {url for label, url in changes if label == "Organization"}
+        with self._lock:
+            for label, url in changes:
+                self._url_ids.get(label, {}).pop(url, None)
+                self._counts.pop(label, None)
+            if org_urls:
+                self._org_urls = {name: url for name, url in self._org_urls.items() if url not in org_urls}
+
+    def clear(self):
+        with self._lock:
+            self._url_ids = {}
+            self._org_urls = {}
+            self._counts = {}
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "urls": sum(len(ids) for ids in self._url_ids.values()),
+            "organizations": len(self._org_urls),
+            "labels": len(self._counts),
+        }
+
+
+# Singleton instance
+lookups = LookupTables()
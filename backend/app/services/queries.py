@@ -0,0 +1,630 @@
+"""
+Every Cypher query the backend runs, defined once.
+
+Values always travel as $parameters so that each constant is a single query
+text and Neo4j plans it once. Labels cannot be parameters, so per-label
+queries are generated below from the fixed LABELS list; that still yields a
+bounded set of texts.
+"""
+
+
+LABELS = ["Person", "Deal", "Organization", "Property", "Story"]
+
+
+# People
+
+LIST_PEOPLE = """
+    MATCH (p:Person)
+    RETURN p as node
+    SKIP $skip
+    LIMIT $limit
+"""
+
+RECENT_PEOPLE = """
+    MATCH (p:Person)-[:PARTICIPATED_IN]->(d:Deal)
+    WITH p, d
+    ORDER BY d.date DESC
+    WITH p, collect(d)[0] as latest_deal
+    RETURN p as node
+    LIMIT $limit
+"""
+
+PERSON_EXISTS = "MATCH (p:Person) WHERE p.url = $url RETURN id(p) as id"
+
+PERSON_DETAIL = """
+    MATCH (p:Person) WHERE p.url = $url
+    CALL { WITH p MATCH (p)-[:PARTICIPATED_IN]->(d:Deal) RETURN count(DISTINCT d) as deal_count }
+    RETURN p as node, deal_count
+"""
+
+PERSON_DEALS_PAGE = """
+    MATCH (p:Person)-[r:PARTICIPATED_IN]->(d:Deal)
+    WHERE p.url = $url
+    WITH d, collect(r.role) as roles,
+         CASE 
+             WHEN d.date IS NOT NULL AND d.date <> '' 
+             THEN substring(d.date, 6, 4) + '-' + substring(d.date, 0, 2) + '-' + substring(d.date, 3, 2)
+             ELSE '0000-00-00'
+         END as sort_date
+    WHERE $after_date IS NULL OR sort_date < $after_date
+          OR (sort_date = $after_date AND id(d) < $after_id)
+    RETURN d.url as url, d.property as property, d.date as date, 
+           d.type as type, [role IN roles WHERE role IS NOT NULL][0] as role,
+           [(d)-[:INVOLVES]->(pr:Property) | pr.address][0] as property_address,
+           id(d) as deal_id, sort_date
+    ORDER BY sort_date DESC, deal_id DESC
+    LIMIT $limit
+"""
+
+PERSON_ORGANIZATIONS = """
+    MATCH (p:Person)-[r:WORKS_FOR]->(o:Organization)
+    WHERE p.url = $url
+    RETURN o as node, r.role as role
+"""
+
+PERSON_STORIES = """
+    MATCH (p:Person)-[:MENTIONED_IN]->(s:Story)
+    WHERE p.url = $url
+    RETURN s as node
+"""
+
+PERSON_PARTNERS = """
+    MATCH (p:Person)
+    WHERE p.url = $url
+    OPTIONAL MATCH (p)-[c:CO_PARTICIPATED]-(partner)
+    WHERE $type IS NULL OR $type IN labels(partner)
+    WITH partner, labels(partner) as nodeType, c.deals as shared_deals
+    ORDER BY shared_deals DESC
+    LIMIT $limit
+    RETURN partner as node, nodeType, shared_deals
+"""
+
+# Broker leaderboard over the BrokerScore cells data_tools maintains. "*" in
+# type, region or month selects a rollup cell; with equality on those three,
+# the (type, region, month, metric) range indexes return cells already in
+# metric order.
+LEADERBOARD_BY_METRIC = {
+    metric: f"""
+    MATCH (s:BrokerScore)
+    WHERE s.type = $type AND s.region = $region AND s.month = '*'
+          AND ($after_score IS NULL OR s.{metric} < $after_score
+               OR (s.{metric} = $after_score AND s.person_url > $after_url))
+    WITH s
+    ORDER BY s.{metric} DESC, s.person_url
+    LIMIT $limit
+    MATCH (p:Person) WHERE p.url = s.person_url
+    RETURN p as node, s.deals as deals, s.volume as volume, s.activity as activity,
+           s.{metric} as score
+"""
+    for metric in ("deals", "volume", "activity")
+}
+
+# Since a month: the monthly cells from $since_month on ('*' sorts before any month), summed per person
+LEADERBOARD_SINCE_BY_METRIC = {
+    metric: f"""
+    MATCH (s:BrokerScore)
+    WHERE s.type = $type AND s.region = $region AND s.month >= $since_month
+    WITH s.person_url as person_url, sum(s.deals) as deals, sum(s.volume) as volume,
+         sum(s.activity) as activity
+    WITH person_url, deals, volume, activity, {metric} as score
+    WHERE $after_score IS NULL OR score < $after_score
+          OR (score = $after_score AND person_url > $after_url)
+    ORDER BY score DESC, person_url
+    LIMIT $limit
+    MATCH (p:Person) WHERE p.url = person_url
+    RETURN p as node, deals, volume, activity, score
+"""
+    for metric in ("deals", "volume", "activity")
+}
+
+
+# Deals
+
+LIST_DEALS = """
+    MATCH (d:Deal)
+    WITH d,
+         CASE 
+             WHEN d.date IS NOT NULL AND d.date <> '' 
+             THEN substring(d.date, 6, 4) + '-' + substring(d.date, 0, 2) + '-' + substring(d.date, 3, 2)
+             ELSE '0000-00-00'
+         END as sort_date
+    RETURN d as node
+    ORDER BY sort_date DESC
+    SKIP $skip
+    LIMIT $limit
+"""
+
+RECENT_DEALS = """
+    MATCH (d:Deal)
+    WITH d,
+         CASE 
+             WHEN d.date IS NOT NULL AND d.date <> '' 
+             THEN substring(d.date, 6, 4) + '-' + substring(d.date, 0, 2) + '-' + substring(d.date, 3, 2)
+             ELSE '0000-00-00'
+         END as sort_date
+    RETURN d as node
+    ORDER BY sort_date DESC
+    LIMIT $limit
+"""
+
+# Sparse variants take the node property names to read as $keys, so any field set shares one plan
+LIST_DEALS_FIELDS = """
+    MATCH (d:Deal)
+    WITH d,
+         CASE 
+             WHEN d.date IS NOT NULL AND d.date <> '' 
+             THEN substring(d.date, 6, 4) + '-' + substring(d.date, 0, 2) + '-' + substring(d.date, 3, 2)
+             ELSE '0000-00-00'
+         END as sort_date
+    ORDER BY sort_date DESC
+    SKIP $skip
+    LIMIT $limit
+    RETURN id(d) as id, d.url as url, [key IN $keys | d[key]] as values
+"""
+
+RECENT_DEALS_FIELDS = """
+    MATCH (d:Deal)
+    WITH d,
+         CASE 
+             WHEN d.date IS NOT NULL AND d.date <> '' 
+             THEN substring(d.date, 6, 4) + '-' + substring(d.date, 0, 2) + '-' + substring(d.date, 3, 2)
+             ELSE '0000-00-00'
+         END as sort_date
+    ORDER BY sort_date DESC
+    LIMIT $limit
+    RETURN id(d) as id, d.url as url, [key IN $keys | d[key]] as values
+"""
+
+DEAL_FIELDS_BY_URL = """
+    MATCH (d:Deal) WHERE d.url = $url
+    RETURN id(d) as id, d.url as url, [key IN $keys | d[key]] as values
+"""
+
+DEAL_BY_URL = "MATCH (d:Deal) WHERE d.url = $url RETURN d as node"
+
+DEAL_PARTICIPANTS = """
+    MATCH (participant)-[r:PARTICIPATED_IN]->(d:Deal)
+    WHERE d.url = $url
+    WITH participant, labels(participant) as nodeType, COLLECT(r.role) as roles
+    RETURN participant as node, nodeType, 
+           CASE 
+               WHEN ANY(role IN roles WHERE role IS NOT NULL) 
+               THEN [role IN roles WHERE role IS NOT NULL][0]
+               ELSE NULL
+           END as role
+"""
+
+DEAL_PROPERTIES = """
+    MATCH (d:Deal)-[:INVOLVES]->(pr:Property)
+    WHERE d.url = $url
+    RETURN pr as node
+"""
+
+DEAL_STORIES = """
+    MATCH (s:Story)-[:MENTIONED_IN]->(d:Deal)
+    WHERE d.url = $url
+    RETURN s as node
+"""
+
+
+# Organizations
+
+LIST_ORGANIZATIONS = """
+    MATCH (o:Organization)
+    RETURN o as node
+    SKIP $skip
+    LIMIT $limit
+"""
+
+RECENT_ORGANIZATIONS = """
+    MATCH (o:Organization)-[r:PARTICIPATED_IN]->(d:Deal)
+    RETURN DISTINCT o as node
+    LIMIT $limit
+"""
+
+ORGANIZATION_EXISTS = "MATCH (o:Organization) WHERE o.url = $url RETURN id(o) as id"
+
+ORGANIZATION_DETAIL = """
+    MATCH (o:Organization) WHERE o.url = $url
+    CALL { WITH o MATCH (o)<-[:WORKS_FOR]-(p:Person) RETURN count(DISTINCT p) as member_count }
+    CALL { WITH o MATCH (o)-[:PARTICIPATED_IN]->(d:Deal) RETURN count(DISTINCT d) as deal_count }
+    CALL {
+        WITH o
+        MATCH (o)<-[:WORKS_FOR]-(:Person)-[:MENTIONED_IN]->(s:Story)
+        WITH DISTINCT s
+        LIMIT $count_limit
+        RETURN count(s) as story_count
+    }
+    RETURN o as node, member_count, deal_count, story_count
+"""
+
+ORGANIZATION_MEMBERS_PAGE = """
+    MATCH (p:Person)-[r:WORKS_FOR]->(o:Organization)
+    WHERE o.url = $url AND ($after_id IS NULL OR id(p) > $after_id)
+    WITH p, collect(r.role) as roles
+    RETURN p as node, [role IN roles WHERE role IS NOT NULL][0] as role, id(p) as person_id
+    ORDER BY person_id
+    LIMIT $limit
+"""
+
+ORGANIZATION_DEALS_PAGE = """
+    MATCH (o:Organization)-[r:PARTICIPATED_IN]->(d:Deal)
+    WHERE o.url = $url
+    WITH d, collect(r.role) as roles,
+         CASE 
+             WHEN d.date IS NOT NULL AND d.date <> '' 
+             THEN substring(d.date, 6, 4) + '-' + substring(d.date, 0, 2) + '-' + substring(d.date, 3, 2)
+             ELSE '0000-00-00'
+         END as sort_date
+    WHERE $after_date IS NULL OR sort_date < $after_date
+          OR (sort_date = $after_date AND id(d) < $after_id)
+    RETURN d.url as url, d.property as property, d.date as date, d.type as type,
+           d.price as price, d.square_feet as square_feet,
+           [role IN roles WHERE role IS NOT NULL][0] as role,
+           id(d) as deal_id, sort_date
+    ORDER BY sort_date DESC, deal_id DESC
+    LIMIT $limit
+"""
+
+ORGANIZATION_STORIES_PAGE = """
+    MATCH (o:Organization)<-[:WORKS_FOR]-(p:Person)
+    WHERE o.url = $url
+    CALL {
+        WITH p
+        MATCH (p)-[:MENTIONED_IN]->(s:Story)
+        WITH s, coalesce(toString(s.published_on), '') as sort_date
+        WHERE $after_date IS NULL OR sort_date < $after_date
+              OR (sort_date = $after_date AND id(s) < $after_id)
+        RETURN s, sort_date
+        ORDER BY sort_date DESC, id(s) DESC
+        LIMIT $limit
+    }
+    WITH DISTINCT s, sort_date
+    RETURN s.title as title, s.source as source, s.url as url, sort_date, id(s) as story_id
+    ORDER BY sort_date DESC, story_id DESC
+    LIMIT $limit
+"""
+
+
+# Properties
+
+LIST_PROPERTIES = """
+    MATCH (pr:Property)<-[:INVOLVES]-(d:Deal)
+    WITH pr, max(d.date) as latest_date
+    RETURN pr as node
+    ORDER BY latest_date DESC
+    SKIP $skip
+    LIMIT $limit
+"""
+
+RECENT_PROPERTIES = """
+    MATCH (pr:Property)<-[:INVOLVES]-(d:Deal)
+    WITH pr, max(d.date) as latest_date
+    RETURN pr as node
+    ORDER BY latest_date DESC
+    LIMIT $limit
+"""
+
+PROPERTY_EXISTS = "MATCH (pr:Property) WHERE pr.url = $url RETURN id(pr) as id"
+
+PROPERTY_DETAIL = """
+    MATCH (pr:Property) WHERE pr.url = $url
+    CALL {
+        WITH pr
+        MATCH (participant)-[:PARTICIPATED_IN]->(:Deal)-[:INVOLVES]->(pr)
+        RETURN count(DISTINCT participant) as participant_count
+    }
+    CALL { WITH pr MATCH (d:Deal)-[:INVOLVES]->(pr) RETURN count(DISTINCT d) as deal_count }
+    RETURN pr as node, participant_count, deal_count
+"""
+
+PROPERTY_PARTICIPANTS_PAGE = """
+    MATCH (participant)-[r:PARTICIPATED_IN]->(d:Deal)-[:INVOLVES]->(pr:Property)
+    WHERE pr.url = $url AND ($after_id IS NULL OR id(participant) > $after_id)
+    WITH participant, labels(participant) as nodeType, COLLECT(DISTINCT r.role) as roles
+    RETURN participant as node, nodeType,
+           [role IN roles WHERE role IS NOT NULL][0] as role,
+           id(participant) as participant_id
+    ORDER BY participant_id
+    LIMIT $limit
+"""
+
+PROPERTY_DEALS_PAGE = """
+    MATCH (d:Deal)-[:INVOLVES]->(pr:Property)
+    WHERE pr.url = $url
+    WITH DISTINCT d,
+         CASE 
+             WHEN d.date IS NOT NULL AND d.date <> '' 
+             THEN substring(d.date, 6, 4) + '-' + substring(d.date, 0, 2) + '-' + substring(d.date, 3, 2)
+             ELSE '0000-00-00'
+         END as sort_date
+    WHERE $after_date IS NULL OR sort_date < $after_date
+          OR (sort_date = $after_date AND id(d) < $after_id)
+    RETURN d.url as url, d.property as property, d.date as date, d.type as type,
+           d.price as price, d.price_per_square_foot as price_per_square_foot,
+           d.square_feet as square_feet, d.floors as floors, d.term_years as term_years,
+           d.acquirer_stake as acquirer_stake, d.amount as amount,
+           d.financing_types as financing_types, d.interest_rate as interest_rate,
+           d.structure as structure, d.fixed_vs_floating as fixed_vs_floating,
+           id(d) as deal_id, sort_date
+    ORDER BY sort_date DESC, deal_id DESC
+    LIMIT $limit
+"""
+
+PROPERTY_STORIES = """
+    MATCH (s:Story)-[:MENTIONED_IN]->(pr:Property)
+    WHERE pr.url = $url
+    RETURN s as node
+"""
+
+
+# Properties around a point or inside a box, over the property_location point
+# index. $center and the corners are WGS-84 points; $radius is in meters.
+PROPERTIES_NEAR = """
+    MATCH (pr:Property)
+    WHERE point.distance(pr.location, $center) <= $radius
+    WITH pr, point.distance(pr.location, $center) as distance
+    WHERE $after_distance IS NULL OR distance > $after_distance
+          OR (distance = $after_distance AND id(pr) > $after_id)
+    RETURN pr as node, distance, id(pr) as property_id
+    ORDER BY distance, property_id
+    LIMIT $limit
+"""
+
+PROPERTIES_IN_BBOX = """
+    MATCH (pr:Property)
+    WHERE point.withinBBox(pr.location, $lower_left, $upper_right)
+          AND ($after_id IS NULL OR id(pr) > $after_id)
+    RETURN pr as node, id(pr) as property_id
+    ORDER BY property_id
+    LIMIT $limit
+"""
+
+
+# Stories
+
+LIST_STORIES = """
+    MATCH (s:Story)
+    RETURN s as node
+    SKIP $skip
+    LIMIT $limit
+"""
+
+# Newest first over the story_published_on range index: the bounds make it a
+# range seek, the index supplies the order and only equal dates need sorting
+# by id. Without a cursor $until is the upper date bound and $after_id is
+# larger than any id.
+STORY_TIMELINE = """
+    MATCH (s:Story)
+    WHERE s.published_on >= $from_date AND s.published_on <= $until
+          AND (s.published_on < $until OR id(s) < $after_id)
+    RETURN s as node, s.published_on as published_on, id(s) as story_id
+    ORDER BY published_on DESC, story_id DESC
+    LIMIT $limit
+"""
+
+# The same page for the stories around one node, found by its url
+STORY_TIMELINE_BY_ANCHOR = {
+    anchor: f"""
+    {match}
+    WITH DISTINCT s
+    WHERE s.published_on >= $from_date AND s.published_on <= $until
+          AND (s.published_on < $until OR id(s) < $after_id)
+    RETURN s as node, s.published_on as published_on, id(s) as story_id
+    ORDER BY published_on DESC, story_id DESC
+    LIMIT $limit
+"""
+    for anchor, match in {
+        "person": "MATCH (p:Person)-[:MENTIONED_IN]->(s:Story) WHERE p.url = $anchor",
+        "organization": "MATCH (o:Organization)<-[:WORKS_FOR]-(:Person)-[:MENTIONED_IN]->(s:Story) WHERE o.url = $anchor",
+        "property": "MATCH (s:Story)-[:MENTIONED_IN]->(pr:Property) WHERE pr.url = $anchor",
+    }.items()
+}
+
+
+# Dashboard
+
+DASHBOARD_SNAPSHOT = """
+    MATCH (s:DashboardSnapshot) WHERE s.key = $key
+    RETURN s.payload as payload, toString(s.refreshed_at) as refreshed_at
+"""
+
+
+# Analytics
+
+GRAPH_VERSION = "MATCH (m:GraphMeta) WHERE m.key = $key RETURN m.version as version"
+
+# Same bump as a data_tools ingest, for graph-wide rewrites made by jobs
+BUMP_GRAPH_VERSION = """
+    MERGE (m:GraphMeta {key: 'graph'})
+    SET m.version = coalesce(m.version, 0) + 1, m.updated_at = datetime()
+    RETURN m.version as version
+"""
+
+DEAL_ANALYTICS_COLUMNS = """
+    MATCH (d:Deal)
+    WHERE d.closed_on IS NOT NULL
+    CALL {
+        WITH d
+        OPTIONAL MATCH (d)-[:INVOLVES]->(pr:Property)
+        RETURN head(collect(pr.type)) as property_type
+    }
+    RETURN d.closed_on.year * 12 + d.closed_on.month - 1 as month_index,
+           d.type as deal_type, property_type,
+           d.price_value as price_value,
+           d.price_per_square_foot_value as price_per_square_foot_value,
+           d.square_feet_value as square_feet_value
+"""
+
+
+# Graph
+
+NODE_BY_URL = """
+    CALL {
+        MATCH (n:Person {url: $url}) RETURN n
+        UNION MATCH (n:Deal {url: $url}) RETURN n
+        UNION MATCH (n:Organization {url: $url}) RETURN n
+        UNION MATCH (n:Property {url: $url}) RETURN n
+        UNION MATCH (n:Story {url: $url}) RETURN n
+    }
+    RETURN n as node
+    LIMIT 1
+"""
+
+NEIGHBORHOOD_HOP = """
+    UNWIND $frontier AS node_id
+    MATCH (n) WHERE id(n) = node_id
+    CALL {
+        WITH n
+        MATCH (n)-[r:PARTICIPATED_IN|INVOLVES|WORKS_FOR|MENTIONED_IN]-(m)
+        RETURN r, m
+        LIMIT $fanout
+    }
+    RETURN r as rel, m as node
+"""
+
+
+# Per-label queries
+
+COUNT_BY_LABEL = {label: f"MATCH (n:{label}) RETURN count(n) as total" for label in LABELS}
+
+URL_IDS_BY_LABEL = {
+    label: f"MATCH (n:{label}) WHERE n.url IS NOT NULL RETURN n.url as url, id(n) as id"
+    for label in LABELS
+}
+
+SAMPLE_URL_BY_LABEL = {
+    label: f"MATCH (n:{label}) WHERE n.url IS NOT NULL RETURN n.url as url LIMIT 1"
+    for label in LABELS
+}
+
+ORGANIZATION_NAMES = """
+    MATCH (o:Organization)
+    WHERE o.name IS NOT NULL AND o.url IS NOT NULL
+    RETURN o.name as name, o.url as url
+    LIMIT $limit
+"""
+
+
+# Export
+
+PROPERTY_KEYS_BY_LABEL = {
+    label: f"""
+    MATCH (n:{label})
+    UNWIND keys(n) AS key
+    RETURN DISTINCT key
+    ORDER BY key
+"""
+    for label in LABELS
+}
+
+EXPORT_NODES_BY_LABEL = {
+    label: f"""
+    MATCH (n:{label})
+    RETURN id(n) as node_id, properties(n) as props, null as relationships
+"""
+    for label in LABELS
+}
+
+EXPORT_NODES_WITH_RELATIONSHIPS_BY_LABEL = {
+    label: f"""
+    MATCH (n:{label})
+    CALL {{
+        WITH n
+        MATCH (n)-[r:PARTICIPATED_IN|INVOLVES|WORKS_FOR|MENTIONED_IN]-(m)
+        RETURN collect({{
+            type: type(r),
+            direction: CASE WHEN startNode(r) = n THEN 'out' ELSE 'in' END,
+            label: labels(m)[0],
+            url: m.url,
+            role: r.role
+        }}) as relationships
+    }}
+    RETURN id(n) as node_id, properties(n) as props, relationships
+"""
+    for label in LABELS
+}
+
+
+# Maintenance jobs (run in write transactions, see app/services/jobs.py)
+
+DEAL_URLS = "MATCH (d:Deal) RETURN d.url as url ORDER BY url"
+
+# A rebuild recounts every pair into c.rebuild_deals under the rebuild's id
+# while readers keep seeing the old c.deals, then swaps the counts in and
+# deletes the edges it did not reach. Edges new to the rebuild show their
+# first count until the swap.
+CO_PARTICIPATION_COUNT_BATCH = """
+    UNWIND $deal_urls AS deal_url
+    MATCH (d:Deal {url: deal_url})
+    OPTIONAL MATCH (x)-[:PARTICIPATED_IN]->(d)
+    WITH d, collect(DISTINCT x) AS parts
+    SET d.co_participants_counted = [x IN parts | x.url]
+    WITH parts
+    UNWIND parts AS a
+    UNWIND parts AS b
+    WITH a, b
+    WHERE a.url < b.url
+    MERGE (a)-[c:CO_PARTICIPATED]->(b)
+    SET c.rebuild_deals = CASE WHEN c.rebuild = $rebuild THEN c.rebuild_deals + 1 ELSE 1 END,
+        c.rebuild = $rebuild
+    SET c.deals = coalesce(c.deals, c.rebuild_deals)
+    RETURN count(c) as pairs
+"""
+
+# Swapped from the same deal batches that were counted, so each batch only
+# touches the pairs of its own deals
+CO_PARTICIPATION_SWAP_BATCH = """
+    UNWIND $deal_urls AS deal_url
+    MATCH (a)-[:PARTICIPATED_IN]->(:Deal {url: deal_url})<-[:PARTICIPATED_IN]-(b)
+    WHERE a.url < b.url
+    MATCH (a)-[c:CO_PARTICIPATED]->(b)
+    WHERE c.rebuild = $rebuild AND c.rebuild_deals IS NOT NULL
+    WITH DISTINCT c
+    SET c.deals = c.rebuild_deals
+    REMOVE c.rebuild_deals
+    RETURN count(c) as swapped
+"""
+
+# Stale pairs share no deal any more, so only a scan finds them: one pass,
+# committed every $batch_size deletes. Needs an auto-commit transaction.
+CO_PARTICIPATION_DELETE_STALE = """
+    MATCH ()-[c:CO_PARTICIPATED]->()
+    WHERE c.rebuild IS NULL OR c.rebuild <> $rebuild
+    CALL { WITH c DELETE c } IN TRANSACTIONS OF $batch_size ROWS
+    RETURN count(*) as deleted
+"""
+
+# Graph writer lock shared with data_tools ingests and dedup runs (see
+# data_tools/main.py): a WriterLock node under a uniqueness constraint.
+WRITER_LOCK_EXPIRE = """
+    MATCH (l:WriterLock {key: 'graph'})
+    WHERE l.heartbeat < datetime() - duration({seconds: $stale})
+    DELETE l
+"""
+
+WRITER_LOCK_ACQUIRE = """
+    MERGE (l:WriterLock {key: 'graph'})
+    ON CREATE SET l.holder = $holder, l.heartbeat = datetime()
+    RETURN l.holder as holder
+"""
+
+WRITER_LOCK_REFRESH = """
+    MATCH (l:WriterLock {key: 'graph', holder: $holder})
+    SET l.heartbeat = datetime()
+"""
+
+WRITER_LOCK_RELEASE = """
+    MATCH (l:WriterLock {key: 'graph', holder: $holder})
+    DELETE l
+"""
+
+
+# Debug
+
+DEBUG_DEAL_PROPERTIES = """
+    MATCH (d:Deal)
+    WITH d, keys(d) as props
+    RETURN props, d
+    LIMIT 5
+"""
@@ -0,0 +1,143 @@
+"""
+Request coalescing for service calls.
+
+While a call is in flight, identical calls (same function and arguments)
+made from other threads or tasks wait for it and share its result instead
+of running the same queries again. An exception is raised in each waiter as
+its own copy, chained to the original, so waiters never add to one shared
+traceback. A call abandoned by its caller (cancelled, interrupted) fails
+nobody else: one of the waiters runs it instead. Nothing is kept once the
+call returns; caching is app/services/cache.py's job. Each call is counted
+as executed or coalesced in the metrics registry.
+"""
+import asyncio
+import copy
+import functools
+import inspect
+import threading
+from typing import Any, Awaitable, Callable, Dict
+
+from app.metrics import metrics
+
+
+def _hashable(value: Any) -> Any:
+    return tuple(value) if isinstance(value, list) else value
+
+
+def call_key(fn: Callable, args: tuple, kwargs: Dict[str, Any]) -> tuple:
+    """Identity of a service call; list arguments (fieldsets) compare by value"""
+    return (fn.__qualname__, tuple(_hashable(a) for a in args),
+            tuple(sorted((k, _hashable(v)) for k, v in kwargs.items())))
+
+
+# Result of a call whose caller went away before it finished
+_ABANDONED = object()
+
+
+def _for_waiter(error: Exception) -> Exception:
+    """A copy of a shared call's exception for one waiter to raise"""
+    try:
+        copied = copy.copy(error)
+    except Exception:
+        copied = RuntimeError(f"coalesced call failed: {error!r}")
+    return copied
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Exception = None
+
+
+class SingleFlight:
+    """In-flight calls by key, for threads (do) and for tasks on an event loop (do_async)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[tuple, _Call] = {}
+        self._futures: Dict[tuple, asyncio.Future] = {}
+
+    def do(self, key: tuple, fn: Callable[[], Any]) -> Any:
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = self._calls[key] = _Call()
+            if leader:
+                break
+            call.done.wait()
+            if call.value is _ABANDONED:
+                continue
+            metrics.observe_service_call(key[0], "coalesced")
+            if call.error is not None:
+                raise _for_waiter(call.error) from call.error
+            return call.value
+
+        metrics.observe_service_call(key[0], "executed")
+        try:
+            call.value = fn()
+            return call.value
+        except Exception as e:
+            call.error = e
+            raise
+        except BaseException:
+            call.value = _ABANDONED
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key: tuple, fn: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        # Futures belong to one loop, so calls on different loops never share
+        loop_key = (id(loop), key)
+        while True:
+            future = self._futures.get(loop_key)
+            if future is None:
+                break
+            try:
+                # A waiter that is cancelled must not cancel the shared call
+                value = await asyncio.shield(future)
+            except Exception as e:
+                metrics.observe_service_call(key[0], "coalesced")
+                raise _for_waiter(e) from e
+            if value is not _ABANDONED:
+                metrics.observe_service_call(key[0], "coalesced")
+                return value
+
+        metrics.observe_service_call(key[0], "executed")
+        future = self._futures[loop_key] = loop.create_future()
+        try:
+            value = await fn()
+            future.set_result(value)
+            return value
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # retrieved here, so an unawaited future logs nothing
+            raise
+        except BaseException:
+            # Cancelled or interrupted: the next waiter runs the call itself
+            future.set_result(_ABANDONED)
+            raise
+        finally:
+            del self._futures[loop_key]
+
+
+flights = SingleFlight()
+
+
+def coalesced(fn: Callable) -> Callable:
+    """Make concurrent identical calls of a sync or async service function share one execution"""
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            return await flights.do_async(call_key(fn, args, kwargs), lambda: fn(*args, **kwargs))
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        return flights.do(call_key(fn, args, kwargs), lambda: fn(*args, **kwargs))
+    return wrapper
@@ -0,0 +1,82 @@
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.config import settings
+
+
+# Missing values in date columns, as written by data_tools/snapshot.py
+MISSING_DAY = np.iinfo(np.int32).min
+
+
+class Snapshot:
+    """
+    One version of the columnar graph snapshot written by data_tools/snapshot.py.
+    Columns are memory-mapped .npy files, so reading one copies nothing until
+    its pages are touched and every worker process shares the page cache.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        with open(os.path.join(directory, "manifest.json")) as f:
+            self.manifest = json.load(f)
+        self.version = self.manifest["version"]
+
+    def _column(self, table: str, column: str) -> Dict[str, Any]:
+        tables = {**self.manifest["labels"], **self.manifest["relationships"]}
+        if table not in tables:
+            raise KeyError(f"Snapshot has no table {table}")
+        return tables[table]["columns"].get(column)
+
+    def _load(self, filename: str) -> np.ndarray:
+        return np.load(os.path.join(self.directory, filename), mmap_mode="r")
+
+    def rows(self, table: str) -> int:
+        return {**self.manifest["labels"], **self.manifest["relationships"]}[table]["rows"]
+
+    def ints(self, table: str, column: str) -> np.ndarray:
+        """An id column: node ids, or src/dst of a relationship type"""
+        return self._load(self._column(table, column)["files"]["values"])
+
+    def numbers(self, table: str, column: str) -> np.ndarray:
+        """A float64 column, NaN where missing; all-NaN if no row has the property"""
+        entry = self._column(table, column)
+        if entry is None or entry["kind"] != "float64":
+            return np.full(self.rows(table), np.nan)
+        return self._load(entry["files"]["values"])
+
+    def dates(self, table: str, column: str) -> np.ndarray:
+        """An int32 column of days since 1970-01-01, MISSING_DAY where missing"""
+        entry = self._column(table, column)
+        if entry is None or entry["kind"] != "date":
+            return np.full(self.rows(table), MISSING_DAY, dtype=np.int32)
+        return self._load(entry["files"]["values"])
+
+    def categories(self, table: str, column: str) -> Tuple[List[str], np.ndarray]:
+        """The dictionary and int32 codes (-1 where missing) of a dictionary-encoded string column"""
+        entry = self._column(table, column)
+        if entry is None or entry["kind"] != "dictionary":
+            return [], np.full(self.rows(table), -1, dtype=np.int32)
+        return entry["dictionary"], self._load(entry["files"]["values"])
+
+
+_lock = threading.Lock()
+_current: Dict[str, Any] = {}
+
+
+def load_snapshot() -> Optional[Snapshot]:
+    """The snapshot named by SNAPSHOT_DIR/CURRENT, reopened when data_tools points it at a new version"""
+    path = os.path.join(settings.SNAPSHOT_DIR, "CURRENT")
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    with _lock:
+        if _current.get("mtime") != mtime:
+            with open(path) as f:
+                name = f.read().strip()
+            _current.update(mtime=mtime, snapshot=Snapshot(os.path.join(settings.SNAPSHOT_DIR, name)))
+        return _current["snapshot"]
@@ -0,0 +1,92 @@
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.database import db
+from app.services.entity_service import (
+    PersonService, DealService, OrganizationService, PropertyService, StoryService, DashboardService
+)
+from app.services import queries
+from app.services.analytics import AnalyticsService
+from app.services.lookup import lookups
+
+logger = logging.getLogger(__name__)
+
+# Outcome of the last warmup, exposed on /health
+warmup_report: Dict[str, Any] = {"state": "pending"}
+
+
+def _sample_url(session, label: str) -> Optional[str]:
+    result = session.run(queries.SAMPLE_URL_BY_LABEL[label]).single()
+    return result['url'] if result else None
+
+
+def _hot_calls(samples: Dict[str, Optional[str]]) -> List[Tuple[str, Callable[[], Any]]]:
+    """The service calls behind the busiest routes, bound to one real URL per label"""
+    calls = [
+        ("people", PersonService.get_all_people),
+        ("people_recent", PersonService.get_people_with_recent_deals),
+        ("deals", DealService.get_all_deals),
+        ("deals_recent", DealService.get_recent_deals),
+        ("organizations", OrganizationService.get_all_organizations),
+        ("organizations_recent", OrganizationService.get_recent_organizations),
+        ("properties", PropertyService.get_all_properties),
+        ("properties_recent", PropertyService.get_recent_properties),
+        ("stories", StoryService.get_all_stories),
+        ("dashboard", DashboardService.get_summary),
+        ("analytics_trend", AnalyticsService.get_trend),
+    ]
+    detail_calls = [
+        ("person_detail", "Person", PersonService.get_person_detail),
+        ("person_partners", "Person", PersonService.get_person_partners),
+        ("deal_detail", "Deal", DealService.get_deal_detail),
+        ("organization_detail", "Organization", OrganizationService.get_organization_detail),
+        ("property_detail", "Property", PropertyService.get_property_detail),
+    ]
+    for name, label, fn in detail_calls:
+        url = samples.get(label)
+        if url:
+            calls.append((name, lambda fn=fn, url=url: fn(url)))
+    return calls
+
+
+def warm_up() -> Dict[str, Any]:
+    """
+    Load the lookup tables and run each hot query once, so Neo4j has cached
+    their plans and touched their pages before the instance takes traffic.
+    Failures are logged and reported, never raised.
+    """
+    started = time.perf_counter()
+    report: Dict[str, Any] = {"state": "running", "queries": {}, "errors": []}
+    warmup_report.clear()
+    warmup_report.update(report)
+
+    session = db.new_session()
+    try:
+        lookups.load(session)
+        report["lookups"] = lookups.stats()
+        report["lookup_seconds"] = round(time.perf_counter() - started, 3)
+        samples = {label: _sample_url(session, label) for label in ("Person", "Deal", "Organization", "Property")}
+    except Exception as e:
+        logger.warning("Warmup could not load lookup tables: %s", e)
+        report["errors"].append(f"lookups: {e}")
+        samples = {}
+    finally:
+        session.close()
+
+    for name, call in _hot_calls(samples):
+        call_started = time.perf_counter()
+        try:
+            call()
+        except Exception as e:
+            report["errors"].append(f"{name}: {e}")
+            continue
+        report["queries"][name] = round(time.perf_counter() - call_started, 3)
+
+    report["seconds"] = round(time.perf_counter() - started, 3)
+    report["state"] = "done"
+    warmup_report.clear()
+    warmup_report.update(report)
+    logger.info("Warmup finished in %.2fs (%d hot calls, %d errors)",
+                report["seconds"], len(report["queries"]), len(report["errors"]))
+    return report
@@ -0,0 +1,198 @@
+"""In-memory stand-in for the Neo4j driver used by `run_bench --fake`.
+
+The fake does not interpret Cypher. Every query returns a few records whose
+fields are synthesized from the requested key names ('node', 'deal_id',
+'total', ...), with node properties borrowed from the synthetic generator.
+Everything above the driver therefore runs for real: services, record
+handling, pydantic models, FastAPI and JSON encoding. The numbers give the
+framework-side floor and catch regressions in that code. Use a live Neo4j
+for anything that depends on query plans.
+"""
+import itertools
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+from benchmarks import generate_graph as gen
+
+
+DEFAULT_ROWS = 20
+MAX_ROWS = 100
+NODE_KEYS = {"node", "n", "m", "p", "d", "o", "pr", "s", "partner"}
+
+
+def _canonical(props: Dict[str, Any]) -> Dict[str, Any]:
+    """Scraper keys as data_tools ingest stores them ('Square Feet' -> 'square_feet')"""
+    return {re.sub(r"[^0-9a-z]+", "_", k.strip().lower()).strip("_"): v for k, v in props.items()}
+
+
+def _typed_deal(props: Dict[str, Any]) -> Dict[str, Any]:
+    """The numeric copies data_tools ingest adds to deals"""
+    def number(value):
+        digits = re.sub(r"[^0-9.]", "", value or "")
+        return float(digits) if digits else None
+    return {
+        "price_value": number(props.get("price")),
+        "price_per_square_foot_value": number(props.get("price_per_square_foot")),
+        "square_feet_value": number(props.get("square_feet")),
+    }
+
+
+def _property_pool(size: int = 256) -> List[Dict[str, Any]]:
+    """Node property maps that carry the union of person, deal and property fields"""
+    shape = gen.Shape(size * 4, seed=1)
+    people = itertools.islice(gen.people(shape), size)
+    deals = itertools.islice(gen.deals(shape), size)
+    props = itertools.islice(gen.properties(shape), size)
+    pool = []
+    for (person_url, person), (deal_url, deal), (_, prop) in zip(people, deals, props):
+        node = _canonical({**prop, **deal["info"], **deal["details"], **person["basic_info"], **person["story_details"][0]})
+        node["url"] = deal_url if len(pool) % 2 else person_url
+        node["published_on"] = node["date"]
+        node.update(_typed_deal(node))
+        pool.append(node)
+    return pool
+
+
+class FakeNode(dict):
+    def __init__(self, node_id: int, properties: Dict[str, Any], label: str = "Person"):
+        super().__init__(properties)
+        self.id = node_id
+        self.element_id = str(node_id)
+        self.labels = frozenset([label])
+
+
+class FakeRelationship(dict):
+    def __init__(self, rel_id: int, start: FakeNode, end: FakeNode):
+        super().__init__(role="Broker")
+        self.id = rel_id
+        self.element_id = str(rel_id)
+        self.type = "PARTICIPATED_IN"
+        self.start_node = start
+        self.end_node = end
+
+
+class FakeRecord:
+    """Record that answers any key with a plausibly typed value"""
+
+    def __init__(self, index: int, pool: List[Dict[str, Any]], keys: Optional[List[str]] = None,
+                 holder: Optional[str] = None):
+        self._index = index
+        self._props = pool[index % len(pool)]
+        self._pool = pool
+        self._keys = keys or []
+        self._holder = holder
+
+    def _node(self) -> FakeNode:
+        return FakeNode(self._index, self._props)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in NODE_KEYS:
+            return self._node()
+        if key == "rel":
+            return FakeRelationship(self._index, self._node(), FakeNode(self._index + 1, self._props))
+        if key == "nodeType":
+            return ["Person"]
+        if key == "values":
+            # Sparse queries project the property names passed as $keys
+            return [self._props.get(k) for k in self._keys]
+        if key == "props":
+            return dict(self._props)
+        if key == "payload":
+            # The dashboard snapshot data_tools writes, sized like the home page
+            rows = [{"_id": i, **self._pool[i % len(self._pool)]} for i in range(20)]
+            return json.dumps({"recent_deals": rows, "recent_properties": rows, "top_brokers": rows,
+                               "top_organizations": rows, "deal_volume": [], "counts": {}})
+        if key == "refreshed_at":
+            return "2024-01-15T00:00:00Z"
+        if key in ("relationships", "roles"):
+            return []
+        if key == "id" or key.endswith("_id"):
+            return self._index
+        if key == "total" or key.endswith("_count") or key == "shared_deals":
+            return 1000 + self._index
+        if key in ("deals", "volume", "activity", "score", "distance"):
+            return 1000 - self._index
+        if key == "month_index":
+            return 2015 * 12 + self._index % 120
+        if key in ("deleted", "pairs", "swapped"):
+            return 0
+        if key == "version":
+            return 1
+        if key == "holder":
+            # The graph writer lock is always free
+            return self._holder
+        if key == "sort_date":
+            return "2024-01-15"
+        return self._props.get(key, f"{key}-{self._index}")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key]
+
+    def data(self, *keys) -> Dict[str, Any]:
+        return {"node": dict(self._props)}
+
+
+class FakeResult:
+    def __init__(self, records: List[FakeRecord]):
+        self._records = records
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def single(self, strict: bool = False):
+        return self._records[0] if self._records else None
+
+    def data(self, *keys):
+        return [record.data() for record in self._records]
+
+    def consume(self):
+        return None
+
+
+class FakeSession:
+    def __init__(self, driver: "FakeDriver"):
+        self._driver = driver
+
+    def run(self, query: str, parameters=None, **kwargs) -> FakeResult:
+        params = {**(parameters or {}), **kwargs}
+        rows = min(int(params.get("limit") or DEFAULT_ROWS), MAX_ROWS)
+        start = next(self._driver.ids) * MAX_ROWS
+        keys = params.get("keys")
+        return FakeResult([FakeRecord(start + i, self._driver.pool, keys, params.get("holder"))
+                           for i in range(rows)])
+
+    def execute_read(self, work, *args, **kwargs):
+        return work(self, *args, **kwargs)
+
+    execute_write = execute_read
+
+    def last_bookmarks(self):
+        return None
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class FakeDriver:
+    def __init__(self):
+        self.pool = _property_pool()
+        self.ids = itertools.count()
+
+    def session(self, **kwargs) -> FakeSession:
+        return FakeSession(self)
+
+    def close(self):
+        pass
+
+
+def install():
+    """Swap the application's Neo4j driver for the in-memory fake"""
+    from app.database import db
+    db._driver = FakeDriver()
@@ -0,0 +1,236 @@
+"""Synthetic graph generator producing the JSON files data_tools/main.py ingests.
+
+Writes persons.json, deals.json and properties.json to --out. Every relationship
+is derived from invertible index arithmetic instead of lookup tables, so the
+generator streams entries to disk and runs in constant memory from 10k up to
+10M nodes.
+
+    python -m benchmarks.generate_graph --nodes 100000 --out ../scrape_gen/data
+    cd ../data_tools && DATA_DIR=../scrape_gen/data python main.py
+"""
+import argparse
+import json
+import os
+import random
+from typing import Dict, Iterator, List, Tuple
+
+
+STREETS = ["Main St", "Broadway", "Park Ave", "Madison Ave", "Market St", "Oak Rd",
+           "Elm St", "Lexington Ave", "Ocean Dr", "Sunset Blvd", "Michigan Ave", "Pine St"]
+CITIES = [("New York", "NY"), ("Brooklyn", "NY"), ("Jersey City", "NJ"), ("Newark", "NJ"),
+          ("Miami", "FL"), ("Chicago", "IL"), ("Los Angeles", "CA"), ("Dallas", "TX"),
+          ("Boston", "MA"), ("Seattle", "WA"), ("Atlanta", "GA"), ("Denver", "CO")]
+PROPERTY_TYPES = ["Office", "Retail", "Multifamily", "Industrial", "Hotel", "Mixed Use", "Land"]
+DEAL_TYPES = ["sale", "lease", "financing"]
+ROLES = ["Buyer", "Seller", "Tenant", "Landlord", "Lender", "Borrower", "Broker"]
+ORG_TYPES = ["Brokerage", "Investor", "Lender", "Developer", "Owner"]
+FIRST_NAMES = ["James", "John", "Robert", "Michael", "William", "David", "Richard", "Joseph",
+               "Mary", "Patricia", "Jennifer", "Linda", "Elizabeth", "Susan", "Jessica", "Sarah"]
+LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+              "Wilson", "Anderson", "Taylor", "Moore", "Martin", "Lee", "Clark", "Lewis"]
+SOURCES = ["The Real Deal", "Commercial Observer", "Bisnow", "GlobeSt", "Crain's"]
+
+# Share of the requested node count per label
+MIX = {"people": 0.40, "deals": 0.30, "properties": 0.15, "organizations": 0.05, "stories": 0.10}
+PEOPLE_PER_DEAL = 3
+STORIES_PER_PERSON = 2
+
+
+class Shape:
+    """Entity counts plus the index arithmetic that links them"""
+
+    def __init__(self, nodes: int, seed: int):
+        self.seed = seed
+        self.people = max(10, int(nodes * MIX["people"]))
+        self.deals = max(10, int(nodes * MIX["deals"]))
+        self.properties = max(10, int(nodes * MIX["properties"]))
+        self.organizations = max(5, int(nodes * MIX["organizations"]))
+        self.stories = max(5, int(nodes * MIX["stories"]))
+        # Multipliers coprime with the people count give a cheap invertible shuffle
+        self._step = self._coprime(self.people, 7919)
+        self._step_inverse = pow(self._step, -1, self.people)
+        self._offset = self._coprime(self.people, 104729)
+
+    @staticmethod
+    def _coprime(n: int, start: int) -> int:
+        from math import gcd
+        value = start % n or 1
+        while gcd(value, n) != 1:
+            value += 1
+        return value
+
+    def rng(self, *key) -> random.Random:
+        # String seeds are hashed deterministically, unlike hash() on tuples of str
+        return random.Random(":".join(map(str, (self.seed,) + key)))
+
+    def deal_people(self, deal: int) -> List[int]:
+        return [(deal * self._step + slot * self._offset) % self.people for slot in range(PEOPLE_PER_DEAL)]
+
+    def person_deals(self, person: int) -> Iterator[int]:
+        """Inverse of deal_people"""
+        for slot in range(PEOPLE_PER_DEAL):
+            base = ((person - slot * self._offset) * self._step_inverse) % self.people
+            yield from range(base, self.deals, self.people)
+
+    def zipf_org(self, *key) -> int:
+        # Cubing a uniform draw concentrates deals on a few large firms (supernodes)
+        return int(self.organizations * self.rng("org", *key).random() ** 3)
+
+    def person_org(self, person: int) -> int:
+        return self.zipf_org("person", person)
+
+    def deal_property(self, deal: int) -> int:
+        return (deal * 31 + deal // self.properties) % self.properties
+
+    def person_stories(self, person: int) -> List[int]:
+        return [(person * STORIES_PER_PERSON + i) % self.stories for i in range(STORIES_PER_PERSON)]
+
+
+def slug(text: str) -> str:
+    return "-".join(text.lower().replace(",", "").split())
+
+
+def person_name(shape: Shape, i: int) -> str:
+    rng = shape.rng("person", i)
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {i}"
+
+
+def person_url(shape: Shape, i: int) -> str:
+    return f"/people/{slug(person_name(shape, i))}"
+
+
+def org(shape: Shape, i: int) -> Dict[str, str]:
+    rng = shape.rng("orgdata", i)
+    name = f"{rng.choice(LAST_NAMES)} {rng.choice(['Partners', 'Capital', 'Realty', 'Group'])} {i}"
+    return {"name": name, "type": rng.choice(ORG_TYPES), "url": f"/organizations/{slug(name)}"}
+
+
+def property_address(shape: Shape, i: int) -> Tuple[str, str]:
+    rng = shape.rng("property", i)
+    city, state = rng.choice(CITIES)
+    street = f"{rng.randint(1, 2000)} {rng.choice(STREETS)}"
+    return f"{street}, {city}, {state}", f"/buildings/{slug(street)}-{i}"
+
+
+def deal_date(shape: Shape, i: int) -> Tuple[str, str]:
+    rng = shape.rng("date", i)
+    year, month, day = rng.randint(2015, 2025), rng.randint(1, 12), rng.randint(1, 28)
+    return f"{month:02d}/{day:02d}/{year}", f"{month:02d}{day:02d}{year}"
+
+
+def deal_url(shape: Shape, i: int) -> str:
+    address, _ = property_address(shape, shape.deal_property(i))
+    _, compact = deal_date(shape, i)
+    deal_type = DEAL_TYPES[i % len(DEAL_TYPES)]
+    return f"/activity/{slug(address.split(',')[0])}-{deal_type}-{compact}-{i}"
+
+
+def story(shape: Shape, i: int) -> Dict[str, str]:
+    rng = shape.rng("story", i)
+    year, month, day = rng.randint(2015, 2025), rng.randint(1, 12), rng.randint(1, 28)
+    return {
+        "title": f"{rng.choice(LAST_NAMES)} closes {rng.choice(PROPERTY_TYPES).lower()} deal #{i}",
+        "source": rng.choice(SOURCES),
+        "url": f"https://news.example.com/story/{i}",
+        "date": f"{year:04d}-{month:02d}-{day:02d}",
+    }
+
+
+def properties(shape: Shape) -> Iterator[Tuple[str, Dict]]:
+    for i in range(shape.properties):
+        rng = shape.rng("propdata", i)
+        address, url = property_address(shape, i)
+        yield url, {
+            "address": address,
+            "name": address.split(",")[0],
+            "Type": rng.choice(PROPERTY_TYPES),
+            "Square Feet": f"{rng.randint(2, 900) * 1000:,}",
+            "Year Built": str(rng.randint(1900, 2024)),
+            "CrediFi Score": str(rng.randint(20, 99)),
+        }
+
+
+def people(shape: Shape) -> Iterator[Tuple[str, Dict]]:
+    for i in range(shape.people):
+        rng = shape.rng("persondata", i)
+        name = person_name(shape, i)
+        employer = org(shape, shape.person_org(i))
+        yield person_url(shape, i), {
+            "basic_info": {
+                "name": name,
+                "title": rng.choice(["Broker", "Managing Director", "Vice Chairman", "Principal"]),
+                "email": f"{slug(name).replace('-', '.')}@example.com",
+                "phone": f"212-555-{i % 10000:04d}",
+                "bio": f"{name} advises on {rng.choice(PROPERTY_TYPES).lower()} transactions.",
+            },
+            "deal_urls": [deal_url(shape, d) for d in shape.person_deals(i)],
+            "organization_details": [{**employer, "role": rng.choice(["Broker", "Principal"])}],
+            "story_details": [story(shape, s) for s in shape.person_stories(i)],
+        }
+
+
+def deals(shape: Shape) -> Iterator[Tuple[str, Dict]]:
+    for i in range(shape.deals):
+        rng = shape.rng("dealdata", i)
+        deal_type = DEAL_TYPES[i % len(DEAL_TYPES)]
+        address, prop_url = property_address(shape, shape.deal_property(i))
+        date, _ = deal_date(shape, i)
+        square_feet = rng.randint(2, 500) * 1000
+        price = square_feet * rng.randint(150, 1500)
+        details = {"square feet": f"{square_feet:,}"}
+        if deal_type == "sale":
+            details.update({"price": f"${price:,}", "price per square foot": f"${price // square_feet:,}"})
+        elif deal_type == "lease":
+            details.update({"term years": str(rng.randint(1, 20)), "floors": str(rng.randint(1, 10))})
+        else:
+            details.update({
+                "amount": f"${price // 2:,}",
+                "financing types": rng.choice(["Acquisition", "Refinance", "Construction"]),
+                "interest rate": f"{rng.uniform(3, 9):.2f}%",
+                "fixed vs floating": rng.choice(["Fixed", "Floating"]),
+            })
+        orgs = {shape.zipf_org("deal", i, n) for n in range(2)}
+        yield deal_url(shape, i), {
+            "info": {"property": address.split(",")[0], "date": date, "type": deal_type,
+                     "title": f"{deal_type.title()} of {address.split(',')[0]}"},
+            "details": details,
+            "involved_properties": [prop_url],
+            "involved_people": [
+                {"name": person_name(shape, p), "url": person_url(shape, p), "role": rng.choice(ROLES)}
+                for p in shape.deal_people(i)
+            ],
+            "involved_organizations": [{**org(shape, o), "role": rng.choice(ROLES)} for o in orgs],
+        }
+
+
+def write_json_object(path: str, entries: Iterator[Tuple[str, Dict]]) -> int:
+    """Stream key/value pairs into a single JSON object without holding it in memory"""
+    count = 0
+    with open(path, "w") as f:
+        f.write("{")
+        for key, value in entries:
+            f.write(("," if count else "") + "\n" + json.dumps(key) + ": " + json.dumps(value))
+            count += 1
+        f.write("\n}\n")
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=10000, help="approximate total node count")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--out", default="benchmarks/data")
+    args = parser.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    shape = Shape(args.nodes, args.seed)
+    for name, entries in [("properties.json", properties(shape)),
+                          ("persons.json", people(shape)),
+                          ("deals.json", deals(shape))]:
+        count = write_json_object(os.path.join(args.out, name), entries)
+        print(f"{name}: {count} entries")
+    print(f"organizations: {shape.organizations}, stories: {shape.stories} (embedded in persons.json)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Bytes on the wire and CPU per request for each response encoding.
+
+Runs the app in-process on the fake driver (see fake_db) once with
+COMPACT_JSON off (stock JSONResponse, nulls included) and once with it on
+(orjson, nulls dropped). Every JSON route from run_bench is requested with
+Accept-Encoding identity, gzip and br.
+
+    python -m benchmarks.payload_bench --requests 200
+
+Bytes are counted before decompression. CPU is process time per request,
+including the fake driver, which costs the same in every configuration.
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+
+
+ENCODINGS = ["identity", "gzip", "br"]
+
+
+async def measure(requests: int):
+    from benchmarks import fake_db, run_bench
+    fake_db.install()
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    results = {}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        samples = await run_bench.discover_samples(client)
+        routes = [r for r in run_bench.ROUTES if "/graph/" not in r]
+        for template in routes:
+            results[template] = {}
+            for encoding in ENCODINGS:
+                headers = {"Accept-Encoding": encoding}
+                wire = 0
+                started = time.process_time()
+                for i in range(requests):
+                    path = run_bench.expand(template, samples, i)
+                    async with client.stream("GET", path, headers=headers) as response:
+                        await response.aread()
+                        wire += response.num_bytes_downloaded
+                        served = response.headers.get("content-encoding", "identity")
+                cpu = time.process_time() - started
+                results[template][encoding] = {
+                    "bytes": wire // requests,
+                    "cpu_ms": round(cpu / requests * 1000, 3),
+                    "served": served,
+                }
+    print(json.dumps(results))
+
+
+def run_config(compact: bool, requests: int) -> dict:
+    env = {**os.environ, "COMPACT_JSON": "true" if compact else "false", "WARMUP_ENABLED": "false"}
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.payload_bench", "--worker", "--requests", str(requests)],
+        env=env, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=100, help="requests per route and encoding")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker:
+        asyncio.run(measure(args.requests))
+        return
+
+    baseline = run_config(False, args.requests)
+    compact = run_config(True, args.requests)
+
+    header = (f"{'route':44} {'json B':>8} {'compact':>8} {'gzip':>7} {'br':>7}"
+              f" {'json ms':>8} {'compact':>8} {'gzip':>7} {'br':>7}")
+    print(header)
+    totals = {"json": 0, "compact": 0, "gzip": 0, "br": 0}
+    for route, before in baseline.items():
+        after = compact[route]
+        row = {
+            "json": before["identity"]["bytes"],
+            "compact": after["identity"]["bytes"],
+            "gzip": after["gzip"]["bytes"],
+            "br": after["br"]["bytes"],
+        }
+        for key, value in row.items():
+            totals[key] += value
+        br = row["br"] if after["br"]["served"] == "br" else "n/a"
+        print(f"{route:44} {row['json']:>8} {row['compact']:>8} {row['gzip']:>7} {br:>7}"
+              f" {before['identity']['cpu_ms']:>8} {after['identity']['cpu_ms']:>8}"
+              f" {after['gzip']['cpu_ms']:>7} {after['br']['cpu_ms']:>7}")
+    print(f"\nTotal bytes: json {totals['json']}, compact {totals['compact']} "
+          f"({totals['compact'] / totals['json'] - 1:+.1%}), gzip {totals['gzip']} "
+          f"({totals['gzip'] / totals['json'] - 1:+.1%}), br {totals['br']} ({totals['br'] / totals['json'] - 1:+.1%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Planning cost of interpolated vs parameterized list queries across paging patterns.
+
+For each paging pattern the list/recent queries from app.services.queries are
+issued twice: once with SKIP/LIMIT values pasted into the text (how the
+services used to build them) and once as the parameterized constants. Against
+a live Neo4j every statement is sent as EXPLAIN, which plans without
+executing, after clearing the query caches, so the wall time is planning:
+
+    python -m benchmarks.plan_cache_bench --uri bolt://localhost:7687
+
+Without a server, --offline reports distinct query texts and the hit ratio
+estimated by the app's own client-side plan cache model:
+
+    python -m benchmarks.plan_cache_bench --offline
+"""
+import argparse
+import random
+import time
+from typing import Dict, Iterator, List, Tuple
+
+from app.services import queries
+
+
+TEMPLATES = {
+    "people": queries.LIST_PEOPLE,
+    "deals": queries.LIST_DEALS,
+    "organizations": queries.LIST_ORGANIZATIONS,
+    "properties": queries.LIST_PROPERTIES,
+    "stories": queries.LIST_STORIES,
+    "people_recent": queries.RECENT_PEOPLE,
+    "deals_recent": queries.RECENT_DEALS,
+}
+
+
+def sequential(requests: int) -> Iterator[Tuple[int, int]]:
+    """Scrolling through pages of 12"""
+    for i in range(requests):
+        yield i + 1, 12
+
+
+def mixed_limits(requests: int) -> Iterator[Tuple[int, int]]:
+    """The page sizes the frontend offers, first ten pages each"""
+    limits = [12, 24, 48, 100]
+    for i in range(requests):
+        yield i // len(limits) % 10 + 1, limits[i % len(limits)]
+
+
+def random_access(requests: int) -> Iterator[Tuple[int, int]]:
+    """Deep links to arbitrary pages"""
+    rng = random.Random(7)
+    for _ in range(requests):
+        yield rng.randint(1, 500), rng.choice([12, 24, 48, 100])
+
+
+PATTERNS = {"sequential": sequential, "mixed_limits": mixed_limits, "random": random_access}
+
+
+def statements(pattern, requests: int, interpolated: bool) -> Iterator[Tuple[str, Dict]]:
+    names = list(TEMPLATES)
+    for i, (page, limit) in enumerate(pattern(requests)):
+        template = TEMPLATES[names[i % len(names)]]
+        params = {"skip": (page - 1) * limit, "limit": limit}
+        if interpolated:
+            yield template.replace("$skip", str(params["skip"])).replace("$limit", str(limit)), {}
+        else:
+            yield template, params
+
+
+def run_offline(requests: int):
+    from app.metrics import MetricsRegistry
+
+    print(f"{'pattern':14} {'style':14} {'texts':>7} {'est. hit ratio':>15}")
+    for name, pattern in PATTERNS.items():
+        for interpolated in (True, False):
+            registry = MetricsRegistry()
+            texts = set()
+            for text, _ in statements(pattern, requests, interpolated):
+                texts.add(text)
+                registry.observe_query(text, 0.0, 0.0, 0)
+            ratio = registry.slow_queries(limit=1)["plan_cache"]["hit_ratio"]
+            style = "interpolated" if interpolated else "parameterized"
+            print(f"{name:14} {style:14} {len(texts):>7} {ratio:>15}")
+
+
+def run_live(args):
+    from neo4j import GraphDatabase
+
+    driver = GraphDatabase.driver(args.uri, auth=(args.user, args.password))
+    print(f"{'pattern':14} {'style':14} {'texts':>7} {'planning s':>11} {'mean ms':>9}")
+    try:
+        with driver.session() as session:
+            for name, pattern in PATTERNS.items():
+                for interpolated in (True, False):
+                    session.run("CALL db.clearQueryCaches()").consume()
+                    texts = set()
+                    timings: List[float] = []
+                    for text, params in statements(pattern, args.requests, interpolated):
+                        texts.add(text)
+                        started = time.perf_counter()
+                        session.run("EXPLAIN " + text, params).consume()
+                        timings.append(time.perf_counter() - started)
+                    style = "interpolated" if interpolated else "parameterized"
+                    print(f"{name:14} {style:14} {len(texts):>7} {sum(timings):>11.3f} "
+                          f"{sum(timings) / len(timings) * 1000:>9.2f}")
+    finally:
+        driver.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--uri", default="bolt://localhost:7687")
+    parser.add_argument("--user", default="neo4j")
+    parser.add_argument("--password", default="password")
+    parser.add_argument("--requests", type=int, default=2000, help="statements per pattern and style")
+    parser.add_argument("--offline", action="store_true", help="count texts and estimate hit ratio without Neo4j")
+    args = parser.parse_args()
+    if args.offline:
+        run_offline(args.requests)
+    else:
+        run_live(args)
+
+
+if __name__ == "__main__":
+    main()
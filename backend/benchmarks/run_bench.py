@@ -0,0 +1,265 @@
+"""Fixed-concurrency latency/throughput benchmark over every /api/* route.
+
+Against a running backend (e.g. Neo4j in Docker loaded via generate_graph + data_tools):
+
+    docker run -d -p 7474:7474 -p 7687:7687 -e NEO4J_AUTH=neo4j/password neo4j:5
+    python -m benchmarks.run_bench --base-url http://localhost:8000 --label baseline
+
+In-process against the in-memory fake driver (no Neo4j needed):
+
+    python -m benchmarks.run_bench --fake --label fake
+
+Results are written to benchmarks/results/<timestamp>-<label>.json; pass
+--compare <file> to print the change against an earlier run. The /api/jobs
+routes need --admin-token (the backend's JOBS_ADMIN_TOKEN) unless --fake.
+Every GET /api route of the app that no template covers is listed at the
+end, so new routes do not silently go unmeasured.
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import statistics
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+# Route templates; {person}, {deal}, {org} and {property} are filled from list endpoints
+ROUTES = [
+    "/api/people?page=2&limit=12",
+    "/api/people/recent",
+    "/api/people/{person}",
+    "/api/people/{person}/deals",
+    "/api/people/{person}/partners",
+    "/api/people/leaderboard?by=activity",
+    "/api/people/leaderboard?by=volume&since=2015-01-01",
+    "/api/deals?page=2&limit=12",
+    "/api/deals/recent",
+    "/api/deals/{deal}",
+    "/api/organizations?page=2&limit=12",
+    "/api/organizations/recent",
+    "/api/organizations/{org}",
+    "/api/organizations/{org}/members",
+    "/api/organizations/{org}/deals",
+    "/api/organizations/{org}/stories",
+    "/api/properties?page=2&limit=12",
+    "/api/properties/recent",
+    "/api/properties/{property}",
+    "/api/properties/{property}/participants",
+    "/api/properties/{property}/deals",
+    "/api/properties/near?lat=40.7549&lon=-73.9840&radius=2000",
+    "/api/properties/within?south=40.70&west=-74.02&north=40.80&east=-73.93",
+    "/api/stories?page=2&limit=12",
+    "/api/stories/timeline",
+    "/api/stories/timeline?person={person_url}",
+    "/api/stories/timeline?organization={org_url}",
+    "/api/dashboard/summary",
+    "/api/analytics/trend?metric=price_per_square_foot",
+    "/api/analytics/trend?metric=price&group=property_type",
+    "/api/analytics/distribution?metric=price_per_square_foot&by=deal_type",
+    "/api/graph/neighborhood?url={person_url}&depth=2&limit=200",
+    "/api/export/organizations?format=ndjson",
+    "/api/export/organizations?format=csv",
+    "/api/jobs/tasks",
+    "/api/jobs?limit=50",
+]
+
+# Routes behind the jobs admin token
+ADMIN_ROUTES = ("/api/jobs",)
+# Diagnostics that are not worth measuring
+UNBENCHED_PREFIXES = ("/api/debug/",)
+
+SAMPLE_SOURCES = {
+    "person": ("/api/people?limit=50", "/people/"),
+    "deal": ("/api/deals?limit=50", "/"),
+    "org": ("/api/organizations?limit=50", "/organizations/"),
+    "property": ("/api/properties?limit=50", "/buildings/"),
+}
+
+
+async def discover_samples(client: httpx.AsyncClient) -> Dict[str, List[Dict[str, str]]]:
+    """Collect real entity URLs to substitute into the detail route templates"""
+    samples = {}
+    for name, (path, prefix) in SAMPLE_SOURCES.items():
+        response = await client.get(path)
+        response.raise_for_status()
+        urls = [item["url"] for item in response.json().get("data", []) if item.get("url")]
+        samples[name] = [
+            {name: url[len(prefix):] if url.startswith(prefix) else url.lstrip("/"), f"{name}_url": url}
+            for url in urls
+        ]
+    return samples
+
+
+def expand(template: str, samples: Dict[str, List[Dict[str, str]]], i: int) -> Optional[str]:
+    values = {}
+    for name, options in samples.items():
+        if "{" + name in template:
+            if not options:
+                return None
+            values.update(options[i % len(options)])
+    return template.format(**values)
+
+
+async def bench_route(client: httpx.AsyncClient, template: str, samples, concurrency: int,
+                      requests: int) -> Optional[Dict]:
+    if expand(template, samples, 0) is None:
+        return None
+    latencies = []
+    errors = 0
+    counter = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            path = expand(template, samples, i)
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                await response.aread()
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+
+    def pct(p):
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))], 3)
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "p50_ms": round(statistics.median(ordered), 3),
+        "p95_ms": pct(95),
+        "p99_ms": pct(99),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+    }
+
+
+def uncovered_routes(app, templates: List[str]) -> List[str]:
+    """GET /api routes of `app` that none of `templates` exercises"""
+    paths = [re.sub(r"\{[a-z_]+\}", "x", template.split("?")[0]) for template in templates]
+    missing = []
+    for route in app.routes:
+        path = getattr(route, "path", "")
+        if not path.startswith("/api/") or "GET" not in getattr(route, "methods", ()):
+            continue
+        if path.startswith(UNBENCHED_PREFIXES):
+            continue
+        pattern = re.sub(r"\{[^}:]+:path\}", ".+", path)
+        pattern = "^" + re.sub(r"\{[^}]+\}", "[^/]+", pattern) + "$"
+        # Literal routes ("/recent") shadow path parameters, so compare them exactly
+        if not any(re.match(pattern, p) and (path == p or "{" in path) for p in paths):
+            missing.append(path)
+    return missing
+
+
+def compare(current: Dict, previous_path: str):
+    with open(previous_path) as f:
+        previous = json.load(f)["routes"]
+    print(f"\nChange vs {previous_path}")
+    print(f"{'route':58} {'p50':>9} {'p95':>9} {'rps':>9}")
+    for route, stats in current.items():
+        before = previous.get(route)
+        if not before:
+            continue
+
+        def delta(key):
+            return f"{(stats[key] - before[key]) / before[key] * 100:+.1f}%" if before[key] else "n/a"
+
+        print(f"{route:58} {delta('p50_ms'):>9} {delta('p95_ms'):>9} {delta('throughput_rps'):>9}")
+
+
+async def run(args):
+    app = None
+    headers = {}
+    if args.fake:
+        from benchmarks import fake_db
+        fake_db.install()
+        from app.config import settings
+        from app.main import app
+        settings.JOBS_ADMIN_TOKEN = settings.JOBS_ADMIN_TOKEN or "bench"
+        args.admin_token = settings.JOBS_ADMIN_TOKEN
+        transport = httpx.ASGITransport(app=app)
+        client = httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=args.timeout)
+    else:
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        client = httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout)
+    if args.admin_token:
+        headers["X-Admin-Token"] = args.admin_token
+    client.headers.update(headers)
+
+    async with client:
+        samples = await discover_samples(client)
+        routes = [r for r in ROUTES if not args.routes or any(f in r for f in args.routes)]
+        if not args.admin_token:
+            routes = [r for r in routes if not r.startswith(ADMIN_ROUTES)]
+        # Warm up connection pools and query plans before measuring
+        for template in routes:
+            path = expand(template, samples, 0)
+            if path:
+                await client.get(path)
+
+        results = {}
+        print(f"{'route':58} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'rps':>9} {'err':>5}")
+        for template in routes:
+            stats = await bench_route(client, template, samples, args.concurrency, args.requests)
+            if stats is None:
+                print(f"{template:58} skipped (no sample URLs)")
+                continue
+            results[template] = stats
+            print(f"{template:58} {stats['p50_ms']:>9} {stats['p95_ms']:>9} {stats['p99_ms']:>9} "
+                  f"{stats['throughput_rps']:>9} {stats['errors']:>5}")
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}-{args.label}.json")
+    with open(path, "w") as f:
+        json.dump({
+            "label": args.label,
+            "mode": "fake" if args.fake else args.base_url,
+            "concurrency": args.concurrency,
+            "requests_per_route": args.requests,
+            "routes": results,
+        }, f, indent=2)
+    print(f"\nSaved {path}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+    if app is None:
+        try:
+            from app.main import app
+        except Exception:
+            return
+    missing = uncovered_routes(app, ROUTES)
+    if missing:
+        print("\nRoutes without a benchmark template: " + ", ".join(missing))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--fake", action="store_true", help="run in-process against the in-memory fake driver")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=500, help="requests per route")
+    parser.add_argument("--routes", nargs="*", help="only run routes containing one of these substrings")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--label", default="run")
+    parser.add_argument("--admin-token", default=os.getenv("JOBS_ADMIN_TOKEN"), help="X-Admin-Token for /api/jobs")
+    parser.add_argument("--compare", help="earlier results file to diff against")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
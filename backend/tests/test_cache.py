@@ -0,0 +1,69 @@
+from changelog import record_changes
+
+from app.services import cache
+from app.services.cache import AGGREGATE, ChangeFeed, TaggedCache, list_tag, url_tag
+
+
+def feed_at(tmp_path, version=1):
+    path = str(tmp_path / "changelog.sqlite")
+    record_changes(path, version, {"Person": {"/people/seed"}})
+    feed = ChangeFeed(TaggedCache(100), path, interval=0)
+    assert feed.poll() == version
+    return feed
+
+
+def fill(feed):
+    entries = {
+        "person_a": {url_tag("/people/a")},
+        "person_b": {url_tag("/people/b")},
+        "people_page": {list_tag("Person")},
+        "deals_page": {list_tag("Deal")},
+        "leaderboard": {AGGREGATE},
+    }
+    for key, tags in entries.items():
+        feed.cache.set((key,), key, tags)
+
+
+def cached_keys(feed):
+    return sorted(key for (key,) in feed.cache._entries)
+
+
+def test_new_version_evicts_only_touched_urls_lists_and_aggregates(tmp_path):
+    feed = feed_at(tmp_path)
+    fill(feed)
+    record_changes(feed.path, 2, {"Person": {"/people/a"}})
+    assert feed.poll() == 2
+    assert cached_keys(feed) == ["deals_page", "person_b"]
+
+
+def test_version_gap_clears_the_whole_cache(tmp_path):
+    feed = feed_at(tmp_path)
+    fill(feed)
+    # Version 2 was ingested without being logged
+    record_changes(feed.path, 3, {"Person": {"/people/a"}})
+    assert feed.poll() == 3
+    assert cached_keys(feed) == []
+
+
+def test_nothing_is_cached_without_a_change_log(tmp_path, monkeypatch):
+    feed = ChangeFeed(TaggedCache(100), str(tmp_path / "missing.sqlite"), interval=0)
+    monkeypatch.setattr(cache, "change_feed", feed)
+    monkeypatch.setattr(cache, "response_cache", feed.cache)
+    calls = []
+
+    @cache.cached(list_tag("Person"))
+    def people(page):
+        calls.append(page)
+        return [{"url": "/people/a"}]
+
+    people(1)
+    people(1)
+    assert calls == [1, 1]
+    assert feed.cache.stats()["entries"] == 0
+
+    # Once the log appears, results are cached
+    record_changes(feed.path, 1, {"Person": {"/people/seed"}})
+    people(1)
+    people(1)
+    assert calls == [1, 1, 1]
+    assert feed.cache.stats()["entries"] == 1
@@ -0,0 +1,32 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.limits import ConcurrencyLimit
+
+
+async def hold(limit, seconds):
+    request = limit()
+    await request.__anext__()
+    await asyncio.sleep(seconds)
+    with pytest.raises(StopAsyncIteration):
+        await request.__anext__()
+
+
+def test_shed_and_cancelled_waiters_give_back_every_slot():
+    limit = ConcurrencyLimit("test", 2, queue_timeout=0.02, max_queue=100)
+
+    async def scenario():
+        requests = [asyncio.create_task(hold(limit, 0.02)) for _ in range(50)]
+        await asyncio.sleep(0.01)
+        for request in requests[25:]:
+            request.cancel()
+        results = await asyncio.gather(*requests, return_exceptions=True)
+        await asyncio.sleep(0.05)
+        return results, limit._slots()
+
+    results, slots = asyncio.run(scenario())
+    assert any(isinstance(r, HTTPException) and r.status_code == 503 for r in results)
+    assert slots._value == 2
+    assert limit.stats()["active"] == 0 and limit.stats()["waiting"] == 0
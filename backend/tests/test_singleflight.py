@@ -0,0 +1,77 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.metrics import metrics
+from app.services.singleflight import SingleFlight
+
+
+def run_threads(count, target):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_concurrent_threads_share_one_execution():
+    flight, calls, results = SingleFlight(), [], []
+
+    def fn():
+        calls.append(1)
+        time.sleep(0.1)
+        return "value"
+
+    run_threads(8, lambda: results.append(flight.do(("test_share",), fn)))
+    assert calls == [1]
+    assert results == ["value"] * 8
+    assert metrics.service_calls()["test_share"] == {"executed": 1, "coalesced": 7}
+
+
+def test_each_waiter_raises_its_own_exception_chained_to_the_original():
+    flight, errors = SingleFlight(), []
+
+    def fn():
+        time.sleep(0.1)
+        raise ValueError("boom")
+
+    def call():
+        try:
+            flight.do(("test_errors",), fn)
+        except ValueError as e:
+            errors.append(e)
+
+    run_threads(4, call)
+    assert len(errors) == 4
+    assert len({id(e) for e in errors}) == 4
+    [original] = [e for e in errors if e.__cause__ is None]
+    assert all(e.__cause__ is original for e in errors if e is not original)
+    assert {str(e) for e in errors} == {"boom"}
+    assert metrics.service_calls()["test_errors"] == {"executed": 1, "coalesced": 3}
+
+
+def test_cancelled_async_leader_hands_the_call_to_a_waiter():
+    flight, calls = SingleFlight(), []
+
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    async def scenario():
+        leader = asyncio.create_task(flight.do_async(("test_cancel",), fn))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(flight.do_async(("test_cancel",), fn)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await asyncio.gather(*waiters)
+
+    # The first waiter to wake re-runs the call and the others share it
+    assert asyncio.run(scenario()) == [2, 2, 2]
+    assert calls == [1, 1]
+    assert flight._futures == {}
+    assert metrics.service_calls()["test_cancel"] == {"executed": 2, "coalesced": 2}
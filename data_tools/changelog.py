@@ -0,0 +1,54 @@
+import os
+import sqlite3
+from datetime import datetime
+
+# ------------------------------
+# Change log of the entities each ingest touched
+#
+# A SQLite file shared with the backend (CHANGE_LOG_PATH there), which polls it
+# to drop exactly the cached responses that mention a changed URL:
+#   versions(version, committed_at, entities)   one row per graph version
+#   changes(version, label, url)                every node that version wrote
+# Versions are GraphMeta.version and are only written after the Neo4j
+# transactions committed. The last CHANGE_LOG_KEEP_VERSIONS are kept; a reader
+# that fell further behind just drops its whole cache.
+# ------------------------------
+
+CHANGE_LOG_KEEP_VERSIONS = int(os.getenv("CHANGE_LOG_KEEP_VERSIONS", "100"))
+
+
+def connect(path):
+    db = sqlite3.connect(path)
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS versions (
+            version INTEGER PRIMARY KEY,
+            committed_at TEXT NOT NULL,
+            entities INTEGER NOT NULL
+        )
+    """)
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS changes (
+            version INTEGER NOT NULL,
+            label TEXT NOT NULL,
+            url TEXT NOT NULL,
+            PRIMARY KEY (version, label, url)
+        )
+    """)
+    return db
+
+
+def record_changes(path, version, changes, keep=CHANGE_LOG_KEEP_VERSIONS):
+    """Append {label: urls} under `version` and prune versions older than the last `keep`"""
+    rows = [(version, label, url) for label, urls in changes.items() for url in sorted(urls) if url]
+    db = connect(path)
+    try:
+        with db:
+            db.executemany("INSERT OR IGNORE INTO changes VALUES (?, ?, ?)", rows)
+            # The versions row goes in last: readers only look at versions listed there
+            db.execute("INSERT OR REPLACE INTO versions VALUES (?, ?, ?)",
+                       (version, datetime.now().isoformat(), len(rows)))
+            db.execute("DELETE FROM changes WHERE version <= ?", (version - keep,))
+            db.execute("DELETE FROM versions WHERE version <= ?", (version - keep,))
+    finally:
+        db.close()
+    return len(rows)
@@ -0,0 +1,312 @@
+import argparse
+import re
+import unicodedata
+from collections import defaultdict
+
+# ------------------------------
+# Entity resolution for Person and Organization nodes
+#
+# 1. Blocking: every node gets a few cheap keys (email, phone, surname +
+#    initial, URL slug without its numeric suffix, normalized firm name).
+#    Only nodes sharing a key are compared, and keys shared by more than
+#    MAX_BLOCK nodes are dropped as uninformative, so the work grows with the
+#    number of nodes rather than its square.
+# 2. Similarity: each pair in a block is accepted by explicit rules over name
+#    trigram similarity plus a corroborating field (email, phone, employer,
+#    shared member or website). A shared name or slug alone never merges.
+# 3. Clustering: accepted pairs are unioned; each cluster is merged into the
+#    node with the most relationships. Its relationships move over, missing
+#    properties are copied, names and URLs are kept as `aliases` /
+#    `alias_urls`, and an (:Alias {url, canonical_url}) node lets the next
+#    ingest map the old URL to the canonical node.
+# ------------------------------
+
+MAX_BLOCK = 500
+MERGE_BATCH_SIZE = 200
+
+NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "phd", "md", "esq", "cpa", "cfa", "ccim", "sior", "mai", "mba", "jd"}
+ORG_SUFFIXES = {"inc", "llc", "llp", "lp", "ltd", "corp", "corporation", "co", "company", "the"}
+
+
+def name_tokens(name, drop=NAME_SUFFIXES):
+    """Lowercase ASCII tokens of a name without punctuation or suffixes"""
+    text = unicodedata.normalize("NFKD", name or "")
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).lower()
+    text = re.sub(r"[^a-z0-9\s]", " ", text.replace("'", "").replace("&", " and "))
+    return [token for token in text.split() if token not in drop]
+
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def similarity(a, b):
+    """Jaccard similarity of character trigrams"""
+    if not a or not b:
+        return 0.0
+    ta, tb = trigrams(a), trigrams(b)
+    return len(ta & tb) / len(ta | tb)
+
+
+def slug_base(url):
+    """'/people/john-smith-2' -> 'john-smith'"""
+    slug = (url or "").rstrip("/").rsplit("/", 1)[-1].lower()
+    return re.sub(r"(-\d+)+$", "", slug)
+
+
+def phone_digits(phone):
+    digits = re.sub(r"\D", "", phone or "")
+    return digits[-10:] if len(digits) >= 10 else None
+
+
+class UnionFind:
+    def __init__(self):
+        self.parent = {}
+
+    def find(self, x):
+        self.parent.setdefault(x, x)
+        while self.parent[x] != x:
+            self.parent[x] = self.parent[self.parent[x]]
+            x = self.parent[x]
+        return x
+
+    def union(self, a, b):
+        self.parent[self.find(a)] = self.find(b)
+
+    def clusters(self):
+        groups = defaultdict(list)
+        for x in self.parent:
+            groups[self.find(x)].append(x)
+        return [members for members in groups.values() if len(members) > 1]
+
+
+# ------------------------------
+# Blocking keys and match rules per label
+# ------------------------------
+def person_keys(node):
+    tokens = name_tokens(node["name"])
+    keys = [f"slug:{slug_base(node['url'])}"]
+    if node["email"]:
+        keys.append(f"email:{node['email'].strip().lower()}")
+    if phone_digits(node["phone"]):
+        keys.append(f"phone:{phone_digits(node['phone'])}")
+    if len(tokens) >= 2:
+        keys.append(f"name:{tokens[-1]}|{tokens[0][0]}")
+    return keys
+
+
+def person_match(a, b):
+    """
+    A shared slug or similar name only puts two people in the same block: the
+    site numbers the URLs of different people who share a name, so a match
+    also needs an email, a phone or an employer in common.
+    """
+    if a["email"] and b["email"] and a["email"].strip().lower() == b["email"].strip().lower():
+        return True
+    name_sim = similarity(" ".join(name_tokens(a["name"])), " ".join(name_tokens(b["name"])))
+    if phone_digits(a["phone"]) and phone_digits(a["phone"]) == phone_digits(b["phone"]):
+        return name_sim >= 0.5
+    shared_org = {org_name(o) for o in a["orgs"]} & {org_name(o) for o in b["orgs"]}
+    return name_sim >= 0.85 and bool(shared_org - {""})
+
+
+def org_name(name):
+    return " ".join(name_tokens(name, ORG_SUFFIXES))
+
+
+def website_domain(url):
+    domain = re.sub(r"^[a-z]+://", "", (url or "").strip().lower()).split("/")[0]
+    return domain[4:] if domain.startswith("www.") else domain
+
+
+def organization_keys(node):
+    keys = [f"slug:{slug_base(node['url'])}"]
+    if org_name(node["name"]):
+        keys.append(f"org:{org_name(node['name'])}")
+    return keys
+
+
+def organization_match(a, b):
+    """Same (or near-identical) name plus a shared member, website or phone; a name alone is not enough"""
+    name_a, name_b = org_name(a["name"]), org_name(b["name"])
+    same_name = bool(name_a) and name_a == name_b
+    if not same_name and not (slug_base(a["url"]) == slug_base(b["url"]) and similarity(name_a, name_b) >= 0.8):
+        return False
+    if set(a["members"]) & set(b["members"]):
+        return True
+    website = website_domain(a["props"].get("website"))
+    if website and website == website_domain(b["props"].get("website")):
+        return True
+    return bool(phone_digits(a["phone"])) and phone_digits(a["phone"]) == phone_digits(b["phone"])
+
+
+LABELS = {
+    "Person": (person_keys, person_match),
+    "Organization": (organization_keys, organization_match),
+}
+
+
+# ------------------------------
+# Finding clusters
+# ------------------------------
+def load_nodes(session, label):
+    result = session.run(f"""
+        MATCH (n:{label})
+        RETURN id(n) AS id, n.url AS url, n.name AS name, n.email AS email, n.phone AS phone,
+               [(n)-[:WORKS_FOR]->(o:Organization) | o.name] AS orgs,
+               [(p:Person)-[:WORKS_FOR]->(n) | p.url] AS members,
+               COUNT {{ (n)--() }} AS degree, properties(n) AS props
+    """)
+    return {record["id"]: dict(record) for record in result}
+
+
+def find_clusters(nodes, keys_fn, match_fn):
+    """Clusters of node ids whose blocked pairs match, plus the number of comparisons made"""
+    blocks = defaultdict(list)
+    for node_id, node in nodes.items():
+        for key in keys_fn(node):
+            blocks[key].append(node_id)
+
+    uf = UnionFind()
+    compared = set()
+    for members in blocks.values():
+        if len(members) < 2 or len(members) > MAX_BLOCK:
+            continue
+        for i, a in enumerate(members):
+            for b in members[i + 1:]:
+                pair = (a, b) if a < b else (b, a)
+                if pair in compared or uf.find(a) == uf.find(b):
+                    continue
+                compared.add(pair)
+                if match_fn(nodes[a], nodes[b]):
+                    uf.union(a, b)
+    return uf.clusters(), len(compared)
+
+
+def merge_plan(nodes, cluster, label):
+    """One merge per duplicate: the canonical node keeps the most relationships"""
+    canonical = max(cluster, key=lambda i: (nodes[i]["degree"], -len(nodes[i]["url"] or ""), -i))
+    canon = nodes[canonical]
+    aliases = set(canon["props"].get("aliases") or [])
+    alias_urls = set(canon["props"].get("alias_urls") or [])
+    for node_id in cluster:
+        if node_id != canonical:
+            aliases.update([nodes[node_id]["name"], *(nodes[node_id]["props"].get("aliases") or [])])
+            alias_urls.update([nodes[node_id]["url"], *(nodes[node_id]["props"].get("alias_urls") or [])])
+    aliases.discard(canon["name"])
+    aliases.discard(None)
+    alias_urls.discard(None)
+
+    plan = []
+    for node_id in cluster:
+        if node_id == canonical:
+            continue
+        props = {k: v for k, v in nodes[node_id]["props"].items()
+                 if k not in canon["props"] and k not in ("url", "aliases", "alias_urls")}
+        plan.append({"dup": node_id, "canon": canonical, "label": label, "props": props,
+                     "aliases": sorted(aliases), "alias_urls": sorted(alias_urls)})
+    return plan
+
+
+# ------------------------------
+# Merging
+# ------------------------------
+def merge_duplicates(tx, pairs):
+    """Fold each duplicate into its canonical node; returns (deal URLs, [dup URL, canonical URL]) per pair"""
+    result = tx.run("""
+        UNWIND $pairs AS pair
+        MATCH (dup) WHERE id(dup) = pair.dup
+        MATCH (canon) WHERE id(canon) = pair.canon
+        WITH dup, canon, pair, [(dup)-[:PARTICIPATED_IN]->(d:Deal) | d] AS deals
+        CALL { WITH dup, canon
+               MATCH (dup)-[r:PARTICIPATED_IN]->(d) WHERE r.role IS NOT NULL
+               MERGE (canon)-[:PARTICIPATED_IN {role: r.role}]->(d) }
+        CALL { WITH dup, canon
+               MATCH (dup)-[r:PARTICIPATED_IN]->(d) WHERE r.role IS NULL
+               MERGE (canon)-[:PARTICIPATED_IN]->(d) }
+        CALL { WITH dup, canon
+               MATCH (dup)-[:WORKS_FOR]->(o)
+               MERGE (canon)-[:WORKS_FOR]->(o) }
+        CALL { WITH dup, canon
+               MATCH (p)-[:WORKS_FOR]->(dup)
+               MERGE (p)-[:WORKS_FOR]->(canon) }
+        CALL { WITH dup, canon
+               MATCH (dup)-[:MENTIONED_IN]->(s)
+               MERGE (canon)-[:MENTIONED_IN]->(s) }
+        // The duplicate's co-participation and broker scores are recounted for the canonical node
+        CALL { WITH dup, deals
+               UNWIND deals AS d
+               SET d.co_participants_counted = [u IN coalesce(d.co_participants_counted, []) WHERE u <> dup.url],
+                   d.scored_participants = [u IN coalesce(d.scored_participants, []) WHERE u <> dup.url] }
+        CALL { WITH dup
+               MATCH (s:BrokerScore) WHERE s.key STARTS WITH dup.url + '|'
+               DELETE s }
+        CALL { WITH dup, canon
+               MATCH (old:Alias) WHERE old.canonical_url = dup.url
+               SET old.canonical_url = canon.url }
+        SET canon += pair.props, canon.aliases = pair.aliases, canon.alias_urls = pair.alias_urls
+        MERGE (a:Alias {url: dup.url})
+        SET a.canonical_url = canon.url, a.label = pair.label
+        WITH dup, canon, deals, dup.url AS dup_url
+        DETACH DELETE dup
+        RETURN [d IN deals | d.url] AS deal_urls, [dup_url, canon.url] AS merged_urls
+    """, pairs=pairs)
+    return [(record["deal_urls"], record["merged_urls"]) for record in result]
+
+
+def dedup(session, dry_run=False, changes=None):
+    """
+    Resolve duplicates for every label; returns the URLs of deals whose
+    participants changed. Merged and canonical URLs are added to `changes`.
+    """
+    affected_deals = set()
+    for label, (keys_fn, match_fn) in LABELS.items():
+        nodes = load_nodes(session, label)
+        clusters, compared = find_clusters(nodes, keys_fn, match_fn)
+        plan = [pair for cluster in clusters for pair in merge_plan(nodes, cluster, label)]
+        print(f"{label}: {len(nodes)} nodes, {compared} comparisons, "
+              f"{len(clusters)} clusters, {len(plan)} duplicates.")
+        if dry_run:
+            for cluster in clusters[:10]:
+                print("   ", " = ".join(f"{nodes[i]['name']} ({nodes[i]['url']})" for i in cluster))
+            continue
+        for start in range(0, len(plan), MERGE_BATCH_SIZE):
+            for deal_urls, merged_urls in session.execute_write(merge_duplicates, plan[start:start + MERGE_BATCH_SIZE]):
+                affected_deals.update(deal_urls)
+                if changes is not None:
+                    changes.setdefault(label, set()).update(merged_urls)
+    return affected_deals
+
+
+def load_aliases(session):
+    """Old URL -> canonical URL for every merged node"""
+    return {record["url"]: record["canonical_url"]
+            for record in session.run("MATCH (a:Alias) RETURN a.url AS url, a.canonical_url AS canonical_url")}
+
+
+if __name__ == "__main__":
+    from changelog import record_changes
+    from contextlib import nullcontext
+    from main import (CHANGE_LOG, driver, add_parents, bump_graph_version, update_co_participation,
+                      update_broker_scores, writer_lock)
+
+    parser = argparse.ArgumentParser(description="Merge duplicate people and organizations")
+    parser.add_argument("--dry-run", action="store_true", help="print clusters without merging")
+    args = parser.parse_args()
+
+    with driver.session() as session, (nullcontext() if args.dry_run else writer_lock(session, "dedup")):
+        changes = {}
+        deal_urls = sorted(dedup(session, args.dry_run, changes))
+        if deal_urls:
+            session.execute_write(update_co_participation, deal_urls)
+            session.execute_write(update_broker_scores, deal_urls)
+            print(f"Recounted co-participation and broker scores for {len(deal_urls)} deals.")
+        if changes:
+            changes["Deal"] = set(deal_urls)
+            version = session.execute_write(bump_graph_version)
+            if CHANGE_LOG:
+                session.execute_read(add_parents, changes)
+                record_changes(CHANGE_LOG, version, changes)
+            print(f"Graph version bumped to {version}.")
+    driver.close()
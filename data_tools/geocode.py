@@ -0,0 +1,160 @@
+import json
+import os
+import socket
+import sqlite3
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+# ------------------------------
+# Geocoding for Property.location
+#
+# GEOCODER picks the backend:
+#   offline    (default) the centroid of the address's city, from a small
+#              built-in gazetteer. Needs no network, but every property in a
+#              city shares one point, so it is stored with precision "city".
+#   nominatim  OpenStreetMap Nominatim over HTTP, at most one request per second
+#              as its usage policy requires. Precision "address".
+# Each geocoder's precision is stored as Property.location_precision next to
+# Property.location, so nobody mistakes a city centroid for a building.
+# Results, misses included, are kept in an on-disk SQLite cache
+# (GEOCODE_CACHE), so re-running the ingest never geocodes an address twice.
+# Failed lookups (network errors, rate limiting) are not cached and are
+# retried on the next run.
+# ------------------------------
+
+GEOCODER = os.getenv("GEOCODER", "offline")
+GEOCODE_CACHE = os.getenv("GEOCODE_CACHE", "geocode_cache.sqlite")
+NOMINATIM_URL = os.getenv("NOMINATIM_URL", "https://nominatim.openstreetmap.org/search")
+NOMINATIM_USER_AGENT = os.getenv("NOMINATIM_USER_AGENT", "broker-intellj-ingest")
+
+# (city, state) -> (latitude, longitude)
+CITY_CENTROIDS = {
+    ("new york", "ny"): (40.7128, -74.0060),
+    ("brooklyn", "ny"): (40.6782, -73.9442),
+    ("queens", "ny"): (40.7282, -73.7949),
+    ("bronx", "ny"): (40.8448, -73.8648),
+    ("staten island", "ny"): (40.5795, -74.1502),
+    ("long island city", "ny"): (40.7447, -73.9485),
+    ("jersey city", "nj"): (40.7178, -74.0431),
+    ("newark", "nj"): (40.7357, -74.1724),
+    ("los angeles", "ca"): (34.0522, -118.2437),
+    ("san francisco", "ca"): (37.7749, -122.4194),
+    ("san diego", "ca"): (32.7157, -117.1611),
+    ("chicago", "il"): (41.8781, -87.6298),
+    ("boston", "ma"): (42.3601, -71.0589),
+    ("washington", "dc"): (38.9072, -77.0369),
+    ("philadelphia", "pa"): (39.9526, -75.1652),
+    ("miami", "fl"): (25.7617, -80.1918),
+    ("atlanta", "ga"): (33.7490, -84.3880),
+    ("dallas", "tx"): (32.7767, -96.7970),
+    ("houston", "tx"): (29.7604, -95.3698),
+    ("austin", "tx"): (30.2672, -97.7431),
+    ("seattle", "wa"): (47.6062, -122.3321),
+    ("denver", "co"): (39.7392, -104.9903),
+    ("phoenix", "az"): (33.4484, -112.0740),
+}
+
+
+class GeocodeError(Exception):
+    """A lookup that failed, as opposed to one that found nothing"""
+
+
+class OfflineGeocoder:
+    """City centroids for "street, city, ST" addresses"""
+
+    # Cache source; earlier offline answers spread addresses around the centroid
+    name = "offline-city"
+    precision = "city"
+
+    def geocode(self, address):
+        parts = [part.strip().lower() for part in address.split(",")]
+        if len(parts) < 3:
+            return None
+        state = parts[-1].split()[0] if parts[-1] else ""
+        return CITY_CENTROIDS.get((parts[-2], state))
+
+
+class NominatimGeocoder:
+    """OpenStreetMap Nominatim, rate limited to one request per second"""
+
+    name = "nominatim"
+    precision = "address"
+
+    def __init__(self, url=NOMINATIM_URL, user_agent=NOMINATIM_USER_AGENT):
+        self.url = url
+        self.user_agent = user_agent
+        self._last_request = 0.0
+
+    def geocode(self, address):
+        wait = 1.0 - (time.monotonic() - self._last_request)
+        if wait > 0:
+            time.sleep(wait)
+        query = urllib.parse.urlencode({"q": address, "format": "json", "limit": 1})
+        request = urllib.request.Request(f"{self.url}?{query}", headers={"User-Agent": self.user_agent})
+        try:
+            with urllib.request.urlopen(request, timeout=10) as response:
+                results = json.load(response)
+            if not results:
+                return None
+            return float(results[0]["lat"]), float(results[0]["lon"])
+        # HTTPError (a 429 when rate limited, for one) is a URLError
+        except (urllib.error.URLError, socket.timeout, ValueError, KeyError, IndexError, TypeError) as e:
+            raise GeocodeError(f"{address}: {e}") from e
+        finally:
+            self._last_request = time.monotonic()
+
+
+class CachedGeocoder:
+    """Wraps a geocoder with a SQLite cache of every answer, misses included but not failures"""
+
+    def __init__(self, geocoder, path=GEOCODE_CACHE):
+        self.geocoder = geocoder
+        self.precision = geocoder.precision
+        self.db = sqlite3.connect(path)
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS geocode (
+                address TEXT NOT NULL,
+                source TEXT NOT NULL,
+                latitude REAL,
+                longitude REAL,
+                PRIMARY KEY (address, source)
+            )
+        """)
+        self.hits = self.misses = self.failures = 0
+
+    def geocode(self, address):
+        if not address:
+            return None
+        key = " ".join(address.lower().split())
+        row = self.db.execute(
+            "SELECT latitude, longitude FROM geocode WHERE address = ? AND source = ?",
+            (key, self.geocoder.name)
+        ).fetchone()
+        if row is not None:
+            self.hits += 1
+            return None if row[0] is None else (row[0], row[1])
+
+        self.misses += 1
+        try:
+            coordinates = self.geocoder.geocode(address)
+        except GeocodeError as e:
+            self.failures += 1
+            print(f"Geocoding failed, will retry next run: {e}")
+            return None
+        latitude, longitude = coordinates if coordinates else (None, None)
+        self.db.execute("INSERT OR REPLACE INTO geocode VALUES (?, ?, ?, ?)",
+                        (key, self.geocoder.name, latitude, longitude))
+        self.db.commit()
+        return coordinates
+
+    def close(self):
+        self.db.close()
+
+
+def get_geocoder():
+    geocoders = {"offline": OfflineGeocoder, "nominatim": NominatimGeocoder}
+    if GEOCODER not in geocoders:
+        raise ValueError(f"Unknown GEOCODER: {GEOCODER}")
+    return CachedGeocoder(geocoders[GEOCODER]())
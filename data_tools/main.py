@@ -1,26 +1,105 @@
 import json
+import math
+import os
+import re
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import date, datetime
 from neo4j import GraphDatabase
+from neo4j.spatial import WGS84Point
+from changelog import record_changes
+from dedup import dedup, load_aliases
+from geocode import get_geocoder
+from snapshot import write_snapshot
 
 # Neo4j connection details
 URI = "bolt://localhost:7687"
 USERNAME = "neo4j"
 PASSWORD = "password"
 
+# The backend reads these bookmarks so its replica reads include this ingest
+BOOKMARKS_FILE = os.getenv("NEO4J_BOOKMARKS_FILE", "../backend/.neo4j_bookmarks")
+
+# Columnar snapshot the backend can serve analytics from (ANALYTICS_SOURCE=snapshot); empty to skip
+SNAPSHOT_DIR = os.getenv("SNAPSHOT_DIR", "../backend/snapshot")
+
+# Change log of touched URLs the backend polls to invalidate its caches (CHANGE_LOG_PATH); empty to skip
+CHANGE_LOG = os.getenv("CHANGE_LOG", "../backend/changelog.sqlite")
+
 driver = GraphDatabase.driver(URI, auth=(USERNAME, PASSWORD))
 
 # ------------------------------
-# Helper: clean a dictionary by removing keys with value "N/A"
+# Helper: canonical snake_case property key ("Square Feet" -> "square_feet")
+# ------------------------------
+def canonical_key(key):
+    return re.sub(r"[^0-9a-z]+", "_", key.strip().lower()).strip("_")
+
+# ------------------------------
+# Helper: clean a dictionary by removing keys with value "N/A" and canonicalizing the rest
 # ------------------------------
 def clean_dict(d):
-    return {k: v for k, v in d.items() if k != "N/A"}
+    return {canonical_key(k): v for k, v in d.items() if k != "N/A"}
+
+# ------------------------------
+# Helper: URL of the canonical node for a person/organization URL merged away by dedup
+# ------------------------------
+aliases = {}
+
+def canonical_url(url):
+    return aliases.get(url, url)
+
+# ------------------------------
+# Helper: parse a scraped date string into a date (stored as a Cypher Date), or None
+# ------------------------------
+DATE_FORMATS = ["%Y-%m-%d", "%m-%d-%Y", "%m/%d/%Y", "%b %d, %Y", "%B %d, %Y", "%d %B %Y"]
+
+def parse_date(value):
+    if not value or not isinstance(value, str):
+        return None
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value.strip(), fmt).date()
+        except ValueError:
+            continue
+    return None
+
+# ------------------------------
+# Helper: parse a scraped number ("$192,640,000", "17,000", "$1.2M") into a float, or None
+# ------------------------------
+NUMBER_SUFFIXES = {"k": 1e3, "m": 1e6, "b": 1e9}
+
+def parse_number(value):
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = re.search(r"(\d[\d,]*(?:\.\d+)?)\s*([kmb])?\b", (value or "").lower())
+    if not match:
+        return None
+    return float(match.group(1).replace(",", "")) * NUMBER_SUFFIXES.get(match.group(2), 1)
+
+# ------------------------------
+# Helper: typed copies of the deal fields analytics aggregates, next to the raw strings
+# ------------------------------
+def typed_deal_props(props):
+    typed = {
+        "price_value": parse_number(props.get("price")),
+        "price_per_square_foot_value": parse_number(props.get("price_per_square_foot")),
+        "square_feet_value": parse_number(props.get("square_feet")),
+        "closed_on": parse_date(props.get("date")),
+    }
+    return {k: v for k, v in typed.items() if v is not None}
 
 # ------------------------------
 # Ingest Properties
 # ------------------------------
-def ingest_properties(tx, properties):
+def ingest_properties(tx, properties, locations=None, location_precision=None):
     for prop_url, prop_data in properties.items():
         props = clean_dict(prop_data)
         props['url'] = prop_url
+        coordinates = (locations or {}).get(prop_url)
+        if coordinates:
+            props['location'] = WGS84Point((coordinates[1], coordinates[0]))
+            props['location_precision'] = location_precision
         tx.run("""
             MERGE (p:Property {url: $url})
             SET p += $props
@@ -31,6 +110,7 @@ def ingest_properties(tx, properties):
 # ------------------------------
 def ingest_people(tx, people):
     for person_url, person_data in people.items():
+        person_url = canonical_url(person_url)
         props = clean_dict(person_data.get("basic_info", {}))
         props['url'] = person_url
 
@@ -49,19 +129,23 @@ def ingest_people(tx, people):
 
         # Organizations
         for org in person_data.get("organization_details", []):
+            org_url = canonical_url(org.get("url"))
             org_props = clean_dict(org)
-            org_props['url'] = org.get("url")
+            org_props['url'] = org_url
             tx.run("""
                 MERGE (o:Organization {url: $url})
                 SET o += $props
                 MERGE (p:Person {url: $person_url})
                 MERGE (p)-[:WORKS_FOR]->(o)
-            """, url=org.get("url"), props=org_props, person_url=person_url)
+            """, url=org_url, props=org_props, person_url=person_url)
 
         # Stories
         for story in person_data.get("story_details", []):
             story_props = clean_dict(story)
             story_props['url'] = story.get("url")
+            published_on = parse_date(story.get("date"))
+            if published_on:
+                story_props['published_on'] = published_on
             tx.run("""
                 MERGE (s:Story {url: $url})
                 SET s += $props
@@ -79,6 +163,7 @@ def ingest_deals(tx, deals):
         props = clean_dict(deal_data.get("info", {}))
         props.update(clean_dict(deal_data.get("details", {})))
         props['url'] = deal_url
+        props.update(typed_deal_props(props))
 
         # Create / Update Deal with all properties
         tx.run("""
@@ -96,33 +181,288 @@ def ingest_deals(tx, deals):
 
         # Involved People
         for person in deal_data.get("involved_people", []):
+            person_url = canonical_url(person.get("url"))
             person_props = clean_dict(person)
-            person_props['url'] = person.get("url")
+            person_props['url'] = person_url
             tx.run("""
                 MERGE (p:Person {url: $person_url})
                 SET p += $props
                 MERGE (d:Deal {url: $deal_url})
                 MERGE (p)-[:PARTICIPATED_IN {role: $role}]->(d)
-            """, person_url=person.get("url"), props=person_props, deal_url=deal_url, role=person.get("role"))
+            """, person_url=person_url, props=person_props, deal_url=deal_url, role=person.get("role"))
 
         # Involved Organizations
         for org in deal_data.get("involved_organizations", []):
+            org_url = canonical_url(org.get("url"))
             org_props = clean_dict(org)
-            org_props['url'] = org.get("url")
+            org_props['url'] = org_url
             tx.run("""
                 MERGE (o:Organization {url: $org_url})
                 SET o += $props
                 MERGE (d:Deal {url: $deal_url})
                 MERGE (o)-[:PARTICIPATED_IN {role: $role}]->(d)
-            """, org_url=org.get("url"), props=org_props, deal_url=deal_url, role=org.get("role"))
+            """, org_url=org_url, props=org_props, deal_url=deal_url, role=org.get("role"))
+
+# ------------------------------
+# Co-participation aggregate
+# ------------------------------
+def update_co_participation(tx, deal_urls):
+    """
+    Maintain CO_PARTICIPATED {deals} counts between every pair of participants
+    of a deal. Each deal remembers which participants were already counted, so
+    re-ingesting a deal only adds the pairs involving new participants.
+    """
+    for deal_url in deal_urls:
+        tx.run("""
+            MATCH (d:Deal {url: $deal_url})
+            MATCH (x)-[:PARTICIPATED_IN]->(d)
+            WITH d, collect(DISTINCT x) AS parts
+            WITH parts, coalesce(d.co_participants_counted, []) AS counted
+            UNWIND parts AS a
+            UNWIND parts AS b
+            WITH a, b, counted
+            WHERE a.url < b.url AND NOT (a.url IN counted AND b.url IN counted)
+            MERGE (a)-[c:CO_PARTICIPATED]->(b)
+            ON CREATE SET c.deals = 1
+            ON MATCH SET c.deals = c.deals + 1
+        """, deal_url=deal_url)
+        tx.run("""
+            MATCH (d:Deal {url: $deal_url})
+            OPTIONAL MATCH (x)-[:PARTICIPATED_IN]->(d)
+            WITH d, collect(DISTINCT x.url) AS urls
+            SET d.co_participants_counted = urls
+        """, deal_url=deal_url)
+
+# ------------------------------
+# Broker leaderboard scores
+# ------------------------------
+# Activity is a sum of exp(λ·(day − epoch)) per deal: decaying every score to
+# "now" multiplies them all by the same factor, so adding a deal never touches
+# the others. The backend uses the same constants to report decayed values.
+ACTIVITY_HALF_LIFE_DAYS = 365
+ACTIVITY_EPOCH = date(2000, 1, 1)
+ALL = "*"  # type / region / month value of the rollup cells
+
+def region_of(address):
+    """City part of "1488 Pine St, New York, NY" """
+    parts = [part.strip() for part in (address or "").split(",")]
+    return parts[-2] if len(parts) >= 3 and parts[-2] else None
+
+def score_cells(person_url, deal):
+    """BrokerScore increments for one person on one deal, including the "*" rollups"""
+    closed_on = deal["closed_on"].to_native() if deal["closed_on"] else None
+    activity = 0.0
+    if closed_on:
+        activity = math.exp(math.log(2) / ACTIVITY_HALF_LIFE_DAYS * (closed_on - ACTIVITY_EPOCH).days)
+    types = {ALL, deal["type"] or ALL}
+    regions = {ALL, region_of(deal["address"]) or ALL}
+    months = {ALL, closed_on.strftime("%Y-%m") if closed_on else ALL}
+    return [
+        {"key": "|".join([person_url, t, r, m]), "person_url": person_url, "type": t, "region": r,
+         "month": m, "volume": deal["price_value"] or 0.0, "activity": activity}
+        for t in types for r in regions for m in months
+    ]
+
+def update_broker_scores(tx, deal_urls):
+    """
+    Add each deal to the BrokerScore cells of its participating people. Like
+    co-participation, a deal remembers who was scored, so re-ingesting it only
+    adds the new participants.
+    """
+    for deal_url in deal_urls:
+        deal = tx.run("""
+            MATCH (d:Deal {url: $deal_url})
+            OPTIONAL MATCH (d)-[:INVOLVES]->(pr:Property)
+            WITH d, head(collect(pr.address)) AS address
+            OPTIONAL MATCH (p:Person)-[:PARTICIPATED_IN]->(d)
+            RETURN d.type AS type, d.price_value AS price_value, d.closed_on AS closed_on, address,
+                   coalesce(d.scored_participants, []) AS scored, collect(DISTINCT p.url) AS people
+        """, deal_url=deal_url).single()
+        if deal is None:
+            continue
+        new_people = [url for url in deal["people"] if url not in deal["scored"]]
+        cells = [cell for url in new_people for cell in score_cells(url, deal)]
+        tx.run("""
+            UNWIND $cells AS cell
+            MERGE (s:BrokerScore {key: cell.key})
+            ON CREATE SET s.person_url = cell.person_url, s.type = cell.type, s.region = cell.region,
+                          s.month = cell.month, s.deals = 0, s.volume = 0.0, s.activity = 0.0
+            SET s.deals = s.deals + 1, s.volume = s.volume + cell.volume, s.activity = s.activity + cell.activity
+        """, cells=cells)
+        tx.run("""
+            MATCH (d:Deal {url: $deal_url})
+            SET d.scored_participants = $scored
+        """, deal_url=deal_url, scored=deal["scored"] + new_people)
+
+# ------------------------------
+# Dashboard snapshot: the home page aggregates, computed once per ingest
+# ------------------------------
+DASHBOARD_LIMIT = 20
+LABELS = ["Person", "Deal", "Organization", "Property", "Story"]
+
+def top_participants(tx, label):
+    result = tx.run(f"""
+        MATCH (n:{label})-[:PARTICIPATED_IN]->(d:Deal)
+        WITH n, count(DISTINCT d) AS deals
+        ORDER BY deals DESC, n.url
+        LIMIT $limit
+        RETURN id(n) AS id, n.url AS url, n.name AS name, n.title AS title, n.type AS type, deals
+    """, limit=DASHBOARD_LIMIT)
+    return [{"_id": r["id"], "url": r["url"], "name": r["name"], "title": r["title"],
+             "type": r["type"], "deals": r["deals"]} for r in result]
+
+def refresh_dashboard(tx):
+    """Rebuild the single DashboardSnapshot node that /api/dashboard/summary serves"""
+    deals = []
+    volume = {}
+    for r in tx.run("""
+        MATCH (d:Deal)
+        RETURN id(d) AS id, d.url AS url, d.property AS property, d.type AS type, d.price AS price, d.date AS date
+    """):
+        deal_date = parse_date(r["date"])
+        deals.append((deal_date, {"_id": r["id"], "url": r["url"], "property": r["property"],
+                                  "type": r["type"], "price": r["price"], "date": r["date"]}))
+        if deal_date:
+            bucket = volume.setdefault((deal_date.strftime("%Y-%m"), r["type"] or ""), {"deals": 0, "value": 0.0})
+            bucket["deals"] += 1
+            bucket["value"] += parse_number(r["price"]) or 0.0
+    deals.sort(key=lambda item: item[0] or datetime.min.date(), reverse=True)
+
+    properties = []
+    for r in tx.run("""
+        MATCH (pr:Property)<-[:INVOLVES]-(d:Deal)
+        RETURN id(pr) AS id, pr.url AS url, pr.name AS name, pr.address AS address, pr.type AS type,
+               collect(d.date) AS dates
+    """):
+        latest = max(filter(None, map(parse_date, r["dates"])), default=None)
+        properties.append((latest, {"_id": r["id"], "url": r["url"], "name": r["name"],
+                                    "address": r["address"], "type": r["type"]}))
+    properties.sort(key=lambda item: item[0] or datetime.min.date(), reverse=True)
+
+    counts = {label: tx.run(f"MATCH (n:{label}) RETURN count(n) AS total").single()["total"] for label in LABELS}
+
+    summary = {
+        "recent_deals": [deal for _, deal in deals[:DASHBOARD_LIMIT]],
+        "recent_properties": [prop for _, prop in properties[:DASHBOARD_LIMIT]],
+        "top_brokers": top_participants(tx, "Person"),
+        "top_organizations": top_participants(tx, "Organization"),
+        "deal_volume": [{"month": month, "type": deal_type, **totals}
+                        for (month, deal_type), totals in sorted(volume.items())],
+        "counts": counts,
+    }
+    tx.run("""
+        MERGE (s:DashboardSnapshot {key: 'summary'})
+        SET s.payload = $payload, s.refreshed_at = datetime()
+    """, payload=json.dumps(summary))
+
+# ------------------------------
+# Graph version: bumped once per ingest so the backend can drop caches built from older data
+# ------------------------------
+def bump_graph_version(tx):
+    return tx.run("""
+        MERGE (m:GraphMeta {key: 'graph'})
+        SET m.version = coalesce(m.version, 0) + 1, m.updated_at = datetime()
+        RETURN m.version AS version
+    """).single()["version"]
+
+# ------------------------------
+# Graph writer lock: ingests, dedup runs and the backend's co-participation
+# rebuild job all rewrite CO_PARTICIPATED counts, so only one runs at a time.
+# The lock is a WriterLock node under a uniqueness constraint, which makes the
+# MERGE that takes it atomic. A lock not refreshed for WRITER_LOCK_STALE_SECONDS
+# is assumed abandoned (a crashed run) and taken over.
+# ------------------------------
+WRITER_LOCK_STALE_SECONDS = int(os.getenv("WRITER_LOCK_STALE_SECONDS", "3600"))
+WRITER_LOCK_WAIT_SECONDS = int(os.getenv("WRITER_LOCK_WAIT_SECONDS", "1800"))
+
+def acquire_writer_lock(tx, holder):
+    """The holder of the writer lock after trying to take it: `holder` if it was free"""
+    tx.run("""
+        MATCH (l:WriterLock {key: 'graph'})
+        WHERE l.heartbeat < datetime() - duration({seconds: $stale})
+        DELETE l
+    """, stale=WRITER_LOCK_STALE_SECONDS)
+    return tx.run("""
+        MERGE (l:WriterLock {key: 'graph'})
+        ON CREATE SET l.holder = $holder, l.heartbeat = datetime()
+        RETURN l.holder AS holder
+    """, holder=holder).single()["holder"]
+
+
+def refresh_writer_lock(tx, holder):
+    tx.run("MATCH (l:WriterLock {key: 'graph', holder: $holder}) SET l.heartbeat = datetime()", holder=holder)
+
+
+def release_writer_lock(tx, holder):
+    tx.run("MATCH (l:WriterLock {key: 'graph', holder: $holder}) DELETE l", holder=holder)
+
+
+@contextmanager
+def writer_lock(session, name, wait=WRITER_LOCK_WAIT_SECONDS):
+    """Hold the graph writer lock, waiting up to `wait` seconds for it; yields a heartbeat to call between steps"""
+    holder = f"{name}:{uuid.uuid4().hex[:8]}"
+    deadline = time.monotonic() + wait
+    while True:
+        current = session.execute_write(acquire_writer_lock, holder)
+        if current == holder:
+            break
+        if time.monotonic() >= deadline:
+            raise RuntimeError(f"{current} still holds the graph writer lock after {wait}s")
+        print(f"Waiting for {current} to release the graph writer lock...")
+        time.sleep(10)
+    try:
+        yield lambda: session.execute_write(refresh_writer_lock, holder)
+    finally:
+        session.execute_write(release_writer_lock, holder)
+
+# ------------------------------
+# Change log: every node an ingest writes, by label
+# ------------------------------
+def touched_entities(properties, people, deals):
+    changes = {label: set() for label in LABELS}
+    changes["Property"].update(properties)
+    for person_url, person_data in people.items():
+        changes["Person"].add(canonical_url(person_url))
+        changes["Deal"].update(person_data.get("deal_urls", []))
+        changes["Organization"].update(canonical_url(org.get("url")) for org in person_data.get("organization_details", []))
+        changes["Story"].update(story.get("url") for story in person_data.get("story_details", []))
+    for deal_url, deal_data in deals.items():
+        changes["Deal"].add(deal_url)
+        changes["Property"].update(deal_data.get("involved_properties", []))
+        changes["Person"].update(canonical_url(person.get("url")) for person in deal_data.get("involved_people", []))
+        changes["Organization"].update(canonical_url(org.get("url")) for org in deal_data.get("involved_organizations", []))
+    return changes
+
+
+def add_parents(tx, changes):
+    """
+    Add the entities whose pages aggregate a changed one: the organizations of
+    changed people (members, stories, timelines) and every participant of a
+    changed deal (partner lists, which follow the co-participation counts)
+    """
+    people = sorted(changes.get("Person", ()))
+    orgs = tx.run("""
+        MATCH (p:Person)-[:WORKS_FOR]->(o:Organization)
+        WHERE p.url IN $people
+        RETURN collect(DISTINCT o.url) AS urls
+    """, people=people).single()["urls"]
+    changes.setdefault("Organization", set()).update(orgs)
+    for record in tx.run("""
+        MATCH (x)-[:PARTICIPATED_IN]->(d:Deal)
+        WHERE d.url IN $deal_urls
+        RETURN labels(x)[0] AS label, collect(DISTINCT x.url) AS urls
+    """, deal_urls=sorted(changes.get("Deal", ()))):
+        changes.setdefault(record["label"], set()).update(record["urls"])
+    return changes
 
 # ------------------------------
 # Main Function
 # ------------------------------
 
-people_path = "../scrape_gen/data/persons.json"
-deals_path = "../scrape_gen/data/deals.json"
-properties_path = "../scrape_gen/data/properties.json"
+data_dir = os.getenv("DATA_DIR", "../scrape_gen/data")
+people_path = os.path.join(data_dir, "persons.json")
+deals_path = os.path.join(data_dir, "deals.json")
+properties_path = os.path.join(data_dir, "properties.json")
 
 if __name__ == "__main__":
     with driver.session() as session:
@@ -136,13 +476,61 @@ if __name__ == "__main__":
         with open(deals_path) as f:
             deals = json.load(f)
 
-        # Ingest
-        session.execute_write(ingest_properties, properties)
-        print("Properties ingested.")
-        session.execute_write(ingest_people, people)
-        print("People ingested.")
-        session.execute_write(ingest_deals, deals)
-        print("Deals ingested.")
+        # Geocode outside the write transaction; cached answers make re-runs free
+        geocoder = get_geocoder()
+        try:
+            locations = {url: geocoder.geocode(data.get("address")) for url, data in properties.items()}
+        finally:
+            geocoder.close()
+        print(f"Geocoded {sum(1 for c in locations.values() if c)} of {len(locations)} properties "
+              f"({geocoder.hits} cached, {geocoder.failures} failed, precision {geocoder.precision}).")
+
+        # Ingests, dedup runs and the co-participation rebuild job write one at a time
+        with writer_lock(session, "ingest") as heartbeat:
+            # URLs merged away by earlier dedup runs resolve to their canonical nodes
+            aliases.update(load_aliases(session))
+
+            # Ingest
+            session.execute_write(ingest_properties, properties, locations, geocoder.precision)
+            print("Properties ingested.")
+            session.execute_write(ingest_people, people)
+            print("People ingested.")
+            session.execute_write(ingest_deals, deals)
+            print("Deals ingested.")
+            heartbeat()
+
+            touched_deals = set(deals)
+            for person_data in people.values():
+                touched_deals.update(person_data.get("deal_urls", []))
+
+            changes = touched_entities(properties, people, deals)
+            touched_deals |= dedup(session, changes=changes)
+            print("Duplicate people and organizations merged.")
+            heartbeat()
+
+            session.execute_write(update_co_participation, sorted(touched_deals))
+            print("Co-participation counts updated.")
+            session.execute_write(update_broker_scores, sorted(touched_deals))
+            print("Broker scores updated.")
+            heartbeat()
+
+            session.execute_write(refresh_dashboard)
+            print("Dashboard snapshot refreshed.")
+
+            version = session.execute_write(bump_graph_version)
+            print(f"Graph version bumped to {version}.")
+
+            if SNAPSHOT_DIR:
+                print(f"Snapshot written to {write_snapshot(session, SNAPSHOT_DIR, version)}.")
+
+            if CHANGE_LOG:
+                changes["Deal"].update(touched_deals)
+                session.execute_read(add_parents, changes)
+                print(f"{record_changes(CHANGE_LOG, version, changes)} changed entities logged to {CHANGE_LOG}.")
+
+        with open(BOOKMARKS_FILE, "w") as f:
+            f.write("\n".join(sorted(session.last_bookmarks().raw_values)) + "\n")
+        print(f"Bookmarks written to {BOOKMARKS_FILE}.")
 
     driver.close()
     print("Data ingestion complete!")
@@ -0,0 +1,76 @@
+import argparse
+from main import canonical_key, driver
+
+# ------------------------------
+# Rename properties stored before ingest canonicalized keys
+# ("Square Feet", "price per square foot", ...) to their snake_case form.
+# Run once after upgrading:  python migrate_keys.py [--dry-run]
+# ------------------------------
+
+LABELS = ["Person", "Deal", "Organization", "Property", "Story"]
+BATCH_SIZE = 1000
+
+
+def fetch_batch(tx, label, after_id):
+    result = tx.run(f"""
+        MATCH (n:{label})
+        WHERE id(n) > $after_id
+        RETURN id(n) AS id, properties(n) AS props
+        ORDER BY id
+        LIMIT $limit
+    """, after_id=after_id, limit=BATCH_SIZE)
+    return [(record["id"], record["props"]) for record in result]
+
+
+def replace_properties(tx, rows):
+    tx.run("""
+        UNWIND $rows AS row
+        MATCH (n) WHERE id(n) = row.id
+        SET n = row.props
+    """, rows=rows)
+
+
+def canonical_props(props):
+    """Canonical copy of a property map; a value already under the canonical key wins"""
+    canonical = {}
+    for key, value in props.items():
+        new_key = canonical_key(key)
+        if key == new_key or new_key not in canonical:
+            canonical[new_key] = value
+    return canonical
+
+
+def migrate_label(session, label, dry_run):
+    after_id = -1
+    scanned = changed = 0
+    while True:
+        batch = session.execute_read(fetch_batch, label, after_id)
+        if not batch:
+            break
+        after_id = batch[-1][0]
+        scanned += len(batch)
+
+        rows = []
+        for node_id, props in batch:
+            canonical = canonical_props(props)
+            if canonical.keys() != props.keys():
+                rows.append({"id": node_id, "props": canonical})
+        changed += len(rows)
+        if rows and not dry_run:
+            session.execute_write(replace_properties, rows)
+    return scanned, changed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rename node properties to canonical snake_case keys")
+    parser.add_argument("--dry-run", action="store_true", help="report what would change without writing")
+    args = parser.parse_args()
+
+    with driver.session() as session:
+        for label in LABELS:
+            scanned, changed = migrate_label(session, label, args.dry_run)
+            action = "would be migrated" if args.dry_run else "migrated"
+            print(f"{label}: {changed} of {scanned} nodes {action}.")
+
+    driver.close()
+    print("Key migration complete!")
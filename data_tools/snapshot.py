@@ -0,0 +1,251 @@
+import argparse
+import itertools
+import json
+import os
+import pickle
+import re
+import shutil
+from datetime import date, datetime
+
+import numpy as np
+
+# ------------------------------
+# Columnar snapshot of the graph for offline analytics
+#
+# One directory per graph version holding a .npy file per column, which the
+# backend memory-maps (ANALYTICS_SOURCE=snapshot) instead of querying Neo4j:
+#   <root>/<version>/manifest.json
+#   <root>/<version>/<Label>.<column>.npy       node columns, rows ordered by node id
+#   <root>/<version>/<TYPE>.<column>.npy        relationship columns (src, dst, properties)
+#   <root>/CURRENT                              name of the newest complete version
+# Column kinds: float64 numbers (NaN = missing), dates as int32 days since
+# 1970-01-01 (MISSING_DAY = missing), dictionary strings as int32 codes
+# (-1 = missing) and other strings as int64 offsets plus utf-8 bytes.
+# ------------------------------
+
+LABELS = ["Person", "Deal", "Organization", "Property", "Story"]
+RELATIONSHIPS = ["PARTICIPATED_IN", "INVOLVES", "WORKS_FOR", "MENTIONED_IN", "CO_PARTICIPATED"]
+DICTIONARY_MAX = 4096
+MISSING_DAY = np.iinfo(np.int32).min
+EPOCH = date(1970, 1, 1).toordinal()
+
+
+# Rows moved between a column's spill file and its .npy file at a time
+CHUNK_ROWS = 65536
+
+
+def as_date(value):
+    native = value.to_native() if hasattr(value, "to_native") else value
+    return native if isinstance(native, date) and not isinstance(native, datetime) else None
+
+
+def as_string(value):
+    return value if isinstance(value, str) else json.dumps(value, default=str)
+
+
+class ColumnSpill:
+    """
+    The present values of one property column, appended to a temp file as
+    rows stream in. The column's kind is decided from what was seen, and the
+    .npy file is then filled from the spill a chunk at a time, so no more
+    than one chunk of one column is ever held in memory.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "wb")
+        self.numeric = self.dates = True
+        self.distinct = set()  # stops growing past DICTIONARY_MAX
+
+    def add(self, row, value):
+        value = value.to_native() if hasattr(value, "to_native") else value
+        if not isinstance(value, (str, int, float, date, list, dict)):
+            value = as_string(value)
+        number = isinstance(value, (int, float)) and not isinstance(value, bool)
+        self.numeric = self.numeric and number
+        self.dates = self.dates and not number and as_date(value) is not None
+        if len(self.distinct) <= DICTIONARY_MAX:
+            self.distinct.add(as_string(value))
+        pickle.dump((row, value), self.file)
+
+    def _records(self):
+        with open(self.path, "rb") as f:
+            while True:
+                try:
+                    yield pickle.load(f)
+                except EOFError:
+                    return
+
+    def _chunks(self):
+        batch = []
+        for record in self._records():
+            batch.append(record)
+            if len(batch) >= CHUNK_ROWS:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _fill(self, filename, rows, dtype, missing, convert):
+        array = np.lib.format.open_memmap(filename, mode="w+", dtype=dtype, shape=(rows,))
+        array[:] = missing
+        for batch in self._chunks():
+            array[[row for row, _ in batch]] = [convert(value) for _, value in batch]
+        array.flush()
+        del array
+
+    def _strings(self):
+        """Every row's string value in row order, "" where missing"""
+        expected = 0
+        for row, value in self._records():
+            yield from itertools.repeat("", row - expected)
+            yield as_string(value)
+            expected = row + 1
+
+    def write(self, directory, prefix, rows):
+        """Write the column's arrays; returns (kind, {suffix: filename}, extra manifest fields)"""
+        self.file.close()
+        path = os.path.join(directory, prefix)
+        if self.numeric:
+            self._fill(path + ".npy", rows, np.float64, np.nan, float)
+            return "float64", {"": prefix + ".npy"}, {}
+        if self.dates:
+            self._fill(path + ".npy", rows, np.int32, MISSING_DAY, lambda value: as_date(value).toordinal() - EPOCH)
+            return "date", {"": prefix + ".npy"}, {}
+        if len(self.distinct) <= DICTIONARY_MAX:
+            distinct = sorted(self.distinct)
+            index = {s: i for i, s in enumerate(distinct)}
+            self._fill(path + ".npy", rows, np.int32, -1, lambda value: index[as_string(value)])
+            return "dictionary", {"": prefix + ".npy"}, {"dictionary": distinct}
+
+        # Offsets first, which also gives the size of the data array
+        offsets = np.lib.format.open_memmap(path + ".offsets.npy", mode="w+", dtype=np.int64, shape=(rows + 1,))
+        offsets[0] = total = 0
+        row = 0
+        for text in self._strings():
+            total += len(text.encode())
+            row += 1
+            offsets[row] = total
+        offsets[row + 1:] = total
+        offsets.flush()
+        del offsets
+        data = np.lib.format.open_memmap(path + ".data.npy", mode="w+", dtype=np.uint8, shape=(total,))
+        position = 0
+        for text in self._strings():
+            encoded = text.encode()
+            data[position:position + len(encoded)] = np.frombuffer(encoded, dtype=np.uint8)
+            position += len(encoded)
+        data.flush()
+        del data
+        return "string", {".offsets": prefix + ".offsets.npy", ".data": prefix + ".data.npy"}, {}
+
+
+class TableWriter:
+    """Streams one label or relationship type into id columns plus a spill per property key"""
+
+    def __init__(self, directory, name, id_columns):
+        self.directory = directory
+        self.name = name
+        self.rows = 0
+        self.ids = {column: open(self._path(column, ".ids"), "wb") for column in id_columns}
+        self.columns = {}
+
+    def _path(self, column, suffix=""):
+        return os.path.join(self.directory, f"{self.name}.{re.sub(r'[^0-9A-Za-z_]+', '_', column)}{suffix}")
+
+    def add(self, ids, props):
+        for column, value in ids.items():
+            self.ids[column].write(np.int64(value).tobytes())
+        for key, value in props.items():
+            if value is None:
+                continue
+            if key not in self.columns:
+                self.columns[key] = ColumnSpill(self._path(key, ".spill"))
+            self.columns[key].add(self.rows, value)
+        self.rows += 1
+
+    def close(self):
+        """Turn the spills into .npy files, returning the manifest entry"""
+        columns = {}
+        for column, f in self.ids.items():
+            f.close()
+            raw = self._path(column, ".ids")
+            filename = os.path.basename(self._path(column, ".npy"))
+            array = np.lib.format.open_memmap(os.path.join(self.directory, filename), mode="w+",
+                                              dtype=np.int64, shape=(self.rows,))
+            if self.rows:
+                array[:] = np.memmap(raw, dtype=np.int64, mode="r", shape=(self.rows,))
+            array.flush()
+            del array
+            os.remove(raw)
+            columns[column] = {"kind": "int64", "files": {"values": filename}}
+        for key in sorted(self.columns):
+            spill = self.columns[key]
+            prefix = os.path.basename(self._path(key))
+            kind, files, extra = spill.write(self.directory, prefix, self.rows)
+            os.remove(spill.path)
+            columns[key] = {"kind": kind, "files": {suffix.lstrip(".") or "values": f for suffix, f in files.items()},
+                            **extra}
+        return {"rows": self.rows, "columns": columns}
+
+
+def write_snapshot(session, root, version):
+    """
+    Export every label and relationship type to <root>/<version> and point
+    CURRENT at it. The version CURRENT named before is kept until the next
+    snapshot, so a backend still reading it is never left without its files.
+    """
+    directory = os.path.join(root, str(version))
+    tmp = directory + ".tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+
+    manifest = {"version": version, "created_at": datetime.now().isoformat(), "labels": {}, "relationships": {}}
+    for label in LABELS:
+        table = TableWriter(tmp, label, ["id"])
+        for record in session.run(f"MATCH (n:{label}) RETURN id(n) AS id, properties(n) AS props ORDER BY id"):
+            table.add({"id": record["id"]}, record["props"])
+        manifest["labels"][label] = table.close()
+
+    for rel_type in RELATIONSHIPS:
+        table = TableWriter(tmp, rel_type, ["src", "dst"])
+        for record in session.run(f"""
+            MATCH (a)-[r:{rel_type}]->(b)
+            RETURN id(a) AS src, id(b) AS dst, properties(r) AS props
+            ORDER BY src, dst
+        """):
+            table.add({"src": record["src"], "dst": record["dst"]}, record["props"])
+        manifest["relationships"][rel_type] = table.close()
+
+    with open(os.path.join(tmp, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+    shutil.rmtree(directory, ignore_errors=True)
+    os.rename(tmp, directory)
+
+    # Swap CURRENT atomically, then drop versions older than the one it replaced
+    current = os.path.join(root, "CURRENT")
+    previous = None
+    if os.path.exists(current):
+        with open(current) as f:
+            previous = f.read().strip()
+    with open(os.path.join(root, "CURRENT.tmp"), "w") as f:
+        f.write(str(version))
+    os.replace(os.path.join(root, "CURRENT.tmp"), current)
+    for entry in os.listdir(root):
+        if entry not in (str(version), previous, "CURRENT") and os.path.isdir(os.path.join(root, entry)):
+            shutil.rmtree(os.path.join(root, entry), ignore_errors=True)
+    return directory
+
+
+if __name__ == "__main__":
+    from main import SNAPSHOT_DIR, driver
+
+    parser = argparse.ArgumentParser(description="Write a columnar snapshot of the current graph")
+    parser.add_argument("--dir", default=SNAPSHOT_DIR, help="snapshot root directory")
+    args = parser.parse_args()
+
+    with driver.session() as session:
+        record = session.run("MATCH (m:GraphMeta {key: 'graph'}) RETURN m.version AS version").single()
+        version = record["version"] if record and record["version"] is not None else 0
+        print(f"Snapshot written to {write_snapshot(session, args.dir, version)}.")
+    driver.close()
@@ -0,0 +1,45 @@
+from dedup import find_clusters, organization_keys, organization_match, person_keys, person_match
+
+
+def person(node_id, url, name, email=None, phone=None, orgs=()):
+    return node_id, {"id": node_id, "url": url, "name": name, "email": email, "phone": phone,
+                     "orgs": list(orgs), "members": [], "degree": 1, "props": {"url": url, "name": name}}
+
+
+def organization(node_id, url, name, members=(), website=None, phone=None):
+    props = {"url": url, "name": name, "website": website}
+    return node_id, {"id": node_id, "url": url, "name": name, "email": None, "phone": phone,
+                     "orgs": [], "members": list(members), "degree": 1, "props": props}
+
+
+def clusters(nodes, keys_fn, match_fn):
+    found, _ = find_clusters(dict(nodes), keys_fn, match_fn)
+    return sorted(sorted(cluster) for cluster in found)
+
+
+def test_same_named_people_without_shared_attributes_stay_apart():
+    nodes = [person(1, "/people/john-smith", "John Smith"),
+             person(2, "/people/john-smith-2", "John Smith")]
+    assert clusters(nodes, person_keys, person_match) == []
+
+
+def test_same_named_people_with_a_shared_attribute_merge():
+    nodes = [person(1, "/people/john-smith", "John Smith", phone="(212) 555-0100"),
+             person(2, "/people/john-smith-2", "John Smith Jr.", phone="212.555.0100"),
+             person(3, "/people/jane-doe", "Jane Doe", email="JD@x.com", orgs=["CBRE Inc."]),
+             person(4, "/people/jane-doe-1", "Jane Doe", orgs=["CBRE"])]
+    assert clusters(nodes, person_keys, person_match) == [[1, 2], [3, 4]]
+
+
+def test_same_named_firms_without_shared_attributes_stay_apart():
+    nodes = [organization(1, "/organizations/acme-capital", "Acme Capital LLC"),
+             organization(2, "/organizations/acme-capital-1", "Acme Capital")]
+    assert clusters(nodes, organization_keys, organization_match) == []
+
+
+def test_same_named_firms_with_a_shared_member_or_website_merge():
+    nodes = [organization(1, "/organizations/acme", "Acme Inc.", members=["/people/a"]),
+             organization(2, "/organizations/acme-1", "Acme", members=["/people/a", "/people/b"]),
+             organization(3, "/organizations/jll", "JLL", website="https://www.jll.com/"),
+             organization(4, "/organizations/jll-2", "JLL", website="jll.com")]
+    assert clusters(nodes, organization_keys, organization_match) == [[1, 2], [3, 4]]
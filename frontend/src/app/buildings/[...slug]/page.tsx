@@ -45,6 +45,10 @@ interface PropertyDetail {
   deals: Deal[];
   stories: Story[];
   participants: Participant[];
+  deal_count: number;
+  participant_count: number;
+  deals_next_cursor?: string | null;
+  participants_next_cursor?: string | null;
 }
 
 export default function PropertyDetailPage({ params }: { params: { slug: string[] } }) {
@@ -55,16 +59,63 @@ export default function PropertyDetailPage({ params }: { params: { slug: string[
   const [peoplePage, setPeoplePage] = useState(1);
   const [orgsPage, setOrgsPage] = useState(1);
   const [storiesPage, setStoriesPage] = useState(1);
+  const [deals, setDeals] = useState<Deal[]>([]);
+  const [dealsCursor, setDealsCursor] = useState<string | null>(null);
+  const [participants, setParticipants] = useState<Participant[]>([]);
+  const [participantsCursor, setParticipantsCursor] = useState<string | null>(null);
   const itemsPerPage = 8;
 
   const propertyPath = params.slug.join('/');
 
+  // The detail payload carries the first page of deals and participants; later
+  // pages are fetched from /api/properties/{url}/{collection} by following next_cursor
+  const fetchUntil = async <T,>(collection: string, loaded: T[], cursor: string | null, enough: (items: T[]) => boolean) => {
+    let items = loaded;
+    try {
+      while (!enough(items) && cursor) {
+        const response = await axios.get(`${API_BASE}/api/properties/${propertyPath}/${collection}`, { params: { cursor } });
+        items = [...items, ...response.data.data];
+        cursor = response.data.next_cursor;
+      }
+    } catch (err) {
+      console.error(err);
+    }
+    return { items, cursor };
+  };
+
+  const goToDealsPage = async (page: number) => {
+    const { items, cursor } = await fetchUntil('deals', deals, dealsCursor, d => d.length >= page * itemsPerPage);
+    setDeals(items);
+    setDealsCursor(cursor);
+    setDealsPage(page);
+  };
+
+  // People and organizations share one participants cursor, so a page of either
+  // may need several fetches
+  const goToParticipantsPage = async (type: string, page: number, setPage: (page: number) => void) => {
+    const ofType = (items: Participant[]) => items.filter(p => p.type === type);
+    const { items, cursor } = await fetchUntil(
+      'participants', participants, participantsCursor, p => ofType(p).length >= page * itemsPerPage
+    );
+    setParticipants(items);
+    setParticipantsCursor(cursor);
+    setPage(Math.min(page, Math.max(1, Math.ceil(ofType(items).length / itemsPerPage))));
+  };
+
   useEffect(() => {
     const fetchProperty = async () => {
       try {
         setLoading(true);
         const response = await axios.get(`${API_BASE}/api/properties/${propertyPath}`);
-        setProperty(response.data.data);
+        const data: PropertyDetail = response.data.data;
+        setProperty(data);
+        setDeals(data.deals || []);
+        setDealsCursor(data.deals_next_cursor || null);
+        setParticipants(data.participants || []);
+        setParticipantsCursor(data.participants_next_cursor || null);
+        setDealsPage(1);
+        setPeoplePage(1);
+        setOrgsPage(1);
       } catch (err) {
         setError('Failed to load property details');
         console.error(err);
@@ -97,7 +148,10 @@ export default function PropertyDetailPage({ params }: { params: { slug: string[
   const googleMapsUrl = `https://www.google.com/maps/search/?api=1&query=${encodeURIComponent(prop?.address || 'Unknown')}`;
 
   // Get all property fields dynamically, excluding known fields
-  const excludedFields = ['id', '_id', 'address', 'url', 'name', 'deals', 'stories', 'participants'];
+  const excludedFields = [
+    'id', '_id', 'address', 'url', 'name', 'deals', 'stories', 'participants',
+    'deal_count', 'participant_count', 'deals_next_cursor', 'participants_next_cursor'
+  ];
   const propertyDetails = Object.entries(prop as Record<string, any>)
     .filter(([key, value]) => !excludedFields.includes(key) && value !== null && value !== undefined && value !== '')
     .map(([key, value]) => ({
@@ -105,8 +159,12 @@ export default function PropertyDetailPage({ params }: { params: { slug: string[
       value: String(value)
     }));
 
-  const people = prop.participants?.filter(p => p.type === 'Person') || [];
-  const organizations = prop.participants?.filter(p => p.type === 'Organization') || [];
+  const dealCount = prop.deal_count ?? deals.length;
+  const dealPages = Math.ceil(dealCount / itemsPerPage);
+  const people = participants.filter(p => p.type === 'Person');
+  const organizations = participants.filter(p => p.type === 'Organization');
+  const peoplePages = Math.ceil(people.length / itemsPerPage);
+  const orgPages = Math.ceil(organizations.length / itemsPerPage);
 
   return (
     <div className="min-h-screen bg-gray-50 py-8">
@@ -154,11 +212,11 @@ export default function PropertyDetailPage({ params }: { params: { slug: string[
         )}
 
         {/* Deals Involving This Property */}
-        {prop.deals && prop.deals.length > 0 && (
+        {deals.length > 0 && (
           <div className="bg-white rounded-lg shadow-lg p-8 mb-8">
-            <h2 className="text-2xl font-bold text-gray-900 mb-6">Deals Involving This Property</h2>
+            <h2 className="text-2xl font-bold text-gray-900 mb-6">Deals Involving This Property ({dealCount})</h2>
             <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4">
-              {prop.deals.slice((dealsPage - 1) * itemsPerPage, dealsPage * itemsPerPage).map((deal, index) => (
+              {deals.slice((dealsPage - 1) * itemsPerPage, dealsPage * itemsPerPage).map((deal, index) => (
                 <Link
                   key={`deal-${deal.id}-${(dealsPage - 1) * itemsPerPage + index}`}
                   href={deal.url}
@@ -192,21 +250,21 @@ export default function PropertyDetailPage({ params }: { params: { slug: string[
                 </Link>
               ))}
             </div>
-            {prop.deals.length > itemsPerPage && (
+            {dealCount > itemsPerPage && (
               <div className="mt-6 flex justify-center items-center space-x-4">
                 <button
-                  onClick={() => setDealsPage(p => Math.max(1, p - 1))}
+                  onClick={() => setDealsPage(Math.max(1, dealsPage - 1))}
                   disabled={dealsPage === 1}
                   className="p-2 bg-white border rounded-md disabled:opacity-50 disabled:cursor-not-allowed hover:bg-gray-50"
                 >
                   <FaChevronLeft />
                 </button>
                 <span className="text-gray-700">
-                  Page {dealsPage} of {Math.ceil(prop.deals.length / itemsPerPage)}
+                  Page {dealsPage} of {dealPages}
                 </span>
                 <button
-                  onClick={() => setDealsPage(p => Math.min(Math.ceil(prop.deals.length / itemsPerPage), p + 1))}
-                  disabled={dealsPage === Math.ceil(prop.deals.length / itemsPerPage)}
+                  onClick={() => goToDealsPage(Math.min(dealPages, dealsPage + 1))}
+                  disabled={dealsPage >= dealPages}
                   className="p-2 bg-white border rounded-md disabled:opacity-50 disabled:cursor-not-allowed hover:bg-gray-50"
                 >
                   <FaChevronRight />
@@ -245,21 +303,21 @@ export default function PropertyDetailPage({ params }: { params: { slug: string[
                 </Link>
               ))}
             </div>
-            {people.length > itemsPerPage && (
+            {(people.length > itemsPerPage || participantsCursor) && (
               <div className="mt-6 flex justify-center items-center space-x-4">
                 <button
-                  onClick={() => setPeoplePage(p => Math.max(1, p - 1))}
+                  onClick={() => setPeoplePage(Math.max(1, peoplePage - 1))}
                   disabled={peoplePage === 1}
                   className="p-2 bg-white border rounded-md disabled:opacity-50 disabled:cursor-not-allowed hover:bg-gray-50"
                 >
                   <FaChevronLeft />
                 </button>
                 <span className="text-gray-700">
-                  Page {peoplePage} of {Math.ceil(people.length / itemsPerPage)}
+                  Page {peoplePage} of {peoplePages}{participantsCursor ? '+' : ''}
                 </span>
                 <button
-                  onClick={() => setPeoplePage(p => Math.min(Math.ceil(people.length / itemsPerPage), p + 1))}
-                  disabled={peoplePage === Math.ceil(people.length / itemsPerPage)}
+                  onClick={() => goToParticipantsPage('Person', peoplePage + 1, setPeoplePage)}
+                  disabled={peoplePage >= peoplePages && !participantsCursor}
                   className="p-2 bg-white border rounded-md disabled:opacity-50 disabled:cursor-not-allowed hover:bg-gray-50"
                 >
                   <FaChevronRight />
@@ -298,21 +356,21 @@ export default function PropertyDetailPage({ params }: { params: { slug: string[
                 </Link>
               ))}
             </div>
-            {organizations.length > itemsPerPage && (
+            {(organizations.length > itemsPerPage || participantsCursor) && (
               <div className="mt-6 flex justify-center items-center space-x-4">
                 <button
-                  onClick={() => setOrgsPage(p => Math.max(1, p - 1))}
+                  onClick={() => setOrgsPage(Math.max(1, orgsPage - 1))}
                   disabled={orgsPage === 1}
                   className="p-2 bg-white border rounded-md disabled:opacity-50 disabled:cursor-not-allowed hover:bg-gray-50"
                 >
                   <FaChevronLeft />
                 </button>
                 <span className="text-gray-700">
-                  Page {orgsPage} of {Math.ceil(organizations.length / itemsPerPage)}
+                  Page {orgsPage} of {orgPages}{participantsCursor ? '+' : ''}
                 </span>
                 <button
-                  onClick={() => setOrgsPage(p => Math.min(Math.ceil(organizations.length / itemsPerPage), p + 1))}
-                  disabled={orgsPage === Math.ceil(organizations.length / itemsPerPage)}
+                  onClick={() => goToParticipantsPage('Organization', orgsPage + 1, setOrgsPage)}
+                  disabled={orgsPage >= orgPages && !participantsCursor}
                   className="p-2 bg-white border rounded-md disabled:opacity-50 disabled:cursor-not-allowed hover:bg-gray-50"
                 >
                   <FaChevronRight />
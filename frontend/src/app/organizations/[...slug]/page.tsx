@@ -41,8 +41,17 @@ interface OrganizationDetail {
   members: Person[];
   deals: Deal[];
   stories: Story[];
+  member_count: number;
+  deal_count: number;
+  story_count: number;
+  story_count_capped?: boolean;
+  members_next_cursor?: string | null;
+  deals_next_cursor?: string | null;
+  stories_next_cursor?: string | null;
 }
 
+type Collection = 'members' | 'deals' | 'stories';
+
 export default function OrganizationDetailPage({ params }: { params: { slug: string[] } }) {
   const [organization, setOrganization] = useState<OrganizationDetail | null>(null);
   const [loading, setLoading] = useState(true);
@@ -50,18 +59,54 @@ export default function OrganizationDetailPage({ params }: { params: { slug: str
   const [dealsPage, setDealsPage] = useState(1);
   const [membersPage, setMembersPage] = useState(1);
   const [storiesPage, setStoriesPage] = useState(1);
+  const [members, setMembers] = useState<Person[]>([]);
+  const [deals, setDeals] = useState<Deal[]>([]);
+  const [stories, setStories] = useState<Story[]>([]);
+  const [cursors, setCursors] = useState<Record<Collection, string | null>>({ members: null, deals: null, stories: null });
   const itemsPerPage = 8;
 
   const organizationPath = params.slug.join('/');
 
+  // The detail payload carries the first page of each sub-collection; later pages
+  // are fetched from /api/organizations/{url}/{collection} by following next_cursor
+  const goToPage = async (collection: Collection, page: number) => {
+    const setters = { members: setMembers, deals: setDeals, stories: setStories };
+    const loaded = { members, deals, stories }[collection] as any[];
+    let items = loaded;
+    let cursor = cursors[collection];
+    try {
+      while (items.length < page * itemsPerPage && cursor) {
+        const response = await axios.get(`${API_BASE}/api/organizations/${organizationPath}/${collection}`, {
+          params: { cursor }
+        });
+        items = [...items, ...response.data.data];
+        cursor = response.data.next_cursor;
+      }
+    } catch (err) {
+      console.error(err);
+    }
+    if (items !== loaded) {
+      (setters[collection] as (value: any[]) => void)(items);
+      setCursors(c => ({ ...c, [collection]: cursor }));
+    }
+    ({ members: setMembersPage, deals: setDealsPage, stories: setStoriesPage })[collection](page);
+  };
+
   useEffect(() => {
     const fetchOrganization = async () => {
       try {
         setLoading(true);
         const response = await axios.get(`${API_BASE}/api/organizations/${organizationPath}`);
-        console.log('Organization data:', response.data.data);
-        console.log('Members:', response.data.data.members);
-        setOrganization(response.data.data);
+        const data: OrganizationDetail = response.data.data;
+        setOrganization(data);
+        setMembers(data.members || []);
+        setDeals(data.deals || []);
+        setStories(data.stories || []);
+        setCursors({
+          members: data.members_next_cursor || null,
+          deals: data.deals_next_cursor || null,
+          stories: data.stories_next_cursor || null
+        });
         // Reset pagination when new organization is loaded
         setMembersPage(1);
         setDealsPage(1);
@@ -85,25 +130,16 @@ export default function OrganizationDetailPage({ params }: { params: { slug: str
     return <div className="min-h-screen flex items-center justify-center"><div className="text-xl text-red-600">{error || 'Organization not found'}</div></div>;
   }
 
-  const members = organization.members || [];
-  const deals = organization.deals || [];
-  const stories = organization.stories || [];
+  const memberCount = organization.member_count ?? members.length;
+  const dealCount = organization.deal_count ?? deals.length;
+  const storyCount = organization.story_count ?? stories.length;
+  const memberPages = Math.ceil(memberCount / itemsPerPage);
+  const dealPages = Math.ceil(dealCount / itemsPerPage);
+  const storyPages = Math.ceil(storyCount / itemsPerPage);
 
   const startIdx = (membersPage - 1) * itemsPerPage;
   const endIdx = membersPage * itemsPerPage;
   const slicedMembers = members.slice(startIdx, endIdx);
-  
-  console.log('=== PAGINATION DEBUG ===');
-  console.log('membersPage:', membersPage);
-  console.log('itemsPerPage:', itemsPerPage);
-  console.log('Total members:', members.length);
-  console.log('Start index:', startIdx);
-  console.log('End index:', endIdx);
-  console.log('Sliced members length:', slicedMembers.length);
-  console.log('Should show pagination?', members.length > itemsPerPage);
-  console.log('First member in slice:', slicedMembers[0]?.name);
-  console.log('Last member in slice:', slicedMembers[slicedMembers.length - 1]?.name);
-  console.log('=======================');
 
   return (
     <div className="min-h-screen bg-gray-50 py-8">
@@ -135,10 +171,9 @@ export default function OrganizationDetailPage({ params }: { params: { slug: str
         {/* Members */}
         {members.length > 0 && (
           <div className="bg-white rounded-lg shadow-lg p-8 mb-8">
-            <h2 className="text-2xl font-bold text-gray-900 mb-6">Members ({members.length})</h2>
+            <h2 className="text-2xl font-bold text-gray-900 mb-6">Members ({memberCount})</h2>
             <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4">
               {slicedMembers.map((member, index) => {
-                console.log(`Rendering member ${index + 1}/${slicedMembers.length}:`, member.name);
                 return (
                   <Link
                     key={`member-${member.id}-${startIdx + index}`}
@@ -169,21 +204,21 @@ export default function OrganizationDetailPage({ params }: { params: { slug: str
                 );
               })}
             </div>
-            {members.length > itemsPerPage && (
+            {memberCount > itemsPerPage && (
               <div className="mt-6 flex justify-center items-center space-x-4">
                 <button
-                  onClick={() => setMembersPage(p => Math.max(1, p - 1))}
+                  onClick={() => setMembersPage(Math.max(1, membersPage - 1))}
                   disabled={membersPage === 1}
                   className="p-2 bg-white border rounded-md disabled:opacity-50 disabled:cursor-not-allowed hover:bg-gray-50"
                 >
                   <FaChevronLeft />
                 </button>
                 <span className="text-gray-700">
-                  Page {membersPage} of {Math.ceil(members.length / itemsPerPage)}
+                  Page {membersPage} of {memberPages}
                 </span>
                 <button
-                  onClick={() => setMembersPage(p => Math.min(Math.ceil(members.length / itemsPerPage), p + 1))}
-                  disabled={membersPage === Math.ceil(members.length / itemsPerPage)}
+                  onClick={() => goToPage('members', Math.min(memberPages, membersPage + 1))}
+                  disabled={membersPage >= memberPages}
                   className="p-2 bg-white border rounded-md disabled:opacity-50 disabled:cursor-not-allowed hover:bg-gray-50"
                 >
                   <FaChevronRight />
@@ -196,7 +231,7 @@ export default function OrganizationDetailPage({ params }: { params: { slug: str
         {/* Deals */}
         {deals.length > 0 && (
           <div className="bg-white rounded-lg shadow-lg p-8 mb-8">
-            <h2 className="text-2xl font-bold text-gray-900 mb-6">Deals ({deals.length})</h2>
+            <h2 className="text-2xl font-bold text-gray-900 mb-6">Deals ({dealCount})</h2>
             <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4">
               {deals
                 .slice((dealsPage - 1) * itemsPerPage, dealsPage * itemsPerPage)
@@ -227,21 +262,21 @@ export default function OrganizationDetailPage({ params }: { params: { slug: str
                   </Link>
                 ))}
             </div>
-            {deals.length > itemsPerPage && (
+            {dealCount > itemsPerPage && (
               <div className="mt-6 flex justify-center items-center space-x-4">
                 <button
-                  onClick={() => setDealsPage(p => Math.max(1, p - 1))}
+                  onClick={() => setDealsPage(Math.max(1, dealsPage - 1))}
                   disabled={dealsPage === 1}
                   className="p-2 bg-white border rounded-md disabled:opacity-50 disabled:cursor-not-allowed hover:bg-gray-50"
                 >
                   <FaChevronLeft />
                 </button>
                 <span className="text-gray-700">
-                  Page {dealsPage} of {Math.ceil(deals.length / itemsPerPage)}
+                  Page {dealsPage} of {dealPages}
                 </span>
                 <button
-                  onClick={() => setDealsPage(p => Math.min(Math.ceil(deals.length / itemsPerPage), p + 1))}
-                  disabled={dealsPage === Math.ceil(deals.length / itemsPerPage)}
+                  onClick={() => goToPage('deals', Math.min(dealPages, dealsPage + 1))}
+                  disabled={dealsPage >= dealPages}
                   className="p-2 bg-white border rounded-md disabled:opacity-50 disabled:cursor-not-allowed hover:bg-gray-50"
                 >
                   <FaChevronRight />
@@ -254,7 +289,7 @@ export default function OrganizationDetailPage({ params }: { params: { slug: str
         {/* Stories */}
         {stories.length > 0 && (
           <div className="bg-white rounded-lg shadow-lg p-8">
-            <h2 className="text-2xl font-bold text-gray-900 mb-6">Stories ({stories.length})</h2>
+            <h2 className="text-2xl font-bold text-gray-900 mb-6">Stories ({storyCount}{organization.story_count_capped ? '+' : ''})</h2>
             <div className="grid grid-cols-1 md:grid-cols-2 gap-4">
               {stories.slice((storiesPage - 1) * itemsPerPage, storiesPage * itemsPerPage).map((story, index) => (
                 <div
@@ -276,21 +311,21 @@ export default function OrganizationDetailPage({ params }: { params: { slug: str
                 </div>
               ))}
             </div>
-            {stories.length > itemsPerPage && (
+            {storyCount > itemsPerPage && (
               <div className="mt-6 flex justify-center items-center space-x-4">
                 <button
-                  onClick={() => setStoriesPage(p => Math.max(1, p - 1))}
+                  onClick={() => setStoriesPage(Math.max(1, storiesPage - 1))}
                   disabled={storiesPage === 1}
                   className="p-2 bg-white border rounded-md disabled:opacity-50 disabled:cursor-not-allowed hover:bg-gray-50"
                 >
                   <FaChevronLeft />
                 </button>
                 <span className="text-gray-700">
-                  Page {storiesPage} of {Math.ceil(stories.length / itemsPerPage)}
+                  Page {storiesPage} of {storyPages}
                 </span>
                 <button
-                  onClick={() => setStoriesPage(p => Math.min(Math.ceil(stories.length / itemsPerPage), p + 1))}
-                  disabled={storiesPage === Math.ceil(stories.length / itemsPerPage)}
+                  onClick={() => goToPage('stories', Math.min(storyPages, storiesPage + 1))}
+                  disabled={storiesPage >= storyPages}
                   className="p-2 bg-white border rounded-md disabled:opacity-50 disabled:cursor-not-allowed hover:bg-gray-50"
                 >
                   <FaChevronRight />
@@ -44,24 +44,45 @@ export default function Home() {
   const [recentPeople, setRecentPeople] = useState<Person[]>([]);
   const [recentOrganizations, setRecentOrganizations] = useState<Organization[]>([]);
   const [recentProperties, setRecentProperties] = useState<Property[]>([]);
+  const [fromSnapshot, setFromSnapshot] = useState(true);
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
+    // Live queries, for when data_tools has not written a dashboard snapshot yet
+    async function fetchLive() {
+      const [dealsRes, peopleRes, orgsRes, propertiesRes] = await Promise.all([
+        axios.get(`${API_BASE}/api/deals/recent?limit=20`),
+        axios.get(`${API_BASE}/api/people/recent?limit=20`),
+        axios.get(`${API_BASE}/api/organizations/recent?limit=20`),
+        axios.get(`${API_BASE}/api/properties/recent?limit=20`),
+      ]);
+
+      setRecentDeals(dealsRes.data.data);
+      setRecentPeople(peopleRes.data.data);
+      setRecentOrganizations(orgsRes.data.data);
+      setRecentProperties(propertiesRes.data.data);
+      setFromSnapshot(false);
+    }
+
     async function fetchData() {
       try {
-        const [dealsRes, peopleRes, orgsRes, propertiesRes] = await Promise.all([
-          axios.get(`${API_BASE}/api/deals/recent?limit=20`),
-          axios.get(`${API_BASE}/api/people/recent?limit=20`),
-          axios.get(`${API_BASE}/api/organizations/recent?limit=20`),
-          axios.get(`${API_BASE}/api/properties/recent?limit=20`),
-        ]);
+        const summaryRes = await axios.get(`${API_BASE}/api/dashboard/summary`);
+        const summary = summaryRes.data.data;
 
-        setRecentDeals(dealsRes.data.data);
-        setRecentPeople(peopleRes.data.data);
-        setRecentOrganizations(orgsRes.data.data);
-        setRecentProperties(propertiesRes.data.data);
+        setRecentDeals(summary.recent_deals);
+        setRecentPeople(summary.top_brokers);
+        setRecentOrganizations(summary.top_organizations);
+        setRecentProperties(summary.recent_properties);
       } catch (error) {
-        console.error('Error fetching data:', error);
+        if (axios.isAxiosError(error) && error.response?.status === 404) {
+          try {
+            await fetchLive();
+          } catch (liveError) {
+            console.error('Error fetching data:', liveError);
+          }
+        } else {
+          console.error('Error fetching data:', error);
+        }
       } finally {
         setLoading(false);
       }
@@ -129,12 +150,12 @@ export default function Home() {
           </div>
         </section>
 
-        {/* People with Recent Deals Section */}
+        {/* Top Brokers Section (people with recent deals without a snapshot) */}
         <section className="mb-12">
           <div className="flex items-center justify-between mb-4">
             <h2 className="text-2xl font-semibold text-gray-900 flex items-center">
               <FaUsers className="mr-3 text-blue-600" />
-              People with Recent Deals
+              {fromSnapshot ? 'Top Brokers' : 'People with Recent Deals'}
             </h2>
             <Link
               href="/people"
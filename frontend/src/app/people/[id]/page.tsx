@@ -2,11 +2,14 @@
 
 import { useState, useEffect, useRef } from 'react';
 import Link from 'next/link';
+import axios from 'axios';
 import { getPersonDetail } from '@/lib/api';
 import { FiArrowLeft } from 'react-icons/fi';
 import { FaChevronLeft, FaChevronRight, FaRobot, FaTimes } from 'react-icons/fa';
 import Script from 'next/script';
 
+const API_BASE = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
+
 interface Deal {
   id: number;
   property: string;
@@ -42,6 +45,8 @@ interface PersonDetail {
   image?: string;
   bio?: string;
   deals: Deal[];
+  deal_count: number;
+  deals_next_cursor?: string | null;
   organizations: Organization[];
   stories: Story[];
 }
@@ -55,6 +60,8 @@ export default function PersonDetailPage({ params }: { params: { id: string } })
   const [orgsPage, setOrgsPage] = useState(1);
   const [storiesPage, setStoriesPage] = useState(1);
   const [showSummary, setShowSummary] = useState(false);
+  const [deals, setDeals] = useState<Deal[]>([]);
+  const [dealsCursor, setDealsCursor] = useState<string | null>(null);
   const itemsPerPage = 8;
 
   const mapRef = useRef<HTMLDivElement>(null);
@@ -66,6 +73,9 @@ export default function PersonDetailPage({ params }: { params: { id: string } })
         setLoading(true);
         const response = await getPersonDetail(params.id);
         setPerson(response.data);
+        setDeals(response.data.deals || []);
+        setDealsCursor(response.data.deals_next_cursor || null);
+        setDealsPage(1);
       } catch (err) {
         setError('Failed to load person details');
         console.error(err);
@@ -77,6 +87,27 @@ export default function PersonDetailPage({ params }: { params: { id: string } })
     fetchPerson();
   }, [params.id]);
 
+  // The detail payload carries the first page of deals; later pages are
+  // fetched from /api/people/{id}/deals by following next_cursor
+  const goToDealsPage = async (page: number) => {
+    let loaded = deals;
+    let cursor = dealsCursor;
+    try {
+      while (loaded.length < page * itemsPerPage && cursor) {
+        const response = await axios.get(`${API_BASE}/api/people/${params.id}/deals`, { params: { cursor } });
+        loaded = [...loaded, ...response.data.data];
+        cursor = response.data.next_cursor;
+      }
+    } catch (err) {
+      console.error(err);
+    }
+    if (loaded !== deals) {
+      setDeals(loaded);
+      setDealsCursor(cursor);
+    }
+    setDealsPage(page);
+  };
+
   // Cleanup map on person change
   useEffect(() => {
     if (mapInstanceRef.current) {
@@ -291,7 +322,8 @@ export default function PersonDetailPage({ params }: { params: { id: string } })
     return <div className="min-h-screen flex items-center justify-center"><div className="text-xl text-red-600">{error || 'Person not found'}</div></div>;
   }
 
-  const deals = person.deals || [];
+  const dealCount = person.deal_count ?? deals.length;
+  const dealPages = Math.ceil(dealCount / itemsPerPage);
   const organizations = person.organizations || [];
   const stories = person.stories || [];
 
@@ -421,7 +453,7 @@ export default function PersonDetailPage({ params }: { params: { id: string } })
                   </h4>
                   <div className="grid grid-cols-2 gap-4">
                     <div className="bg-blue-50 rounded-lg p-4">
-                      <p className="text-2xl font-bold text-blue-600">{deals.length}</p>
+                      <p className="text-2xl font-bold text-blue-600">{dealCount}</p>
                       <p className="text-sm text-gray-600">Total Deals</p>
                     </div>
                     <div className="bg-purple-50 rounded-lg p-4">
@@ -486,21 +518,21 @@ export default function PersonDetailPage({ params }: { params: { id: string } })
                 </Link>
               ))}
             </div>
-            {deals.length > itemsPerPage && (
+            {dealCount > itemsPerPage && (
               <div className="mt-6 flex justify-center items-center space-x-4">
                 <button
-                  onClick={() => setDealsPage(p => Math.max(1, p - 1))}
+                  onClick={() => setDealsPage(Math.max(1, dealsPage - 1))}
                   disabled={dealsPage === 1}
                   className="p-2 bg-white border rounded-md disabled:opacity-50 disabled:cursor-not-allowed hover:bg-gray-50"
                 >
                   <FaChevronLeft />
                 </button>
                 <span className="text-gray-700">
-                  Page {dealsPage} of {Math.ceil(deals.length / itemsPerPage)}
+                  Page {dealsPage} of {dealPages}
                 </span>
                 <button
-                  onClick={() => setDealsPage(p => Math.min(Math.ceil(deals.length / itemsPerPage), p + 1))}
-                  disabled={dealsPage === Math.ceil(deals.length / itemsPerPage)}
+                  onClick={() => goToDealsPage(Math.min(dealPages, dealsPage + 1))}
+                  disabled={dealsPage >= dealPages}
                   className="p-2 bg-white border rounded-md disabled:opacity-50 disabled:cursor-not-allowed hover:bg-gray-50"
                 >
                   <FaChevronRight />